@@ -0,0 +1,91 @@
+# input:  [Alembic migration context and SQLAlchemy schema inspection helpers]
+# output: [Schema migration that switches Program/Semester/Course context foreign keys to ON DELETE CASCADE]
+# pos:    [Backend schema migration that lets Program and Semester deletes run as single SQL statements while the database removes dependent rows]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+"""cascade context foreign keys
+
+Revision ID: 20261015_0010
+Revises: 20260321_0009
+Create Date: 2026-10-15 00:00:10.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_0010"
+down_revision = "20260321_0009"
+branch_labels = None
+depends_on = None
+
+# SQLite reflects inline foreign keys without names, so batch mode needs a convention to address them.
+NAMING_CONVENTION = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+CONTEXT_FOREIGN_KEYS = {
+    "semesters": (("program_id", "programs"),),
+    "courses": (("program_id", "programs"), ("semester_id", "semesters")),
+    "widgets": (("semester_id", "semesters"), ("course_id", "courses")),
+    "tabs": (("semester_id", "semesters"), ("course_id", "courses")),
+    "plugin_settings": (("semester_id", "semesters"), ("course_id", "courses")),
+}
+
+
+def _has_table(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _find_foreign_key(inspector: sa.Inspector, table_name: str, column_name: str, referred_table: str) -> dict | None:
+    for foreign_key in inspector.get_foreign_keys(table_name):
+        if foreign_key["constrained_columns"] == [column_name] and foreign_key["referred_table"] == referred_table:
+            return foreign_key
+    return None
+
+
+def _rewrite_foreign_keys(ondelete: str | None) -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table_name, foreign_keys in CONTEXT_FOREIGN_KEYS.items():
+        if not _has_table(inspector, table_name):
+            continue
+
+        pending: list[tuple[str, str, str]] = []
+        for column_name, referred_table in foreign_keys:
+            existing = _find_foreign_key(inspector, table_name, column_name, referred_table)
+            current_ondelete = ((existing or {}).get("options") or {}).get("ondelete")
+            if existing is not None and (current_ondelete or "").upper() == (ondelete or "").upper():
+                continue
+            conventional_name = f"fk_{table_name}_{column_name}_{referred_table}"
+            existing_name = (existing or {}).get("name") or (conventional_name if existing is not None else "")
+            pending.append((column_name, referred_table, existing_name))
+
+        if not pending:
+            continue
+
+        with op.batch_alter_table(table_name, schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+            for column_name, referred_table, existing_name in pending:
+                if existing_name:
+                    batch_op.drop_constraint(existing_name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    f"fk_{table_name}_{column_name}_{referred_table}",
+                    referred_table,
+                    [column_name],
+                    ["id"],
+                    ondelete=ondelete,
+                )
+
+
+def upgrade() -> None:
+    _rewrite_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    _rewrite_foreign_keys(None)
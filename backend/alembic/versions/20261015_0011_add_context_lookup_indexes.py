@@ -0,0 +1,62 @@
+# input:  [Alembic migration context and SQLAlchemy schema inspection helpers]
+# output: [Schema migration that adds owner/context lookup indexes for programs, semesters, courses, widgets, and tabs]
+# pos:    [Backend schema migration that indexes Program ownership, Semester/Course parents, widget contexts, and per-context tab ordering]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+"""add context lookup indexes
+
+Revision ID: 20261015_0011
+Revises: 20261015_0010
+Create Date: 2026-10-15 00:00:11.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_0011"
+down_revision = "20261015_0010"
+branch_labels = None
+depends_on = None
+
+CONTEXT_INDEXES = (
+    ("programs", "ix_programs_owner", ["owner_id"]),
+    ("semesters", "ix_semesters_program", ["program_id"]),
+    ("courses", "ix_courses_program", ["program_id"]),
+    ("courses", "ix_courses_semester", ["semester_id"]),
+    ("widgets", "ix_widgets_semester", ["semester_id"]),
+    ("widgets", "ix_widgets_course", ["course_id"]),
+    ("tabs", "ix_tabs_semester_order", ["semester_id", "order_index"]),
+    ("tabs", "ix_tabs_course_order", ["course_id", "order_index"]),
+)
+
+
+def _has_table(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    return index_name in {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table_name, index_name, columns in CONTEXT_INDEXES:
+        if _has_table(inspector, table_name) and not _has_index(inspector, table_name, index_name):
+            op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table_name, index_name, _columns in reversed(CONTEXT_INDEXES):
+        if _has_table(inspector, table_name) and _has_index(inspector, table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,58 @@
+# input:  [Alembic migration context and SQLAlchemy schema inspection helpers]
+# output: [Schema migration that widens the course semester index to (semester_id, include_in_gpa)]
+# pos:    [Backend schema migration that lets semester GPA aggregates filter counted courses from the index]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+"""course semester gpa index
+
+Revision ID: 20261015_0012
+Revises: 20261015_0011
+Create Date: 2026-10-15 00:00:12.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_0012"
+down_revision = "20261015_0011"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    return index_name in {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "courses"):
+        return
+    if not _has_index(inspector, "courses", "ix_courses_semester_include"):
+        op.create_index("ix_courses_semester_include", "courses", ["semester_id", "include_in_gpa"], unique=False)
+    # The composite index's leading column serves plain semester_id lookups.
+    if _has_index(inspector, "courses", "ix_courses_semester"):
+        op.drop_index("ix_courses_semester", table_name="courses")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "courses"):
+        return
+    if not _has_index(inspector, "courses", "ix_courses_semester"):
+        op.create_index("ix_courses_semester", "courses", ["semester_id"], unique=False)
+    if _has_index(inspector, "courses", "ix_courses_semester_include"):
+        op.drop_index("ix_courses_semester_include", table_name="courses")
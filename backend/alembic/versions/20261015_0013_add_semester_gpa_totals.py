@@ -0,0 +1,96 @@
+# input:  [Alembic migration context, SQLAlchemy schema inspection helpers, and existing semesters/courses tables]
+# output: [Schema migration that adds and backfills denormalized credit-weighted GPA totals on semesters]
+# pos:    [Backend schema migration that lets Program CGPA be summed from Semester rows instead of every Course]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+"""add semester gpa totals
+
+Revision ID: 20261015_0013
+Revises: 20261015_0012
+Create Date: 2026-10-15 00:00:13.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_0013"
+down_revision = "20261015_0012"
+branch_labels = None
+depends_on = None
+
+TOTAL_COLUMNS = ("total_credits", "weighted_gpa_sum", "weighted_percentage_sum")
+
+semesters_table = sa.table("semesters", sa.column("id", sa.String()), *(sa.column(name, sa.Float()) for name in TOTAL_COLUMNS))
+courses_table = sa.table(
+    "courses",
+    sa.column("semester_id", sa.String()),
+    sa.column("credits", sa.Float()),
+    sa.column("grade_scaled", sa.Float()),
+    sa.column("grade_percentage", sa.Float()),
+    sa.column("include_in_gpa", sa.Boolean()),
+)
+
+
+def _course_total(expression: sa.ColumnElement) -> sa.ColumnElement:
+    # Built with Core so include_in_gpa compares as a boolean on every dialect, not as `= 1`.
+    return sa.func.coalesce(
+        sa.select(sa.func.sum(expression))
+        .where(
+            courses_table.c.semester_id == semesters_table.c.id,
+            courses_table.c.include_in_gpa.is_(sa.true()),
+        )
+        .scalar_subquery(),
+        0.0,
+    )
+
+
+def _has_table(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _has_column(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "semesters"):
+        return
+
+    missing = [column_name for column_name in TOTAL_COLUMNS if not _has_column(inspector, "semesters", column_name)]
+    if missing:
+        with op.batch_alter_table("semesters") as batch_op:
+            for column_name in missing:
+                batch_op.add_column(sa.Column(column_name, sa.Float(), nullable=False, server_default="0"))
+
+    if _has_table(inspector, "courses"):
+        credits = courses_table.c.credits
+        op.execute(
+            semesters_table.update().values(
+                total_credits=_course_total(credits),
+                weighted_gpa_sum=_course_total(courses_table.c.grade_scaled * credits),
+                weighted_percentage_sum=_course_total(courses_table.c.grade_percentage * credits),
+            )
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "semesters"):
+        return
+
+    present = [column_name for column_name in TOTAL_COLUMNS if _has_column(inspector, "semesters", column_name)]
+    if present:
+        with op.batch_alter_table("semesters") as batch_op:
+            for column_name in reversed(present):
+                batch_op.drop_column(column_name)
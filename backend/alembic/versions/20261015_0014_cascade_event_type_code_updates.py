@@ -0,0 +1,75 @@
+# input:  [Alembic migration context and SQLAlchemy schema inspection helpers]
+# output: [Schema migration that adds ON UPDATE CASCADE to the course section/event foreign keys on event-type codes]
+# pos:    [Backend schema migration that lets an event-type code rename run as one UPDATE while the database rewrites dependent section and event codes]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+"""cascade event type code updates
+
+Revision ID: 20261015_0014
+Revises: 20261015_0013
+Create Date: 2026-10-15 00:00:14.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_0014"
+down_revision = "20261015_0013"
+branch_labels = None
+depends_on = None
+
+EVENT_TYPE_COLUMNS = ["course_id", "event_type_code"]
+EVENT_TYPE_FOREIGN_KEYS = {
+    "course_sections": "fk_course_sections_event_type",
+    "course_events": "fk_course_events_event_type",
+}
+
+
+def _find_event_type_foreign_key(inspector: sa.Inspector, table_name: str) -> dict | None:
+    for foreign_key in inspector.get_foreign_keys(table_name):
+        if (
+            foreign_key["constrained_columns"] == EVENT_TYPE_COLUMNS
+            and foreign_key["referred_table"] == "course_event_types"
+        ):
+            return foreign_key
+    return None
+
+
+def _rewrite_foreign_keys(onupdate: str | None) -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    for table_name, constraint_name in EVENT_TYPE_FOREIGN_KEYS.items():
+        if table_name not in table_names:
+            continue
+        existing = _find_event_type_foreign_key(inspector, table_name)
+        current_onupdate = ((existing or {}).get("options") or {}).get("onupdate")
+        if existing is not None and (current_onupdate or "").upper() == (onupdate or "").upper():
+            continue
+
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            if existing is not None:
+                batch_op.drop_constraint(existing.get("name") or constraint_name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                constraint_name,
+                "course_event_types",
+                EVENT_TYPE_COLUMNS,
+                ["course_id", "code"],
+                ondelete="CASCADE",
+                onupdate=onupdate,
+            )
+
+
+def upgrade() -> None:
+    _rewrite_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    _rewrite_foreign_keys(None)
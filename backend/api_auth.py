@@ -1,5 +1,5 @@
-# input:  [FastAPI router/dependencies, backend auth/crud/models/schemas/LMS services, Google token verification, backup-transfer service, and shared API helpers]
-# output: [Auth, current-user, LMS integration, and backup import/export route handlers plus exported backup wrapper functions]
+# input:  [FastAPI router/dependencies, backend auth/crud/models/schemas/LMS services, Google token verification with cached signing certificates, backup-transfer service, and shared API helpers]
+# output: [Auth, current-user, LMS integration, and backup import/export route handlers (export streamed as chunked JSON) plus exported backup wrapper functions]
 # pos:    [backend API router for identity/session flows and account-scoped integration or backup endpoints]
 #
 # ⚠️ When this file is updated:
@@ -9,14 +9,19 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import json
 import os
 from pathlib import Path
+import re
+import threading
+import time
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from google.auth import jwt as google_jwt
 from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token as google_id_token
 from sqlalchemy.orm import Session
 
 from api_common import (
@@ -27,7 +32,6 @@ from api_common import (
     touch_model_timestamp,
     validate_day_of_week,
     validate_reading_week_or_422,
-    validate_section_id,
     validate_time_range,
     validate_week_range,
 )
@@ -43,33 +47,72 @@ import schemas
 router = APIRouter()
 BASE_DIR = Path(__file__).parent
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_CERTS_DEFAULT_TTL_SECONDS = 3600
+GOOGLE_CERTS_MIN_REFRESH_SECONDS = 60
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+_google_certs: dict[str, str] = {}
+_google_certs_expires_at = 0.0
+_google_certs_fetched_at = float("-inf")
+_google_certs_lock = threading.Lock()
+
+
+def _fetch_google_certs() -> dict[str, str]:
+    global _google_certs, _google_certs_expires_at, _google_certs_fetched_at
+    response = google_requests.Request()(GOOGLE_CERTS_URL, method="GET")
+    if response.status != 200:
+        raise HTTPException(status_code=503, detail="Google signing keys are unavailable")
+    max_age = _MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+    ttl = int(max_age.group(1)) if max_age else GOOGLE_CERTS_DEFAULT_TTL_SECONDS
+    _google_certs = json.loads(response.data.decode("utf-8"))
+    _google_certs_fetched_at = time.monotonic()
+    _google_certs_expires_at = _google_certs_fetched_at + ttl
+    return _google_certs
+
+
+def _get_google_certs(key_id: Optional[str]) -> dict[str, str]:
+    # Google rotates its signing keys every few hours, so verification normally
+    # runs against the cached certificates. An unknown key id triggers a refetch,
+    # rate-limited so forged key ids cannot turn every login into a network call.
+    with _google_certs_lock:
+        now = time.monotonic()
+        if now >= _google_certs_expires_at:
+            return _fetch_google_certs()
+        if key_id not in _google_certs and now - _google_certs_fetched_at >= GOOGLE_CERTS_MIN_REFRESH_SECONDS:
+            return _fetch_google_certs()
+        return _google_certs
 
 
 def verify_google_id_token(id_token: str) -> dict:
     if not GOOGLE_CLIENT_ID:
         raise HTTPException(status_code=500, detail="Google client ID is not configured")
     try:
-        return google_id_token.verify_oauth2_token(id_token, google_requests.Request(), GOOGLE_CLIENT_ID)
+        key_id = google_jwt.decode_header(id_token).get("kid")
+        claims = google_jwt.decode(id_token, certs=_get_google_certs(key_id), audience=GOOGLE_CLIENT_ID)
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError("Wrong issuer")
+        return claims
     except ValueError as exc:
         raise HTTPException(status_code=401, detail="Invalid Google token") from exc
 
 
 @router.post("/auth/register", response_model=schemas.User)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = crud.get_user_by_email(db, email=user.email)
+    db_user = crud.get_user_auth_row(db, email=user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     return crud.create_user(db=db, user=user)
 
 
 @router.post("/auth/token", response_model=schemas.Token)
-async def login_for_access_token(
+def login_for_access_token(
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
     remember_me: bool = Form(False),
     db: Session = Depends(get_db),
 ):
-    user = crud.get_user_by_email(db, email=form_data.username)
+    user = crud.get_user_auth_row(db, email=form_data.username)
     if not user or not crud.verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,6 +153,7 @@ def login_with_google(
             user.google_sub = sub
             db.add(user)
             db.commit()
+            crud.forget_cached_user(db, user.id, email)
             db.refresh(user)
         else:
             user = crud.create_user_from_google(db, email=email, google_sub=sub)
@@ -156,6 +200,7 @@ def link_google_account(
     current_user.google_sub = sub
     db.add(current_user)
     db.commit()
+    crud.forget_cached_user(db, current_user.id)
     db.refresh(current_user)
     return {"ok": True}
 
@@ -166,7 +211,7 @@ async def read_users_me(current_user: models.User = Depends(auth.get_current_use
 
 
 @router.put("/users/me", response_model=schemas.User)
-async def update_user_me(
+def update_user_me(
     user_update: schemas.UserUpdate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
@@ -175,7 +220,7 @@ async def update_user_me(
 
 
 @router.get("/users/me/lms-integrations", response_model=list[schemas.LmsIntegrationResponse])
-async def list_user_lms_integrations(
+def list_user_lms_integrations(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
@@ -183,7 +228,7 @@ async def list_user_lms_integrations(
 
 
 @router.post("/users/me/lms-integrations", response_model=schemas.LmsIntegrationResponse)
-async def create_user_lms_integration(
+def create_user_lms_integration(
     payload: schemas.LmsIntegrationCreateRequest,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
@@ -195,7 +240,7 @@ async def create_user_lms_integration(
 
 
 @router.post("/users/me/lms-integrations/validate", response_model=schemas.LmsIntegrationValidationResponse)
-async def validate_user_lms_integration_draft(payload: schemas.LmsIntegrationValidationRequest):
+def validate_user_lms_integration_draft(payload: schemas.LmsIntegrationValidationRequest):
     try:
         return lms_service.validate_integration_draft(payload)
     except Exception as exc:
@@ -203,7 +248,7 @@ async def validate_user_lms_integration_draft(payload: schemas.LmsIntegrationVal
 
 
 @router.get("/users/me/lms-integrations/{integration_id}", response_model=schemas.LmsIntegrationResponse)
-async def get_user_lms_integration(
+def get_user_lms_integration(
     integration_id: str,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
@@ -215,7 +260,7 @@ async def get_user_lms_integration(
 
 
 @router.patch("/users/me/lms-integrations/{integration_id}", response_model=schemas.LmsIntegrationResponse)
-async def update_user_lms_integration(
+def update_user_lms_integration(
     integration_id: str,
     payload: schemas.LmsIntegrationUpdateRequest,
     db: Session = Depends(get_db),
@@ -228,7 +273,7 @@ async def update_user_lms_integration(
 
 
 @router.post("/users/me/lms-integrations/{integration_id}/validate", response_model=schemas.LmsIntegrationValidationResponse)
-async def validate_user_lms_integration(
+def validate_user_lms_integration(
     integration_id: str,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
@@ -240,7 +285,7 @@ async def validate_user_lms_integration(
 
 
 @router.get("/users/me/lms-integrations/{integration_id}/courses", response_model=schemas.LmsCourseListResponse)
-async def list_user_lms_courses(
+def list_user_lms_courses(
     integration_id: str,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=100),
@@ -264,7 +309,7 @@ async def list_user_lms_courses(
 
 
 @router.delete("/users/me/lms-integrations/{integration_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user_lms_integration(
+def delete_user_lms_integration(
     integration_id: str,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
@@ -284,28 +329,34 @@ def _build_backup_runtime_callbacks() -> backup_transfer.BackupRuntimeCallbacks:
         validate_day_of_week=validate_day_of_week,
         validate_time_range=validate_time_range,
         validate_week_range=validate_week_range,
-        validate_section_id=validate_section_id,
         normalize_week_pattern_input=normalize_week_pattern_input,
         validate_section_payload=validate_section_payload,
         validate_reading_week_or_422=validate_reading_week_or_422,
     )
 
 
-@router.get("/users/me/export", response_model=schemas.UserDataExport)
-async def export_user_data(
+@router.get(
+    "/users/me/export",
+    response_class=StreamingResponse,
+    responses={200: {"model": schemas.UserDataExport}},
+)
+def export_user_data(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    return backup_transfer.export_user_data(
-        db,
-        current_user,
-        base_dir=BASE_DIR,
-        error_detail=error_detail,
+    return StreamingResponse(
+        backup_transfer.stream_user_data_export(
+            db,
+            current_user,
+            base_dir=BASE_DIR,
+            error_detail=error_detail,
+        ),
+        media_type="application/json",
     )
 
 
 @router.post("/users/me/import")
-async def import_user_data(
+def import_user_data(
     data: schemas.UserDataImport,
     conflict_mode: str = "skip",
     include_settings: bool = True,
@@ -1,5 +1,5 @@
 # input:  [FastAPI exceptions/uploads, SQLAlchemy session access, backend models/schemas/crud/resource/todo/gradebook/lms services, and timezone/date helpers]
-# output: [Shared API-layer validation helpers, ownership checks, error translators, timestamp helpers, and small route-support utilities]
+# output: [Shared API-layer validation helpers (strict HH:mm on writes, strptime-compatible times for stored rows), ownership checks backed by a per-engine TTL ownership cache, error translators, timestamp helpers, and small route-support utilities]
 # pos:    [backend API support module reused by route files so the FastAPI entrypoint stays thin and domain checks remain centralized]
 #
 # ⚠️ When this file is updated:
@@ -8,9 +8,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import UTC, date, datetime
+from functools import lru_cache
 from typing import Any, Optional
 import math
+import threading
+import time
+import weakref
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
@@ -24,7 +29,11 @@ import models
 import schemas
 import todo
 
-TIME_FORMAT = "%H:%M"
+OWNERSHIP_CACHE_SIZE = 10_000
+OWNERSHIP_CACHE_TTL_SECONDS = 30
+# One cache per engine so separate databases (e.g. per-test in-memory engines) never share entries.
+_ownership_caches: "weakref.WeakKeyDictionary[object, OrderedDict[tuple[str, str, str], float]]" = weakref.WeakKeyDictionary()
+_ownership_cache_lock = threading.Lock()
 BUILTIN_EVENT_TYPE_CODES = {"LECTURE", "TUTORIAL", "PRACTICAL"}
 BUILTIN_EVENT_TYPE_ABBREVIATIONS = {
     "LECTURE": "LEC",
@@ -65,15 +74,35 @@ def raise_lms_http_error(exc: Exception) -> None:
     raise exc
 
 
-def validate_time_range(start_time: str, end_time: str):
-    try:
-        datetime.strptime(start_time, TIME_FORMAT)
-        datetime.strptime(end_time, TIME_FORMAT)
-    except ValueError as exc:
+def _is_hhmm(value: str) -> bool:
+    if len(value) != 5 or not value.isascii() or value[2] != ":" or not value[:2].isdigit() or not value[3:].isdigit():
+        return False
+    return int(value[:2]) < 24 and int(value[3:]) < 60
+
+
+def _is_legacy_hhmm(value: str) -> bool:
+    # Mirrors strptime("%H:%M"), which earlier versions validated with, so unpadded "9:5" passes.
+    hour, separator, minute = value.partition(":")
+    if not separator or not (0 < len(hour) <= 2 and 0 < len(minute) <= 2):
+        return False
+    if not (hour.isdecimal() and minute.isdecimal()):
+        return False
+    return int(hour) < 24 and int(minute) < 60
+
+
+def validate_time_format(*values: str, allow_unpadded: bool = False):
+    # New times are stored and compared as zero-padded strings, so writes only accept strict HH:mm.
+    # Already-stored rows (schedule reads, backup restores) pass allow_unpadded to keep legacy values.
+    is_valid_time = _is_legacy_hhmm if allow_unpadded else _is_hhmm
+    if not all(is_valid_time(value) for value in values):
         raise HTTPException(
             status_code=422,
             detail=error_detail("INVALID_TIME_FORMAT", "Time must use HH:mm format."),
-        ) from exc
+        )
+
+
+def validate_time_range(start_time: str, end_time: str, *, allow_unpadded: bool = False):
+    validate_time_format(start_time, end_time, allow_unpadded=allow_unpadded)
 
     if start_time >= end_time:
         raise HTTPException(
@@ -135,27 +164,90 @@ def normalize_week_pattern_input(value: Any) -> str:
     return normalize_week_pattern(str(value))
 
 
-def get_owned_course(db: Session, current_user: models.User, course_id: str) -> models.Course:
+def _ownership_cache_key(model: type, user_id: str, object_id: str) -> tuple[str, str, str]:
+    return (model.__tablename__, user_id, object_id)
+
+
+def _get_cached_owned(db: Session, model: type, user_id: str, object_id: str, load_options: tuple = ()):
+    # Programs never change owner and courses/semesters never change program, so a cached
+    # ownership fact only goes stale through deletion, which db.get() reports as None.
+    cache_key = _ownership_cache_key(model, user_id, object_id)
+    with _ownership_cache_lock:
+        cache = _ownership_caches.get(db.get_bind())
+        expires_at = cache.get(cache_key) if cache is not None else None
+        if expires_at is None:
+            return None
+        if expires_at < time.monotonic():
+            del cache[cache_key]
+            return None
+        cache.move_to_end(cache_key)
+    instance = db.get(model, object_id, options=load_options)
+    if instance is None:
+        forget_owned(db, model, user_id, object_id)
+    return instance
+
+
+def _remember_owned(db: Session, model: type, user_id: str, object_id: str) -> None:
+    cache_key = _ownership_cache_key(model, user_id, object_id)
+    with _ownership_cache_lock:
+        bind = db.get_bind()
+        cache = _ownership_caches.get(bind)
+        if cache is None:
+            cache = _ownership_caches[bind] = OrderedDict()
+        cache[cache_key] = time.monotonic() + OWNERSHIP_CACHE_TTL_SECONDS
+        cache.move_to_end(cache_key)
+        while len(cache) > OWNERSHIP_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def forget_owned(db: Session, model: type, user_id: str, object_id: str) -> None:
+    with _ownership_cache_lock:
+        cache = _ownership_caches.get(db.get_bind())
+        if cache:
+            cache.pop(_ownership_cache_key(model, user_id, object_id), None)
+
+
+def get_owned_course(
+    db: Session,
+    current_user: models.User,
+    course_id: str,
+    load_options: tuple = (),
+) -> models.Course:
+    course = _get_cached_owned(db, models.Course, current_user.id, course_id, load_options)
+    if course is not None:
+        return course
     course = (
         db.query(models.Course)
+        .options(*load_options)
         .join(models.Program, models.Course.program_id == models.Program.id)
         .filter(models.Course.id == course_id, models.Program.owner_id == current_user.id)
         .first()
     )
     if course is None:
         raise HTTPException(status_code=404, detail="Course not found")
+    _remember_owned(db, models.Course, current_user.id, course_id)
     return course
 
 
-def get_owned_semester(db: Session, current_user: models.User, semester_id: str) -> models.Semester:
+def get_owned_semester(
+    db: Session,
+    current_user: models.User,
+    semester_id: str,
+    load_options: tuple = (),
+) -> models.Semester:
+    semester = _get_cached_owned(db, models.Semester, current_user.id, semester_id, load_options)
+    if semester is not None:
+        return semester
     semester = (
         db.query(models.Semester)
+        .options(*load_options)
         .join(models.Program, models.Semester.program_id == models.Program.id)
         .filter(models.Semester.id == semester_id, models.Program.owner_id == current_user.id)
         .first()
     )
     if semester is None:
         raise HTTPException(status_code=404, detail="Semester not found")
+    _remember_owned(db, models.Semester, current_user.id, semester_id)
     return semester
 
 
@@ -170,6 +262,13 @@ def build_course_resource_list_response(db: Session, current_user: models.User,
     )
 
 
+def raise_event_type_not_found(event_type_code: str):
+    raise HTTPException(
+        status_code=422,
+        detail=error_detail("EVENT_TYPE_NOT_FOUND", f"eventTypeCode '{event_type_code}' does not exist for this course."),
+    )
+
+
 def get_event_type_or_404(db: Session, course_id: str, event_type_code: str) -> models.CourseEventType:
     event_type = (
         db.query(models.CourseEventType)
@@ -177,13 +276,17 @@ def get_event_type_or_404(db: Session, course_id: str, event_type_code: str) ->
         .first()
     )
     if event_type is None:
-        raise HTTPException(
-            status_code=422,
-            detail=error_detail("EVENT_TYPE_NOT_FOUND", f"eventTypeCode '{event_type_code}' does not exist for this course."),
-        )
+        raise_event_type_not_found(event_type_code)
     return event_type
 
 
+def raise_section_not_found(section_id: str):
+    raise HTTPException(
+        status_code=422,
+        detail=error_detail("SECTION_NOT_FOUND", f"sectionId '{section_id}' does not exist for this course."),
+    )
+
+
 def get_section_or_422(db: Session, course_id: str, section_id: Optional[str]) -> Optional[models.CourseSection]:
     if section_id is None:
         return None
@@ -193,16 +296,18 @@ def get_section_or_422(db: Session, course_id: str, section_id: Optional[str]) -
         .first()
     )
     if section is None:
-        raise HTTPException(
-            status_code=422,
-            detail=error_detail("SECTION_NOT_FOUND", f"sectionId '{section_id}' does not exist for this course."),
-        )
+        raise_section_not_found(section_id)
     return section
 
 
+@lru_cache(maxsize=512)
+def _cached_zoneinfo(timezone: str) -> ZoneInfo:
+    return ZoneInfo(timezone)
+
+
 def validate_program_timezone_or_422(timezone: str) -> ZoneInfo:
     try:
-        return ZoneInfo(timezone)
+        return _cached_zoneinfo(timezone)
     except Exception as exc:
         raise HTTPException(
             status_code=422,
@@ -280,7 +385,7 @@ def validate_reading_week_or_422(
         )
 
 
-def touch_model_timestamp(model_instance):
-    model_instance.updated_at = now_utc_iso()
+def touch_model_timestamp(model_instance, now_iso: Optional[str] = None):
+    model_instance.updated_at = now_iso or now_utc_iso()
     if getattr(model_instance, "created_at", None) in (None, ""):
         model_instance.created_at = model_instance.updated_at
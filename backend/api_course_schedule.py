@@ -1,5 +1,5 @@
-# input:  [FastAPI router/dependencies, backend models/schemas/crud, shared API helpers, schedule support functions, and icalendar export types]
-# output: [Course event-type/section/event CRUD routes plus schedule query and export endpoints]
+# input:  [FastAPI router/dependencies, backend models/schemas, shared API helpers, schedule support functions, and icalendar export types]
+# output: [Course event-type/section/event CRUD routes (event-type code renames cascade through the schema; section imports validate against one event-type read and insert with one executemany; event batches read event types and sections once, and atomic batches stage every item on preloaded events for one grouped flush) plus schedule query and export endpoints that resolve the semester and program timezone in one query; unchanged section/event PATCHes skip the write and only client-sent times must be strict HH:mm, ICS exports are streamed one VEVENT at a time and PNG/PDF JSON exports serialized directly by pydantic]
 # pos:    [backend API router for course schedule management and calendar export workflows]
 #
 # ⚠️ When this file is updated:
@@ -9,26 +9,44 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from icalendar import Calendar, Event as ICalEvent
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from api_common import error_detail, get_event_type_or_404, get_owned_course, get_owned_semester, get_semester_max_week, touch_model_timestamp
+from api_common import (
+    error_detail,
+    get_event_type_or_404,
+    get_owned_course,
+    get_owned_semester,
+    get_semester_max_week,
+    now_utc_iso,
+    touch_model_timestamp,
+    validate_time_format,
+)
 from database import get_db
 from schedule_support import (
+    CourseScheduleLookups,
+    build_items_by_week,
     collect_course_week_items,
     collect_semester_range_items,
     collect_semester_week_items,
     detect_conflicts,
     ensure_builtin_event_types_for_course,
     get_course_semester_and_timezone,
+    get_semester_and_timezone,
+    load_course_schedule_lookups,
+    load_course_events,
+    load_semester_events,
     normalize_event_skip,
     normalize_week_pattern_input,
     parse_export_weeks,
     parse_time_value,
+    prepare_week_events,
     resolve_week_index,
     serialize_schedule_item,
     validate_event_payload,
@@ -36,7 +54,6 @@ from schedule_support import (
     week_date,
 )
 import auth
-import crud
 import models
 import schemas
 
@@ -93,10 +110,17 @@ def create_course_event_type(
             status_code=422,
             detail=error_detail("EVENT_TYPE_DUPLICATE", "Duplicate code or abbreviation for this course."),
         )
-    db.refresh(event_type)
     return event_type
 
 
+def _event_type_duplicate_message(error: IntegrityError) -> str:
+    # The unique constraints decide duplicates; the client picks the form field from the message.
+    violation = str(error.orig)
+    if "uq_course_event_types_course_code" in violation or "course_event_types.code" in violation:
+        return "code already exists for this course."
+    return "Duplicate abbreviation for this course."
+
+
 @router.patch("/courses/{course_id}/event-types/{event_type_code}", response_model=schemas.CourseEventTypePatchResponse)
 def update_course_event_type(
     course_id: str,
@@ -107,7 +131,7 @@ def update_course_event_type(
 ):
     get_owned_course(db, current_user, course_id)
     event_type = get_event_type_or_404(db, course_id, event_type_code.strip())
-    update_data = payload.dict(exclude_unset=True, by_alias=False)
+    update_data = payload.model_dump(exclude_unset=True, by_alias=False)
     normalized_count = 0
     previous_track = bool(event_type.track_attendance)
 
@@ -128,57 +152,34 @@ def update_course_event_type(
                 status_code=422,
                 detail=error_detail("INVALID_EVENT_TYPE_CODE", "code cannot be empty."),
             )
-        if new_code != old_code:
-            existing = (
-                db.query(models.CourseEventType)
-                .filter(
-                    models.CourseEventType.course_id == course_id,
-                    models.CourseEventType.code == new_code,
-                    models.CourseEventType.id != event_type.id,
-                )
-                .first()
-            )
-            if existing:
-                raise HTTPException(
-                    status_code=422,
-                    detail=error_detail("EVENT_TYPE_DUPLICATE", "code already exists for this course."),
-                )
-
-    for key, value in update_data.items():
-        setattr(event_type, key, value)
 
-    if new_code and new_code != old_code:
-        db.query(models.CourseEvent).filter(
-            models.CourseEvent.course_id == course_id,
-            models.CourseEvent.event_type_code == old_code,
-        ).update({models.CourseEvent.event_type_code: new_code}, synchronize_session=False)
-        db.query(models.CourseSection).filter(
-            models.CourseSection.course_id == course_id,
-            models.CourseSection.event_type_code == old_code,
-        ).update({models.CourseSection.event_type_code: new_code}, synchronize_session=False)
-
-    if (not previous_track) and event_type.track_attendance:
+    # Normalize skipped events before touching the event type: a code rename is one event-type
+    # UPDATE that the section and event foreign keys cascade, and it must not be flushed before
+    # this statement matches the events on their old code.
+    if not previous_track and update_data.get("track_attendance"):
         normalized_count = (
             db.query(models.CourseEvent)
             .filter(
                 models.CourseEvent.course_id == course_id,
-                models.CourseEvent.event_type_code == event_type.code,
+                models.CourseEvent.event_type_code == old_code,
                 models.CourseEvent.skip == True,
             )
             .update({models.CourseEvent.skip: False}, synchronize_session=False)
         )
 
+    for key, value in update_data.items():
+        setattr(event_type, key, value)
+
     touch_model_timestamp(event_type)
     db.add(event_type)
     try:
         db.commit()
-    except IntegrityError:
+    except IntegrityError as exc:
         db.rollback()
         raise HTTPException(
             status_code=422,
-            detail=error_detail("EVENT_TYPE_DUPLICATE", "Duplicate abbreviation for this course."),
+            detail=error_detail("EVENT_TYPE_DUPLICATE", _event_type_duplicate_message(exc)),
         )
-    db.refresh(event_type)
     return {"event_type": event_type, "normalized_events": normalized_count}
 
 
@@ -229,7 +230,7 @@ def create_course_section(
 ):
     get_owned_course(db, current_user, course_id)
     ensure_builtin_event_types_for_course(db, course_id)
-    payload = section.dict(by_alias=False)
+    payload = section.model_dump(by_alias=False)
     payload["section_id"] = payload["section_id"].strip()
     if not payload["section_id"]:
         raise HTTPException(status_code=422, detail=error_detail("INVALID_SECTION_ID", "sectionId cannot be empty."))
@@ -249,7 +250,6 @@ def create_course_section(
             status_code=422,
             detail=error_detail("SECTION_CREATE_FAILED", f"Failed to create section: {str(exc)}"),
         ) from exc
-    db.refresh(db_section)
     return db_section
 
 
@@ -270,7 +270,7 @@ def update_course_section(
     if not db_section:
         raise HTTPException(status_code=404, detail="Section not found")
 
-    update_data = section_update.dict(exclude_unset=True, by_alias=False)
+    update_data = section_update.model_dump(exclude_unset=True, by_alias=False)
     merged = {
         "event_type_code": update_data.get("event_type_code", db_section.event_type_code),
         "day_of_week": update_data.get("day_of_week", db_section.day_of_week),
@@ -280,15 +280,24 @@ def update_course_section(
         "start_week": update_data.get("start_week", db_section.start_week),
         "end_week": update_data.get("end_week", db_section.end_week),
     }
-    validate_section_payload(course_id, merged, db)
+    # Only times sent by the client must be strict HH:mm; legacy stored values still pass.
+    validate_time_format(*(update_data[key] for key in ("start_time", "end_time") if key in update_data))
+    validate_section_payload(course_id, merged, db, allow_unpadded_times=True)
 
+    changes = {}
     for key, value in update_data.items():
         if key == "event_type_code" and value is not None:
             value = value.strip()
         if key == "week_pattern" and value is not None:
             value = normalize_week_pattern_input(value)
-        setattr(db_section, key, value)
+        if getattr(db_section, key) != value:
+            changes[key] = value
+    # Retried or autosaved PATCHes that match the stored row skip the write entirely.
+    if not changes:
+        return db_section
 
+    for key, value in changes.items():
+        setattr(db_section, key, value)
     touch_model_timestamp(db_section)
     db.add(db_section)
     try:
@@ -296,7 +305,6 @@ def update_course_section(
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=422, detail=error_detail("SECTION_UPDATE_CONFLICT", "Failed to update section due to constraint conflict."))
-    db.refresh(db_section)
     return db_section
 
 
@@ -336,15 +344,22 @@ def import_course_sections(
         if mode == "replace":
             db.query(models.CourseSection).filter(models.CourseSection.course_id == course_id).delete(synchronize_session=False)
 
+        # Validate everything against one read of the course's event-type codes, then write
+        # all sections with a single executemany.
+        known_event_type_codes = set(
+            db.scalars(select(models.CourseEventType.code).where(models.CourseEventType.course_id == course_id))
+        )
+        imported_at = now_utc_iso()
+        section_rows = []
         for item in payload.items:
-            item_payload = item.dict(by_alias=False)
+            item_payload = item.model_dump(by_alias=False)
             item_payload["section_id"] = item_payload["section_id"].strip()
             if not item_payload["section_id"]:
                 raise HTTPException(status_code=422, detail=error_detail("INVALID_SECTION_ID", "sectionId cannot be empty."))
-            validate_section_payload(course_id, item_payload, db)
-            db_section = models.CourseSection(course_id=course_id, **item_payload)
-            touch_model_timestamp(db_section)
-            db.add(db_section)
+            validate_section_payload(course_id, item_payload, db, known_event_type_codes)
+            section_rows.append({**item_payload, "course_id": course_id, "created_at": imported_at, "updated_at": imported_at})
+        if section_rows:
+            db.execute(insert(models.CourseSection), section_rows)
         db.commit()
     except HTTPException:
         db.rollback()
@@ -376,17 +391,30 @@ def get_course_events(
     )
 
 
-def _create_course_event_record(
+def _build_course_event(
     course_id: str,
     payload: schemas.CourseEventCreate,
     db: Session,
-    auto_commit: bool = True,
+    lookups: Optional[CourseScheduleLookups],
 ) -> models.CourseEvent:
-    ensure_builtin_event_types_for_course(db, course_id)
-    event_payload = payload.dict(by_alias=False)
-    validate_event_payload(course_id, event_payload, db)
+    event_payload = payload.model_dump(by_alias=False)
+    validate_event_payload(course_id, event_payload, db, lookups)
     db_event = models.CourseEvent(course_id=course_id, **event_payload)
     touch_model_timestamp(db_event)
+    return db_event
+
+
+def _create_course_event_record(
+    course_id: str,
+    payload: schemas.CourseEventCreate,
+    db: Session,
+    auto_commit: bool = True,
+    lookups: Optional[CourseScheduleLookups] = None,
+) -> models.CourseEvent:
+    # Batch callers ensure the builtin event types once and pass the course's lookups.
+    if lookups is None:
+        ensure_builtin_event_types_for_course(db, course_id)
+    db_event = _build_course_event(course_id, payload, db, lookups)
     db.add(db_event)
     try:
         if auto_commit:
@@ -396,7 +424,6 @@ def _create_course_event_record(
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=422, detail=error_detail("EVENT_CREATE_CONFLICT", "Event create failed due to constraint conflict."))
-    db.refresh(db_event)
     return db_event
 
 
@@ -417,6 +444,7 @@ def _update_course_event_record(
     payload: schemas.CourseEventUpdate,
     db: Session,
     auto_commit: bool = True,
+    lookups: Optional[CourseScheduleLookups] = None,
 ) -> models.CourseEvent:
     db_event = (
         db.query(models.CourseEvent)
@@ -426,7 +454,29 @@ def _update_course_event_record(
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    update_data = payload.dict(exclude_unset=True, by_alias=False)
+    if not _apply_course_event_update(course_id, db_event, payload, db, lookups):
+        return db_event
+    db.add(db_event)
+    try:
+        if auto_commit:
+            db.commit()
+        else:
+            db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=422, detail=error_detail("EVENT_UPDATE_CONFLICT", "Event update failed due to constraint conflict."))
+    return db_event
+
+
+def _apply_course_event_update(
+    course_id: str,
+    db_event: models.CourseEvent,
+    payload: schemas.CourseEventUpdate,
+    db: Session,
+    lookups: Optional[CourseScheduleLookups],
+) -> bool:
+    """Apply a validated update to ``db_event`` and return whether any column changed."""
+    update_data = payload.model_dump(exclude_unset=True, by_alias=False)
     merged_payload = {
         "event_type_code": update_data.get("event_type_code", db_event.event_type_code),
         "section_id": update_data.get("section_id", db_event.section_id),
@@ -438,28 +488,28 @@ def _update_course_event_record(
         "end_week": update_data.get("end_week", db_event.end_week),
         "skip": update_data.get("skip", db_event.skip),
     }
-    validate_event_payload(course_id, merged_payload, db)
+    validate_time_format(*(update_data[key] for key in ("start_time", "end_time") if key in update_data))
+    validate_event_payload(course_id, merged_payload, db, lookups, allow_unpadded_times=True)
 
+    changes = {}
     for key, value in update_data.items():
         if key == "event_type_code" and value is not None:
             value = value.strip().upper()
         if key == "week_pattern" and value is not None:
             value = normalize_week_pattern_input(value)
+        if getattr(db_event, key) != value:
+            changes[key] = value
+    # Validation normalizes skip (attendance-tracked types can never be skipped).
+    changes.pop("skip", None)
+    if db_event.skip != merged_payload["skip"]:
+        changes["skip"] = merged_payload["skip"]
+    if not changes:
+        return False
+
+    for key, value in changes.items():
         setattr(db_event, key, value)
-
-    db_event.skip = merged_payload["skip"]
     touch_model_timestamp(db_event)
-    db.add(db_event)
-    try:
-        if auto_commit:
-            db.commit()
-        else:
-            db.flush()
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=422, detail=error_detail("EVENT_UPDATE_CONFLICT", "Event update failed due to constraint conflict."))
-    db.refresh(db_event)
-    return db_event
+    return True
 
 
 @router.patch("/courses/{course_id}/events/{event_id}", response_model=schemas.CourseEvent)
@@ -516,35 +566,100 @@ def _batch_error_payload(exc: HTTPException) -> dict:
     return {"code": "BATCH_ITEM_FAILED", "message": str(detail)}
 
 
-def _apply_batch_item(
-    course_id: str,
-    item: schemas.CourseEventBatchItem,
-    db: Session,
-    auto_commit: bool,
-) -> Optional[models.CourseEvent]:
+class _BatchItemError(Exception):
+    def __init__(self, index: int, error: HTTPException):
+        super().__init__(index)
+        self.index = index
+        self.error = error
+
+
+def _parse_batch_item(item: schemas.CourseEventBatchItem):
     if item.op == "create":
         if item.data is None:
             raise HTTPException(status_code=422, detail=error_detail("INVALID_BATCH_ITEM", "create operation requires data."))
-        payload = schemas.CourseEventCreate.model_validate(item.data)
-        return _create_course_event_record(course_id, payload, db, auto_commit=auto_commit)
+        return schemas.CourseEventCreate.model_validate(item.data)
 
     if item.op == "update":
         if not item.event_id:
             raise HTTPException(status_code=422, detail=error_detail("INVALID_BATCH_ITEM", "update operation requires eventId."))
         if item.data is None:
             raise HTTPException(status_code=422, detail=error_detail("INVALID_BATCH_ITEM", "update operation requires data."))
-        payload = schemas.CourseEventUpdate.model_validate(item.data)
-        return _update_course_event_record(course_id, item.event_id, payload, db, auto_commit=auto_commit)
+        return schemas.CourseEventUpdate.model_validate(item.data)
 
     if item.op == "delete":
         if not item.event_id:
             raise HTTPException(status_code=422, detail=error_detail("INVALID_BATCH_ITEM", "delete operation requires eventId."))
-        _delete_course_event_record(course_id, item.event_id, db, auto_commit=auto_commit)
         return None
 
     raise HTTPException(status_code=422, detail=error_detail("INVALID_BATCH_ITEM", f"Unsupported op '{item.op}'."))
 
 
+def _apply_batch_item(
+    course_id: str,
+    item: schemas.CourseEventBatchItem,
+    db: Session,
+    auto_commit: bool,
+    lookups: CourseScheduleLookups,
+) -> Optional[models.CourseEvent]:
+    payload = _parse_batch_item(item)
+    if item.op == "create":
+        return _create_course_event_record(course_id, payload, db, auto_commit=auto_commit, lookups=lookups)
+    if item.op == "update":
+        return _update_course_event_record(course_id, item.event_id, payload, db, auto_commit=auto_commit, lookups=lookups)
+    _delete_course_event_record(course_id, item.event_id, db, auto_commit=auto_commit)
+    return None
+
+
+def _stage_batch_item(
+    course_id: str,
+    item: schemas.CourseEventBatchItem,
+    db: Session,
+    lookups: CourseScheduleLookups,
+    events_by_id: dict[str, models.CourseEvent],
+) -> Optional[models.CourseEvent]:
+    # Atomic batches only change session state here; the unit of work then writes every
+    # create, update and delete with one grouped flush at commit.
+    payload = _parse_batch_item(item)
+    if item.op == "create":
+        db_event = _build_course_event(course_id, payload, db, lookups)
+        db.add(db_event)
+        return db_event
+    db_event = events_by_id.get(item.event_id)
+    if db_event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if item.op == "update":
+        _apply_course_event_update(course_id, db_event, payload, db, lookups)
+        return db_event
+    del events_by_id[item.event_id]
+    db.delete(db_event)
+    return None
+
+
+def _collect_batch_results(items: list[schemas.CourseEventBatchItem], apply_item) -> list[dict]:
+    results: list[dict] = []
+    for index, item in enumerate(items):
+        try:
+            event = apply_item(item)
+        except HTTPException as exc:
+            raise _BatchItemError(index, exc) from exc
+        result = {"index": index, "ok": True}
+        if event is not None:
+            result["event"] = event
+        results.append(result)
+    return results
+
+
+def _prepare_batch_lookups(course_id: str, payload: schemas.CourseEventBatchRequest, db: Session) -> CourseScheduleLookups:
+    # Batch items only write events, so the course's event types and sections are read once
+    # for the whole batch. Builtins are committed up front in non-atomic mode so a failing
+    # item's rollback cannot take them away from the items after it.
+    if any(item.op == "create" for item in payload.items):
+        ensure_builtin_event_types_for_course(db, course_id)
+        if not payload.atomic:
+            db.commit()
+    return load_course_schedule_lookups(db, course_id)
+
+
 @router.post("/courses/{course_id}/events/batch", response_model=schemas.CourseEventBatchResponse)
 def batch_course_events(
     course_id: str,
@@ -553,21 +668,42 @@ def batch_course_events(
     current_user: models.User = Depends(auth.get_current_user),
 ):
     get_owned_course(db, current_user, course_id)
+    lookups = _prepare_batch_lookups(course_id, payload, db)
 
     if payload.atomic:
-        results: list[dict] = []
+        # Every event the batch updates or deletes is loaded with one query up front.
+        referenced_ids = {item.event_id for item in payload.items if item.op in {"update", "delete"} and item.event_id}
+        events_by_id = {
+            db_event.id: db_event
+            for db_event in (
+                db.query(models.CourseEvent)
+                .filter(models.CourseEvent.course_id == course_id, models.CourseEvent.id.in_(referenced_ids))
+                .all()
+                if referenced_ids
+                else ()
+            )
+        }
         try:
-            for index, item in enumerate(payload.items):
-                event = _apply_batch_item(course_id, item, db, auto_commit=False)
-                result = {"index": index, "ok": True}
-                if event is not None:
-                    result["event"] = event
-                results.append(result)
-            db.commit()
-        except HTTPException as exc:
+            try:
+                results = _collect_batch_results(
+                    payload.items,
+                    lambda item: _stage_batch_item(course_id, item, db, lookups, events_by_id),
+                )
+                db.commit()
+            except IntegrityError:
+                # The grouped flush cannot tell which item the database rejected, so replay the
+                # batch item by item to report the failing index as before.
+                db.rollback()
+                lookups = _prepare_batch_lookups(course_id, payload, db)
+                results = _collect_batch_results(
+                    payload.items,
+                    lambda item: _apply_batch_item(course_id, item, db, auto_commit=False, lookups=lookups),
+                )
+                db.commit()
+        except _BatchItemError as exc:
             db.rollback()
-            err = _batch_error_payload(exc)
-            raise HTTPException(status_code=422, detail={"failedIndex": index, **err})
+            err = _batch_error_payload(exc.error)
+            raise HTTPException(status_code=422, detail={"failedIndex": exc.index, **err})
         return {"atomic": True, "total": len(payload.items), "succeeded": len(results), "failed": 0, "results": results}
 
     results: list[dict] = []
@@ -575,7 +711,7 @@ def batch_course_events(
     failed = 0
     for index, item in enumerate(payload.items):
         try:
-            event = _apply_batch_item(course_id, item, db, auto_commit=True)
+            event = _apply_batch_item(course_id, item, db, auto_commit=True, lookups=lookups)
             entry = {"index": index, "ok": True}
             if event is not None:
                 entry["event"] = event
@@ -615,11 +751,7 @@ def get_semester_schedule(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    semester = get_owned_semester(db, current_user, semester_id)
-    program = crud.get_program(db, semester.program_id, current_user.id)
-    if not program:
-        raise HTTPException(status_code=404, detail="Program not found")
-    timezone = (program.program_timezone or "UTC").strip() or "UTC"
+    semester, timezone = get_semester_and_timezone(db, current_user, semester_id)
     resolved_week = resolve_week_index(semester, timezone, week)
     max_week = get_semester_max_week(semester)
     items, warnings = collect_semester_week_items(db, semester, resolved_week)
@@ -644,23 +776,6 @@ def get_semester_schedule_calendar_events(
     return {"start": start, "end": end, "items": serialized, "warnings": warnings}
 
 
-def collect_export_items_for_week(
-    scope: schemas.ExportScope,
-    scope_id: str,
-    week: int,
-    db: Session,
-    current_user: models.User,
-) -> tuple[list[dict], models.Semester]:
-    if scope == schemas.ExportScope.COURSE:
-        course, semester, _timezone = get_course_semester_and_timezone(db, current_user, scope_id)
-        items, _warnings = collect_course_week_items(db, course, semester, week)
-        return detect_conflicts(items), semester
-
-    semester = get_owned_semester(db, current_user, scope_id)
-    items, _warnings = collect_semester_week_items(db, semester, week)
-    return detect_conflicts(items), semester
-
-
 def build_export_payload(
     request: schemas.ScheduleExportRequest,
     export_format: str,
@@ -668,20 +783,22 @@ def build_export_payload(
     current_user: models.User,
 ) -> dict:
     if request.scope == schemas.ExportScope.COURSE:
-        _course, semester, timezone = get_course_semester_and_timezone(db, current_user, request.scope_id)
+        course, semester, timezone = get_course_semester_and_timezone(db, current_user, request.scope_id)
     else:
-        semester = get_owned_semester(db, current_user, request.scope_id)
-        program = crud.get_program(db, semester.program_id, current_user.id)
-        if not program:
-            raise HTTPException(status_code=404, detail="Program not found")
-        timezone = (program.program_timezone or "UTC").strip() or "UTC"
+        semester, timezone = get_semester_and_timezone(db, current_user, request.scope_id)
 
     weeks = parse_export_weeks(request.range, request.week, request.start_week, request.end_week, semester, timezone)
 
+    # Load and prepare the scope's events once; each exported week then only filters them.
+    if request.scope == schemas.ExportScope.COURSE:
+        events = load_course_events(db, course)
+    else:
+        events = load_semester_events(db, semester)
+    prepared_events, _warnings = prepare_week_events(events, get_semester_max_week(semester))
+
     merged_items: list[dict] = []
-    for week in weeks:
-        week_items, _semester = collect_export_items_for_week(request.scope, request.scope_id, week, db, current_user)
-        for item in week_items:
+    for week_items in build_items_by_week(prepared_events, weeks).values():
+        for item in detect_conflicts(week_items):
             if item["skip"]:
                 if export_format == "ics":
                     continue
@@ -695,23 +812,37 @@ def build_export_payload(
     return {"semester": semester, "weeks": weeks, "items": merged_items}
 
 
+def _json_export_response(
+    request: schemas.ScheduleExportRequest,
+    export_format: str,
+    db: Session,
+    current_user: models.User,
+) -> Response:
+    payload = build_export_payload(request, export_format, db, current_user)
+    serialized = [serialize_schedule_item(item, include_render_state=True) for item in payload["items"]]
+    # Validate once and let pydantic write the JSON bytes directly; returning a plain dict
+    # would re-validate it and then run jsonable_encoder and json.dumps over every item.
+    export = schemas.JsonExportResponse.model_validate(
+        {
+            "format": export_format,
+            "scope": request.scope,
+            "scopeId": request.scope_id,
+            "weeks": payload["weeks"],
+            "itemCount": len(serialized),
+            "skipRenderMode": request.skip_render_mode,
+            "items": serialized,
+        }
+    )
+    return Response(content=export.model_dump_json(by_alias=True), media_type="application/json")
+
+
 @router.post("/schedule/export/png", response_model=schemas.JsonExportResponse)
 def export_schedule_png(
     request: schemas.ScheduleExportRequest,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    payload = build_export_payload(request, "png", db, current_user)
-    serialized = [serialize_schedule_item(item, include_render_state=True) for item in payload["items"]]
-    return {
-        "format": "png",
-        "scope": request.scope,
-        "scopeId": request.scope_id,
-        "weeks": payload["weeks"],
-        "itemCount": len(serialized),
-        "skipRenderMode": request.skip_render_mode,
-        "items": serialized,
-    }
+    return _json_export_response(request, "png", db, current_user)
 
 
 @router.post("/schedule/export/pdf", response_model=schemas.JsonExportResponse)
@@ -720,49 +851,43 @@ def export_schedule_pdf(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    payload = build_export_payload(request, "pdf", db, current_user)
-    serialized = [serialize_schedule_item(item, include_render_state=True) for item in payload["items"]]
-    return {
-        "format": "pdf",
-        "scope": request.scope,
-        "scopeId": request.scope_id,
-        "weeks": payload["weeks"],
-        "itemCount": len(serialized),
-        "skipRenderMode": request.skip_render_mode,
-        "items": serialized,
-    }
+    return _json_export_response(request, "pdf", db, current_user)
 
 
-@router.post("/schedule/export/ics")
-def export_schedule_ics(
-    request: schemas.ScheduleExportRequest,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_user),
-):
-    payload = build_export_payload(request, "ics", db, current_user)
-    semester = payload["semester"]
-
+def _iter_ics_calendar(items: list[dict], semester_start_ordinal: int) -> Iterator[bytes]:
     calendar = Calendar()
     calendar.add("prodid", "-//Semestra//Schedule Export//EN")
     calendar.add("version", "2.0")
+    # Emit the empty calendar's header, then one serialized VEVENT at a time, so the
+    # full component tree is never held in memory alongside its serialized bytes.
+    footer = b"END:VCALENDAR\r\n"
+    yield calendar.to_ical().removesuffix(footer)
 
-    for item in payload["items"]:
-        event_date = week_date(semester.start_date, item["week"], item["day_of_week"])
-        dtstart = datetime.combine(event_date, parse_time_value(item["start_time"]))
-        dtend = datetime.combine(event_date, parse_time_value(item["end_time"]))
-
+    for item in items:
+        event_date = week_date(semester_start_ordinal, item["week"], item["day_of_week"])
         ical_event = ICalEvent()
         ical_event.add("uid", f"{item['event_id']}-{item['week']}@semestra")
         ical_event.add("summary", f"{item['course_name']} {item['event_type_code']}")
-        ical_event.add("dtstart", dtstart)
-        ical_event.add("dtend", dtend)
+        ical_event.add("dtstart", datetime.combine(event_date, parse_time_value(item["start_time"])))
+        ical_event.add("dtend", datetime.combine(event_date, parse_time_value(item["end_time"])))
         if item.get("note"):
             ical_event.add("description", item["note"])
-        calendar.add_component(ical_event)
+        yield ical_event.to_ical()
+
+    yield footer
+
+
+@router.post("/schedule/export/ics")
+def export_schedule_ics(
+    request: schemas.ScheduleExportRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    payload = build_export_payload(request, "ics", db, current_user)
 
     filename = f"schedule-{request.scope.value}-{request.scope_id}.ics"
-    return Response(
-        content=calendar.to_ical(),
+    return StreamingResponse(
+        _iter_ics_calendar(payload["items"], payload["semester"].start_date.toordinal()),
         media_type="text/calendar",
         headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
     )
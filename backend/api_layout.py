@@ -1,6 +1,6 @@
 # input:  [FastAPI router/dependencies, backend CRUD/models/schemas, and shared ownership helpers]
 # output: [Widget and tab route handlers for semester/course dashboard layout state]
-# pos:    [backend API router for widget/tab CRUD, including force-aware ownership validation across semester and course scopes]
+# pos:    [backend API router for widget/tab CRUD, including single-query ownership validation across semester and course scopes (an EXISTS check before updates) and force-aware widget deletion]
 #
 # ⚠️ When this file is updated:
 #    1. Update these header comments
@@ -9,17 +9,28 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import exists, or_, select
 from sqlalchemy.orm import Session
 
 import auth
 import crud
 import models
 import schemas
+from api_common import get_owned_course, get_owned_semester
 from database import get_db
 
 router = APIRouter()
 
 
+def _owned_by(model: type, current_user: models.User):
+    # Widgets and tabs hang off either a semester or a course; both paths end at an owned Program.
+    owned_program_ids = select(models.Program.id).where(models.Program.owner_id == current_user.id)
+    return or_(
+        model.semester_id.in_(select(models.Semester.id).where(models.Semester.program_id.in_(owned_program_ids))),
+        model.course_id.in_(select(models.Course.id).where(models.Course.program_id.in_(owned_program_ids))),
+    )
+
+
 @router.post("/semesters/{semester_id}/widgets/", response_model=schemas.Widget)
 def create_widget_for_semester(
     semester_id: str,
@@ -27,13 +38,8 @@ def create_widget_for_semester(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    if not semester:
-        raise HTTPException(status_code=404, detail="Semester not found")
-    return crud.create_widget(db=db, widget=widget, semester_id=semester_id)
+    get_owned_semester(db, current_user, semester_id)
+    return crud.create_widget_for_semester(db=db, widget=widget, semester_id=semester_id)
 
 
 @router.post("/courses/{course_id}/widgets/", response_model=schemas.Widget)
@@ -43,13 +49,8 @@ def create_widget_for_course(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    course = db.query(models.Course).join(models.Program).filter(
-        models.Course.id == course_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    return crud.create_widget(db=db, widget=widget, course_id=course_id)
+    get_owned_course(db, current_user, course_id)
+    return crud.create_widget_for_course(db=db, widget=widget, course_id=course_id)
 
 
 @router.put("/widgets/{widget_id}", response_model=schemas.Widget)
@@ -59,16 +60,7 @@ def update_widget(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    db_widget_sem = db.query(models.Widget).join(models.Semester).join(models.Program).filter(
-        models.Widget.id == widget_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_widget_course = db.query(models.Widget).join(models.Course).join(models.Program).filter(
-        models.Widget.id == widget_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_widget = db_widget_sem or db_widget_course
-    if not db_widget:
+    if not db.query(exists().where(models.Widget.id == widget_id, _owned_by(models.Widget, current_user))).scalar():
         raise HTTPException(status_code=404, detail="Widget not found")
     return crud.update_widget(db=db, widget_id=widget_id, widget_update=widget)
 
@@ -80,15 +72,7 @@ def delete_widget(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    db_widget_sem = db.query(models.Widget).join(models.Semester).join(models.Program).filter(
-        models.Widget.id == widget_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_widget_course = db.query(models.Widget).join(models.Course).join(models.Program).filter(
-        models.Widget.id == widget_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_widget = db_widget_sem or db_widget_course
+    db_widget = db.query(models.Widget).filter(models.Widget.id == widget_id, _owned_by(models.Widget, current_user)).first()
     if not db_widget:
         raise HTTPException(status_code=404, detail="Widget not found")
     if db_widget.is_removable is False and not force:
@@ -103,13 +87,8 @@ def create_tab_for_semester(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    if not semester:
-        raise HTTPException(status_code=404, detail="Semester not found")
-    return crud.create_tab(db=db, tab=tab, semester_id=semester_id)
+    get_owned_semester(db, current_user, semester_id)
+    return crud.create_tab_for_semester(db=db, tab=tab, semester_id=semester_id)
 
 
 @router.post("/courses/{course_id}/tabs/", response_model=schemas.Tab)
@@ -119,13 +98,8 @@ def create_tab_for_course(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    course = db.query(models.Course).join(models.Program).filter(
-        models.Course.id == course_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    return crud.create_tab(db=db, tab=tab, course_id=course_id)
+    get_owned_course(db, current_user, course_id)
+    return crud.create_tab_for_course(db=db, tab=tab, course_id=course_id)
 
 
 @router.put("/tabs/{tab_id}", response_model=schemas.Tab)
@@ -135,16 +109,7 @@ def update_tab(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    db_tab_sem = db.query(models.Tab).join(models.Semester).join(models.Program).filter(
-        models.Tab.id == tab_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_tab_course = db.query(models.Tab).join(models.Course).join(models.Program).filter(
-        models.Tab.id == tab_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_tab = db_tab_sem or db_tab_course
-    if not db_tab:
+    if not db.query(exists().where(models.Tab.id == tab_id, _owned_by(models.Tab, current_user))).scalar():
         raise HTTPException(status_code=404, detail="Tab not found")
     return crud.update_tab(db=db, tab_id=tab_id, tab_update=tab)
 
@@ -155,15 +120,7 @@ def delete_tab(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user),
 ):
-    db_tab_sem = db.query(models.Tab).join(models.Semester).join(models.Program).filter(
-        models.Tab.id == tab_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_tab_course = db.query(models.Tab).join(models.Course).join(models.Program).filter(
-        models.Tab.id == tab_id,
-        models.Program.owner_id == current_user.id,
-    ).first()
-    db_tab = db_tab_sem or db_tab_course
+    db_tab = db.query(models.Tab).filter(models.Tab.id == tab_id, _owned_by(models.Tab, current_user)).first()
     if not db_tab:
         raise HTTPException(status_code=404, detail="Tab not found")
     if db_tab.is_removable is False:
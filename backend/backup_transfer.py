@@ -1,5 +1,5 @@
 # input:  [SQLAlchemy session, backend models/schemas/crud/domain services, course-resource storage helpers, LMS crypto/service modules, runtime validation callbacks, and base-dir filesystem access]
-# output: [backup export/import service functions plus runtime callback container for account data transfer across current persisted features]
+# output: [a streaming backup export that verifies stored resource files up front, then yields the JSON envelope and one serialized program at a time in id batches, the import service function, the eager-load option tree and grouped column-row loader used by export, batched per-program import row inserts with courses created through crud.create_courses in bounded batches and sections validated against each course's known event-type codes, plus runtime callback container for account data transfer across current persisted features]
 # pos:    [backend backup-transfer domain module that serializes and restores account state outside the FastAPI entrypoint]
 #
 # ⚠️ When this file is updated:
@@ -9,14 +9,16 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 import json
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, delete, insert, select
+from sqlalchemy.orm import Session, selectinload
 
 import course_resources
 import crud
@@ -30,6 +32,40 @@ from lms_crypto import decrypt_credentials, encrypt_credentials
 
 BACKUP_FORMAT_VERSION = "2.2.2"
 
+# Export walks every collection of the account tree; load each level with one IN query
+# instead of lazy-loading per parent. Course children hang off Program.courses, which
+# already contains every semester course, so Semester.courses reuses those identities.
+_EXPORT_SEMESTERS = selectinload(models.Program.semesters)
+_EXPORT_COURSES = selectinload(models.Program.courses)
+_EXPORT_GRADEBOOK = _EXPORT_COURSES.selectinload(models.Course.gradebook)
+EXPORT_LOAD_OPTIONS = (
+    _EXPORT_SEMESTERS.selectinload(models.Semester.courses),
+    _EXPORT_SEMESTERS.selectinload(models.Semester.tabs),
+    _EXPORT_SEMESTERS.selectinload(models.Semester.todo_sections),
+    _EXPORT_SEMESTERS.selectinload(models.Semester.todo_tasks),
+    _EXPORT_COURSES.selectinload(models.Course.tabs),
+    _EXPORT_COURSES.selectinload(models.Course.resource_files),
+    _EXPORT_COURSES.selectinload(models.Course.lms_link),
+    _EXPORT_GRADEBOOK.selectinload(models.CourseGradebook.categories),
+    _EXPORT_GRADEBOOK.selectinload(models.CourseGradebook.assessments),
+)
+# Widgets, plugin settings and schedule rows are copied into export DTOs field for field,
+# so they are read as plain column rows grouped by owner rather than hydrated as ORM
+# objects. Tabs stay on the ORM path because todo state migration reads them.
+_EXPORT_SEMESTER_ROW_MODELS = (models.Widget, models.PluginSetting)
+_EXPORT_COURSE_ROW_MODELS = (
+    models.Widget,
+    models.PluginSetting,
+    models.CourseEventType,
+    models.CourseSection,
+    models.CourseEvent,
+)
+EXPORT_ROW_BATCH_SIZE = 500
+EXPORT_PROGRAM_BATCH_SIZE = 100
+IMPORT_COURSE_BATCH_SIZE = 500
+# crud.create_courses inserts these for every course; a backup's own event types replace them.
+_BUILTIN_EVENT_TYPE_CODES = frozenset(event_type["code"] for event_type in crud.BUILTIN_EVENT_TYPES)
+
 
 @dataclass(frozen=True)
 class BackupRuntimeCallbacks:
@@ -37,15 +73,29 @@ class BackupRuntimeCallbacks:
     now_utc_iso: Callable[[], str]
     touch_model_timestamp: Callable[[object], None]
     validate_day_of_week: Callable[[int], None]
-    validate_time_range: Callable[[str, str], None]
+    validate_time_range: Callable[..., None]
     validate_week_range: Callable[[Optional[int], Optional[int], str], None]
-    validate_section_id: Callable[[str], None]
     normalize_week_pattern_input: Callable[[Any], str]
-    validate_section_payload: Callable[[str, dict, Session], None]
+    validate_section_payload: Callable[..., None]
     validate_reading_week_or_422: Callable[[date, date, Optional[date], Optional[date]], None]
 
 
-def _export_widget(widget: models.Widget) -> schemas.WidgetExport:
+def _load_export_rows(
+    db: Session,
+    model: type,
+    owner_column: Any,
+    owner_ids: list[str],
+) -> dict[str, list[Row]]:
+    rows_by_owner: dict[str, list[Row]] = defaultdict(list)
+    columns = tuple(model.__table__.columns)
+    for start in range(0, len(owner_ids), EXPORT_ROW_BATCH_SIZE):
+        batch = owner_ids[start:start + EXPORT_ROW_BATCH_SIZE]
+        for row in db.execute(select(*columns).where(owner_column.in_(batch))):
+            rows_by_owner[getattr(row, owner_column.key)].append(row)
+    return rows_by_owner
+
+
+def _export_widget(widget: Row) -> schemas.WidgetExport:
     return schemas.WidgetExport(
         widget_type=widget.widget_type,
         layout_config=widget.layout_config,
@@ -64,7 +114,7 @@ def _export_tab(tab: models.Tab) -> schemas.TabExport:
     )
 
 
-def _export_plugin_setting(setting: models.PluginSetting) -> schemas.PluginSettingExport:
+def _export_plugin_setting(setting: Row) -> schemas.PluginSettingExport:
     return schemas.PluginSettingExport(plugin_id=setting.plugin_id, settings=setting.settings)
 
 
@@ -77,6 +127,38 @@ def _export_lms_error(code: Optional[str], message: Optional[str]) -> Optional[s
     )
 
 
+def _raise_resource_file_missing(
+    resource: models.CourseResourceFile,
+    error_detail: Callable[[str, str], dict],
+) -> None:
+    raise HTTPException(
+        status_code=500,
+        detail=error_detail(
+            "COURSE_RESOURCE_FILE_MISSING",
+            f"Stored resource file '{resource.filename_display}' could not be found on disk.",
+        ),
+    )
+
+
+def _check_export_resource_files(
+    db: Session,
+    current_user: models.User,
+    *,
+    base_dir: Path,
+    error_detail: Callable[[str, str], dict],
+) -> None:
+    resources = (
+        db.query(models.CourseResourceFile)
+        .join(models.Course, models.Course.id == models.CourseResourceFile.course_id)
+        .join(models.Program, models.Program.id == models.Course.program_id)
+        .filter(models.Program.owner_id == current_user.id, models.CourseResourceFile.resource_kind == "file")
+        .all()
+    )
+    for resource in resources:
+        if not course_resources.resolve_absolute_path(base_dir, resource).exists():
+            _raise_resource_file_missing(resource, error_detail)
+
+
 def _export_course_resources(
     course: models.Course,
     *,
@@ -89,13 +171,7 @@ def _export_course_resources(
         if resource.resource_kind == "file":
             absolute_path = course_resources.resolve_absolute_path(base_dir, resource)
             if not absolute_path.exists():
-                raise HTTPException(
-                    status_code=500,
-                    detail=error_detail(
-                        "COURSE_RESOURCE_FILE_MISSING",
-                        f"Stored resource file '{resource.filename_display}' could not be found on disk.",
-                    ),
-                )
+                _raise_resource_file_missing(resource, error_detail)
             content_base64 = base64.b64encode(absolute_path.read_bytes()).decode("ascii")
         exported.append(
             schemas.CourseResourceExport(
@@ -111,7 +187,7 @@ def _export_course_resources(
     return exported
 
 
-def _export_course_event_types(course: models.Course) -> list[schemas.CourseEventTypeExport]:
+def _export_course_event_types(event_types: list[Row]) -> list[schemas.CourseEventTypeExport]:
     return [
         schemas.CourseEventTypeExport(
             id=event_type.id,
@@ -121,11 +197,11 @@ def _export_course_event_types(course: models.Course) -> list[schemas.CourseEven
             color=event_type.color,
             icon=event_type.icon,
         )
-        for event_type in sorted(course.event_types, key=lambda item: (item.code or "", item.id))
+        for event_type in sorted(event_types, key=lambda item: (item.code or "", item.id))
     ]
 
 
-def _export_course_sections(course: models.Course) -> list[schemas.CourseSectionExport]:
+def _export_course_sections(sections: list[Row]) -> list[schemas.CourseSectionExport]:
     return [
         schemas.CourseSectionExport(
             id=section.id,
@@ -141,11 +217,11 @@ def _export_course_sections(course: models.Course) -> list[schemas.CourseSection
             startWeek=section.start_week,
             endWeek=section.end_week,
         )
-        for section in sorted(course.sections, key=lambda item: (item.day_of_week, item.start_time, item.section_id))
+        for section in sorted(sections, key=lambda item: (item.day_of_week, item.start_time, item.section_id))
     ]
 
 
-def _export_course_events(course: models.Course) -> list[schemas.CourseEventExport]:
+def _export_course_events(events: list[Row]) -> list[schemas.CourseEventExport]:
     return [
         schemas.CourseEventExport(
             id=event.id,
@@ -162,13 +238,14 @@ def _export_course_events(course: models.Course) -> list[schemas.CourseEventExpo
             skip=event.skip,
             note=event.note,
         )
-        for event in sorted(course.events, key=lambda item: (item.day_of_week, item.start_time, item.id))
+        for event in sorted(events, key=lambda item: (item.day_of_week, item.start_time, item.id))
     ]
 
 
 def _export_course(
     course: models.Course,
     *,
+    rows: dict[type, dict[str, list[Row]]],
     base_dir: Path,
     error_detail: Callable[[str, str], dict],
 ) -> schemas.CourseExport:
@@ -195,15 +272,15 @@ def _export_course(
         grade_scaled=course.grade_scaled,
         include_in_gpa=course.include_in_gpa,
         hide_gpa=course.hide_gpa,
-        widgets=[_export_widget(widget) for widget in course.widgets],
+        widgets=[_export_widget(widget) for widget in rows[models.Widget].get(course.id, ())],
         tabs=[_export_tab(tab) for tab in course.tabs],
-        plugin_settings=[_export_plugin_setting(setting) for setting in course.plugin_settings],
+        plugin_settings=[_export_plugin_setting(setting) for setting in rows[models.PluginSetting].get(course.id, ())],
         gradebook=gradebook.export_course_gradebook(course),
         resource_files=_export_course_resources(course, base_dir=base_dir, error_detail=error_detail),
         lms_link=lms_link,
-        event_types=_export_course_event_types(course),
-        sections=_export_course_sections(course),
-        events=_export_course_events(course),
+        event_types=_export_course_event_types(rows[models.CourseEventType].get(course.id, [])),
+        sections=_export_course_sections(rows[models.CourseSection].get(course.id, [])),
+        events=_export_course_events(rows[models.CourseEvent].get(course.id, [])),
     )
 
 
@@ -264,65 +341,121 @@ def _export_lms_integrations(db: Session, current_user: models.User) -> list[sch
     ]
 
 
-def export_user_data(
+def _export_program(
     db: Session,
-    current_user: models.User,
+    program: models.Program,
     *,
+    course_rows: dict[type, dict[str, list[Row]]],
+    semester_rows: dict[type, dict[str, list[Row]]],
     base_dir: Path,
     error_detail: Callable[[str, str], dict],
-) -> schemas.UserDataExport:
-    programs = crud.get_programs(db, user_id=current_user.id)
-    programs_export: list[schemas.ProgramExport] = []
-
-    for program in programs:
-        semesters_export: list[schemas.SemesterExport] = []
-        semester_courses_by_id = {course.id for semester in program.semesters for course in semester.courses}
-
-        for semester in program.semesters:
-            semesters_export.append(
-                schemas.SemesterExport(
-                    id=semester.id,
-                    name=semester.name,
-                    average_percentage=semester.average_percentage,
-                    average_scaled=semester.average_scaled,
-                    start_date=semester.start_date,
-                    end_date=semester.end_date,
-                    reading_week_start=semester.reading_week_start,
-                    reading_week_end=semester.reading_week_end,
-                    courses=[
-                        _export_course(course, base_dir=base_dir, error_detail=error_detail)
-                        for course in semester.courses
-                    ],
-                    widgets=[_export_widget(widget) for widget in semester.widgets],
-                    tabs=[_export_tab(tab) for tab in semester.tabs],
-                    plugin_settings=[_export_plugin_setting(setting) for setting in semester.plugin_settings],
-                    todo=_export_todo_state(db, semester),
-                )
-            )
-
-        programs_export.append(
-            schemas.ProgramExport(
-                id=program.id,
-                name=program.name,
-                cgpa_scaled=program.cgpa_scaled,
-                cgpa_percentage=program.cgpa_percentage,
-                gpa_scaling_table=program.gpa_scaling_table,
-                subject_color_map=program.subject_color_map or "{}",
-                grad_requirement_credits=program.grad_requirement_credits,
-                hide_gpa=program.hide_gpa,
-                program_timezone=program.program_timezone or "UTC",
-                lms_integration_id=program.lms_integration_id,
+) -> schemas.ProgramExport:
+    semesters_export: list[schemas.SemesterExport] = []
+    semester_courses_by_id = {course.id for semester in program.semesters for course in semester.courses}
+
+    for semester in program.semesters:
+        semesters_export.append(
+            schemas.SemesterExport(
+                id=semester.id,
+                name=semester.name,
+                average_percentage=semester.average_percentage,
+                average_scaled=semester.average_scaled,
+                start_date=semester.start_date,
+                end_date=semester.end_date,
+                reading_week_start=semester.reading_week_start,
+                reading_week_end=semester.reading_week_end,
                 courses=[
-                    _export_course(course, base_dir=base_dir, error_detail=error_detail)
-                    for course in program.courses
-                    if course.id not in semester_courses_by_id
+                    _export_course(course, rows=course_rows, base_dir=base_dir, error_detail=error_detail)
+                    for course in semester.courses
                 ],
-                semesters=semesters_export,
+                widgets=[_export_widget(widget) for widget in semester_rows[models.Widget].get(semester.id, ())],
+                tabs=[_export_tab(tab) for tab in semester.tabs],
+                plugin_settings=[
+                    _export_plugin_setting(setting)
+                    for setting in semester_rows[models.PluginSetting].get(semester.id, ())
+                ],
+                todo=_export_todo_state(db, semester),
             )
         )
 
+    return schemas.ProgramExport(
+        id=program.id,
+        name=program.name,
+        cgpa_scaled=program.cgpa_scaled,
+        cgpa_percentage=program.cgpa_percentage,
+        gpa_scaling_table=program.gpa_scaling_table,
+        subject_color_map=program.subject_color_map or "{}",
+        grad_requirement_credits=program.grad_requirement_credits,
+        hide_gpa=program.hide_gpa,
+        program_timezone=program.program_timezone or "UTC",
+        lms_integration_id=program.lms_integration_id,
+        courses=[
+            _export_course(course, rows=course_rows, base_dir=base_dir, error_detail=error_detail)
+            for course in program.courses
+            if course.id not in semester_courses_by_id
+        ],
+        semesters=semesters_export,
+    )
+
+
+def _iter_program_exports(
+    db: Session,
+    current_user: models.User,
+    *,
+    base_dir: Path,
+    error_detail: Callable[[str, str], dict],
+) -> Iterator[schemas.ProgramExport]:
+    # Only one batch of Program trees (and their base64 resource payloads) is alive at a time.
+    program_ids = [program_id for _name, program_id in crud.get_program_names(db, current_user.id)]
+    for start in range(0, len(program_ids), EXPORT_PROGRAM_BATCH_SIZE):
+        programs = crud.get_programs_by_ids(
+            db,
+            current_user.id,
+            program_ids[start:start + EXPORT_PROGRAM_BATCH_SIZE],
+            load_options=EXPORT_LOAD_OPTIONS,
+        )
+        course_ids = [course.id for program in programs for course in program.courses]
+        semester_ids = [semester.id for program in programs for semester in program.semesters]
+        course_rows = {
+            model: _load_export_rows(db, model, model.course_id, course_ids) for model in _EXPORT_COURSE_ROW_MODELS
+        }
+        semester_rows = {
+            model: _load_export_rows(db, model, model.semester_id, semester_ids)
+            for model in _EXPORT_SEMESTER_ROW_MODELS
+        }
+        for program in programs:
+            yield _export_program(
+                db,
+                program,
+                course_rows=course_rows,
+                semester_rows=semester_rows,
+                base_dir=base_dir,
+                error_detail=error_detail,
+            )
+
+
+def stream_user_data_export(
+    db: Session,
+    current_user: models.User,
+    *,
+    base_dir: Path,
+    error_detail: Callable[[str, str], dict],
+) -> Iterator[bytes]:
+    # Errors raised once streaming starts would arrive as a truncated 200 body, so the
+    # stored resource files are checked up front while an error response is still possible.
+    _check_export_resource_files(db, current_user, base_dir=base_dir, error_detail=error_detail)
+    return _iter_user_data_export(db, current_user, base_dir=base_dir, error_detail=error_detail)
+
+
+def _iter_user_data_export(
+    db: Session,
+    current_user: models.User,
+    *,
+    base_dir: Path,
+    error_detail: Callable[[str, str], dict],
+) -> Iterator[bytes]:
     user_setting = crud.get_user_setting_dict(current_user)
-    return schemas.UserDataExport(
+    envelope = schemas.UserDataExport(
         version=BACKUP_FORMAT_VERSION,
         exported_at=datetime.now(UTC).isoformat(),
         settings=schemas.UserSettingsExport(
@@ -332,70 +465,101 @@ def export_user_data(
             background_plugin_preload=user_setting["background_plugin_preload"],
         ),
         lms_integrations=_export_lms_integrations(db, current_user),
-        programs=programs_export,
+        programs=[],
     )
-
-
-def _import_widgets(
-    db: Session,
+    # `programs` is the last UserDataExport field, so the envelope serializes to `...,"programs":[]}`;
+    # reopen that list and stream each program into it as it is built.
+    yield envelope.model_dump_json(by_alias=True).removesuffix("]}").encode()
+    for index, program_export in enumerate(
+        _iter_program_exports(db, current_user, base_dir=base_dir, error_detail=error_detail)
+    ):
+        if index:
+            yield b","
+        yield program_export.model_dump_json(by_alias=True).encode()
+    yield b"]}"
+
+
+@dataclass
+class _ImportRows:
+    """Child rows gathered while walking one program export, inserted together afterwards."""
+
+    widgets: list[dict[str, Any]] = field(default_factory=list)
+    tabs: list[dict[str, Any]] = field(default_factory=list)
+    plugin_settings: list[dict[str, Any]] = field(default_factory=list)
+    replaced_event_type_course_ids: list[str] = field(default_factory=list)
+    event_types: list[dict[str, Any]] = field(default_factory=list)
+    sections: list[dict[str, Any]] = field(default_factory=list)
+    events: list[dict[str, Any]] = field(default_factory=list)
+    lms_links: list[dict[str, Any]] = field(default_factory=list)
+    todo_sections: list[dict[str, Any]] = field(default_factory=list)
+    todo_tasks: list[dict[str, Any]] = field(default_factory=list)
+    resources: list[tuple[str, list[schemas.CourseResourceExport]]] = field(default_factory=list)
+
+
+def _collect_widgets(
+    rows: _ImportRows,
     widgets: list[schemas.WidgetExport],
     *,
     semester_id: Optional[str] = None,
     course_id: Optional[str] = None,
 ) -> None:
     for widget_data in widgets:
-        crud.create_widget(
-            db=db,
-            widget=schemas.WidgetCreate(
-                widget_type=widget_data.widget_type,
-                layout_config=widget_data.layout_config,
-                settings=widget_data.settings,
-                is_removable=widget_data.is_removable,
-            ),
-            semester_id=semester_id,
-            course_id=course_id,
+        widget = schemas.WidgetCreate(
+            widget_type=widget_data.widget_type,
+            layout_config=widget_data.layout_config,
+            settings=widget_data.settings,
+            is_removable=widget_data.is_removable,
         )
+        rows.widgets.append(dict(widget.model_dump(), semester_id=semester_id, course_id=course_id))
 
 
-def _import_tabs(
-    db: Session,
+def _collect_tabs(
+    rows: _ImportRows,
     tabs: list[schemas.TabExport],
     *,
     semester_id: Optional[str] = None,
     course_id: Optional[str] = None,
 ) -> None:
     for tab_data in tabs:
-        crud.create_tab(
-            db=db,
-            tab=schemas.TabCreate(
-                tab_type=tab_data.tab_type,
-                settings=tab_data.settings,
-                order_index=tab_data.order_index,
-                is_removable=tab_data.is_removable,
-                is_draggable=tab_data.is_draggable,
-            ),
-            semester_id=semester_id,
-            course_id=course_id,
+        tab = schemas.TabCreate(
+            tab_type=tab_data.tab_type,
+            settings=tab_data.settings,
+            order_index=tab_data.order_index,
+            is_removable=tab_data.is_removable,
+            is_draggable=tab_data.is_draggable,
         )
+        rows.tabs.append(dict(tab.model_dump(), semester_id=semester_id, course_id=course_id))
 
 
-def _import_plugin_settings(
-    db: Session,
+def _collect_plugin_settings(
+    rows: _ImportRows,
     settings: list[schemas.PluginSettingExport],
     *,
     semester_id: Optional[str] = None,
     course_id: Optional[str] = None,
 ) -> None:
-    for plugin_setting_data in settings:
-        crud.upsert_plugin_setting(
-            db=db,
-            plugin_setting=schemas.PluginSettingCreate(
-                plugin_id=plugin_setting_data.plugin_id,
-                settings=plugin_setting_data.settings,
-            ),
-            semester_id=semester_id,
-            course_id=course_id,
-        )
+    # Repeated plugin ids keep the last payload, matching the upsert these rows replace.
+    settings_by_plugin_id = {item.plugin_id: item.settings for item in settings}
+    rows.plugin_settings.extend(
+        {"plugin_id": plugin_id, "settings": value, "semester_id": semester_id, "course_id": course_id}
+        for plugin_id, value in settings_by_plugin_id.items()
+    )
+
+
+def _check_course_resources(
+    resources: list[schemas.CourseResourceExport],
+    *,
+    error_detail: Callable[[str, str], dict],
+) -> None:
+    for resource_data in resources:
+        if resource_data.resource_kind != "link" and not resource_data.content_base64:
+            raise HTTPException(
+                status_code=422,
+                detail=error_detail(
+                    "BACKUP_RESOURCE_CONTENT_MISSING",
+                    f"Resource '{resource_data.filename_display}' is missing file content.",
+                ),
+            )
 
 
 def _import_course_resources(
@@ -405,7 +569,6 @@ def _import_course_resources(
     course_id: str,
     current_user: models.User,
     base_dir: Path,
-    error_detail: Callable[[str, str], dict],
 ) -> None:
     for resource_data in resources:
         if resource_data.resource_kind == "link":
@@ -416,15 +579,6 @@ def _import_course_resources(
                 filename_display=resource_data.filename_display,
             )
             continue
-
-        if not resource_data.content_base64:
-            raise HTTPException(
-                status_code=422,
-                detail=error_detail(
-                    "BACKUP_RESOURCE_CONTENT_MISSING",
-                    f"Resource '{resource_data.filename_display}' is missing file content.",
-                ),
-            )
         course_resources.create_course_resource(
             db=db,
             base_dir=base_dir,
@@ -437,201 +591,246 @@ def _import_course_resources(
         )
 
 
-def _import_course_event_types(
-    db: Session,
+def _collect_course_event_types(
+    rows: _ImportRows,
     course_id: str,
     event_types: list[schemas.CourseEventTypeExport],
     *,
-    touch_model_timestamp: Callable[[object], None],
+    now_iso: str,
 ) -> None:
     if not event_types:
         return
-    db.query(models.CourseEventType).filter(models.CourseEventType.course_id == course_id).delete(synchronize_session=False)
-    db.commit()
-    for event_type_data in event_types:
-        row = models.CourseEventType(
-            course_id=course_id,
-            code=event_type_data.code,
-            abbreviation=event_type_data.abbreviation,
-            track_attendance=event_type_data.track_attendance,
-            color=event_type_data.color,
-            icon=event_type_data.icon,
-            created_at="",
-            updated_at="",
-        )
-        touch_model_timestamp(row)
-        db.add(row)
-    db.commit()
+    rows.replaced_event_type_course_ids.append(course_id)
+    rows.event_types.extend(
+        {
+            "course_id": course_id,
+            "code": event_type_data.code,
+            "abbreviation": event_type_data.abbreviation,
+            "track_attendance": event_type_data.track_attendance,
+            "color": event_type_data.color,
+            "icon": event_type_data.icon,
+            "created_at": now_iso,
+            "updated_at": now_iso,
+        }
+        for event_type_data in event_types
+    )
 
 
-def _import_course_sections(
+def _collect_course_sections(
     db: Session,
+    rows: _ImportRows,
     course_id: str,
     sections: list[schemas.CourseSectionExport],
     *,
+    event_type_codes: set[str] | frozenset[str],
     runtime: BackupRuntimeCallbacks,
+    now_iso: str,
 ) -> None:
+    # event_type_codes are the codes the course will hold once rows.event_types is inserted,
+    # so sections validate here without reading event types back per section.
     for section_data in sections:
         payload = section_data.model_dump(by_alias=False, exclude={"id"})
-        runtime.validate_day_of_week(int(payload["day_of_week"]))
-        runtime.validate_time_range(payload["start_time"], payload["end_time"])
-        runtime.validate_week_range(payload["start_week"], payload["end_week"], "SECTION")
-        runtime.validate_section_id(payload["section_id"])
-        payload["week_pattern"] = runtime.normalize_week_pattern_input(payload["week_pattern"])
-        runtime.validate_section_payload(course_id, payload, db)
-        row = models.CourseSection(course_id=course_id, **payload)
-        runtime.touch_model_timestamp(row)
-        db.add(row)
-    db.commit()
+        runtime.validate_section_payload(course_id, payload, db, event_type_codes, allow_unpadded_times=True)
+        rows.sections.append(dict(payload, course_id=course_id, created_at=now_iso, updated_at=now_iso))
 
 
-def _import_course_events(
-    db: Session,
+def _collect_course_events(
+    rows: _ImportRows,
     course_id: str,
     events: list[schemas.CourseEventExport],
     *,
     runtime: BackupRuntimeCallbacks,
+    now_iso: str,
 ) -> None:
     for event_data in events:
         payload = event_data.model_dump(by_alias=False, exclude={"id"})
         runtime.validate_day_of_week(int(payload["day_of_week"]))
-        runtime.validate_time_range(payload["start_time"], payload["end_time"])
+        runtime.validate_time_range(payload["start_time"], payload["end_time"], allow_unpadded=True)
         runtime.validate_week_range(payload["start_week"], payload["end_week"], "EVENT")
         payload["week_pattern"] = runtime.normalize_week_pattern_input(payload["week_pattern"])
-        row = models.CourseEvent(course_id=course_id, **payload)
-        runtime.touch_model_timestamp(row)
-        db.add(row)
-    db.commit()
+        rows.events.append(dict(payload, course_id=course_id, created_at=now_iso, updated_at=now_iso))
 
 
-def _import_course_lms_link(
-    db: Session,
+def _collect_course_lms_link(
+    rows: _ImportRows,
     *,
-    course: models.Course,
+    course_id: str,
+    program_id: str,
     link_data: Optional[schemas.LmsCourseLinkExport],
     integration_id_map: dict[str, str],
-    now_utc_iso: Callable[[], str],
+    now_iso: str,
 ) -> None:
     if link_data is None or not link_data.lms_integration_id:
         return
     mapped_integration_id = integration_id_map.get(link_data.lms_integration_id)
     if not mapped_integration_id:
         return
-    row = models.CourseLmsLink(
-        course_id=course.id,
-        program_id=course.program_id,
-        lms_integration_id=mapped_integration_id,
-        external_course_id=link_data.external_course_id,
-        external_course_code=link_data.external_course_code,
-        external_name=link_data.external_name,
-        sync_enabled=link_data.sync_enabled,
-        last_synced_at=link_data.last_synced_at,
-        last_error_code=link_data.last_error.code if link_data.last_error else None,
-        last_error_message=link_data.last_error.message if link_data.last_error else None,
-        created_at=now_utc_iso(),
-        updated_at=now_utc_iso(),
+    rows.lms_links.append(
+        {
+            "course_id": course_id,
+            "program_id": program_id,
+            "lms_integration_id": mapped_integration_id,
+            "external_course_id": link_data.external_course_id,
+            "external_course_code": link_data.external_course_code,
+            "external_name": link_data.external_name,
+            "sync_enabled": link_data.sync_enabled,
+            "last_synced_at": link_data.last_synced_at,
+            "last_error_code": link_data.last_error.code if link_data.last_error else None,
+            "last_error_message": link_data.last_error.message if link_data.last_error else None,
+            "created_at": now_iso,
+            "updated_at": now_iso,
+        }
     )
-    db.add(row)
-    db.commit()
 
 
-def _import_course_export(
+def _import_course_exports(
     db: Session,
+    rows: _ImportRows,
     *,
-    course_data: schemas.CourseExport,
+    course_datas: list[schemas.CourseExport],
     program_id: str,
     semester_id: Optional[str],
-    current_user: models.User,
     integration_id_map: dict[str, str],
-    base_dir: Path,
     runtime: BackupRuntimeCallbacks,
-) -> models.Course:
-    course = crud.create_course(
-        db=db,
-        course=schemas.CourseCreate(
-            name=course_data.name,
-            alias=course_data.alias,
-            category=course_data.category,
-            color=course_data.color,
-            credits=course_data.credits,
-            grade_percentage=course_data.grade_percentage,
-            grade_scaled=course_data.grade_scaled,
-            include_in_gpa=course_data.include_in_gpa,
-            hide_gpa=course_data.hide_gpa,
-        ),
-        program_id=program_id,
-        semester_id=semester_id,
-    )
-    _import_widgets(db, course_data.widgets, course_id=course.id)
-    _import_tabs(db, course_data.tabs, course_id=course.id)
-    _import_plugin_settings(db, course_data.plugin_settings, course_id=course.id)
-    if course_data.gradebook is not None:
-        gradebook.import_course_gradebook(db, course.id, course_data.gradebook)
-    _import_course_event_types(db, course.id, course_data.event_types, touch_model_timestamp=runtime.touch_model_timestamp)
-    _import_course_sections(db, course.id, course_data.sections, runtime=runtime)
-    _import_course_events(db, course.id, course_data.events, runtime=runtime)
-    _import_course_resources(
-        db,
-        course_data.resource_files,
-        course_id=course.id,
-        current_user=current_user,
-        base_dir=base_dir,
-        error_detail=runtime.error_detail,
-    )
-    _import_course_lms_link(
-        db,
-        course=course,
-        link_data=course_data.lms_link,
-        integration_id_map=integration_id_map,
-        now_utc_iso=runtime.now_utc_iso,
-    )
-    return course
+    now_iso: str,
+) -> list[str]:
+    # Course rows go through crud.create_courses so built-in event types, gradebooks and stats
+    # are set up as usual, one INSERT per table per batch; everything hanging off a course is
+    # collected for the batched insert. Only ids are kept, so each batch's Course objects can
+    # leave the session's weakly-referencing identity map before the next one is created.
+    course_ids: list[str] = []
+    for start in range(0, len(course_datas), IMPORT_COURSE_BATCH_SIZE):
+        batch = course_datas[start : start + IMPORT_COURSE_BATCH_SIZE]
+        batch_ids = [
+            course.id
+            for course in crud.create_courses(
+                db=db,
+                courses=[
+                    schemas.CourseCreate(
+                        name=course_data.name,
+                        alias=course_data.alias,
+                        category=course_data.category,
+                        color=course_data.color,
+                        credits=course_data.credits,
+                        grade_percentage=course_data.grade_percentage,
+                        grade_scaled=course_data.grade_scaled,
+                        include_in_gpa=course_data.include_in_gpa,
+                        hide_gpa=course_data.hide_gpa,
+                    )
+                    for course_data in batch
+                ],
+                program_id=program_id,
+                semester_id=semester_id,
+                auto_commit=False,
+            )
+        ]
+        for course_id, course_data in zip(batch_ids, batch):
+            _collect_widgets(rows, course_data.widgets, course_id=course_id)
+            _collect_tabs(rows, course_data.tabs, course_id=course_id)
+            _collect_plugin_settings(rows, course_data.plugin_settings, course_id=course_id)
+            if course_data.gradebook is not None:
+                gradebook.import_course_gradebook(db, course_id, course_data.gradebook, auto_commit=False)
+            _collect_course_event_types(rows, course_id, course_data.event_types, now_iso=now_iso)
+            _collect_course_sections(
+                db,
+                rows,
+                course_id,
+                course_data.sections,
+                event_type_codes={event_type.code for event_type in course_data.event_types} or _BUILTIN_EVENT_TYPE_CODES,
+                runtime=runtime,
+                now_iso=now_iso,
+            )
+            _collect_course_events(rows, course_id, course_data.events, runtime=runtime, now_iso=now_iso)
+            _check_course_resources(course_data.resource_files, error_detail=runtime.error_detail)
+            if course_data.resource_files:
+                rows.resources.append((course_id, course_data.resource_files))
+            _collect_course_lms_link(
+                rows,
+                course_id=course_id,
+                program_id=program_id,
+                link_data=course_data.lms_link,
+                integration_id_map=integration_id_map,
+                now_iso=now_iso,
+            )
+        course_ids.extend(batch_ids)
+    return course_ids
 
 
-def _import_semester_todo(
-    db: Session,
+def _collect_semester_todo(
+    rows: _ImportRows,
     *,
-    semester: models.Semester,
+    semester_id: str,
     todo_data: Optional[schemas.TodoSemesterExport],
     course_id_map: dict[str, str],
-    touch_model_timestamp: Callable[[object], None],
+    now_iso: str,
 ) -> None:
     if todo_data is None:
         return
 
     section_id_map: dict[str, str] = {}
     for section_data in todo_data.sections:
-        row = models.TodoSection(
-            id=models.generate_uuid(),
-            semester_id=semester.id,
-            name=section_data.name,
-            created_at=section_data.created_at or "",
-            updated_at=section_data.updated_at or "",
+        section_id = models.generate_uuid()
+        rows.todo_sections.append(
+            {
+                "id": section_id,
+                "semester_id": semester_id,
+                "name": section_data.name,
+                "created_at": section_data.created_at or now_iso,
+                "updated_at": now_iso,
+            }
         )
-        touch_model_timestamp(row)
-        db.add(row)
-        section_id_map[section_data.id or row.id] = row.id
-    db.commit()
+        section_id_map[section_data.id or section_id] = section_id
 
     for task_data in todo_data.tasks:
-        row = models.TodoTask(
-            id=models.generate_uuid(),
-            semester_id=semester.id,
-            course_id=course_id_map.get(task_data.course_id) if task_data.course_id else None,
-            section_id=section_id_map.get(task_data.section_id) if task_data.section_id else None,
-            origin_section_id=section_id_map.get(task_data.origin_section_id) if task_data.origin_section_id else None,
-            title=task_data.title,
-            note=task_data.note,
-            due_date=task_data.due_date,
-            due_time=task_data.due_time,
-            priority=task_data.priority,
-            completed=task_data.completed,
-            created_at=task_data.created_at or "",
-            updated_at=task_data.updated_at or "",
+        rows.todo_tasks.append(
+            {
+                "id": models.generate_uuid(),
+                "semester_id": semester_id,
+                "course_id": course_id_map.get(task_data.course_id) if task_data.course_id else None,
+                "section_id": section_id_map.get(task_data.section_id) if task_data.section_id else None,
+                "origin_section_id": (
+                    section_id_map.get(task_data.origin_section_id) if task_data.origin_section_id else None
+                ),
+                "title": task_data.title,
+                "note": task_data.note,
+                "due_date": task_data.due_date,
+                "due_time": task_data.due_time,
+                "priority": task_data.priority,
+                "completed": task_data.completed,
+                "created_at": task_data.created_at or now_iso,
+                "updated_at": now_iso,
+            }
+        )
+
+
+def _insert_import_rows(db: Session, rows: _ImportRows) -> None:
+    # Parents are inserted before children so every batch satisfies its foreign keys.
+    for model, batch in (
+        (models.Widget, rows.widgets),
+        (models.Tab, rows.tabs),
+        (models.PluginSetting, rows.plugin_settings),
+    ):
+        if batch:
+            db.execute(insert(model), batch)
+
+    if rows.replaced_event_type_course_ids:
+        db.execute(
+            delete(models.CourseEventType).where(
+                models.CourseEventType.course_id.in_(rows.replaced_event_type_course_ids)
+            )
         )
-        touch_model_timestamp(row)
-        db.add(row)
-    db.commit()
+    if rows.event_types:
+        db.execute(insert(models.CourseEventType), rows.event_types)
+
+    for model, batch in (
+        (models.CourseSection, rows.sections),
+        (models.CourseEvent, rows.events),
+        (models.CourseLmsLink, rows.lms_links),
+        (models.TodoSection, rows.todo_sections),
+        (models.TodoTask, rows.todo_tasks),
+    ):
+        if batch:
+            db.execute(insert(model), batch)
 
 
 def _import_lms_integrations(
@@ -642,28 +841,34 @@ def _import_lms_integrations(
     now_utc_iso: Callable[[], str],
 ) -> dict[str, str]:
     integration_id_map: dict[str, str] = {}
+    integration_rows: list[dict[str, Any]] = []
+    now_iso = now_utc_iso()
     for integration_data in payloads:
         provider_impl = lms_service.get_lms_provider(integration_data.provider)
         config = provider_impl.normalize_integration_config(integration_data.config)
         credentials = provider_impl.normalize_integration_credentials(integration_data.credentials)
-        row = models.LmsIntegration(
-            user_id=current_user.id,
-            display_name=integration_data.display_name,
-            provider=provider_impl.provider,
-            status=(integration_data.status or "connected").strip() or "connected",
-            config_json=json.dumps(config, separators=(",", ":"), sort_keys=True),
-            credentials_encrypted=encrypt_credentials(credentials),
-            last_checked_at=integration_data.last_checked_at,
-            last_error_code=integration_data.last_error.code if integration_data.last_error else None,
-            last_error_message=integration_data.last_error.message if integration_data.last_error else None,
-            created_at=now_utc_iso(),
-            updated_at=now_utc_iso(),
+        integration_id = models.generate_uuid()
+        integration_rows.append(
+            {
+                "id": integration_id,
+                "user_id": current_user.id,
+                "display_name": integration_data.display_name,
+                "provider": provider_impl.provider,
+                "status": (integration_data.status or "connected").strip() or "connected",
+                "config_json": json.dumps(config, separators=(",", ":"), sort_keys=True),
+                "credentials_encrypted": encrypt_credentials(credentials),
+                "last_checked_at": integration_data.last_checked_at,
+                "last_error_code": integration_data.last_error.code if integration_data.last_error else None,
+                "last_error_message": integration_data.last_error.message if integration_data.last_error else None,
+                "created_at": now_iso,
+                "updated_at": now_iso,
+            }
         )
-        db.add(row)
-        db.commit()
-        db.refresh(row)
         if integration_data.id:
-            integration_id_map[integration_data.id] = row.id
+            integration_id_map[integration_data.id] = integration_id
+    if integration_rows:
+        db.execute(insert(models.LmsIntegration), integration_rows)
+        db.commit()
     return integration_id_map
 
 
@@ -680,8 +885,7 @@ def import_user_data(
     if conflict_mode not in ["skip", "overwrite", "rename"]:
         raise HTTPException(status_code=400, detail="conflict_mode must be 'skip', 'overwrite', or 'rename'")
 
-    existing_programs = crud.get_programs(db, user_id=current_user.id)
-    existing_names = {program.name.lower(): program for program in existing_programs}
+    existing_names = {name.lower(): program_id for name, program_id in crud.get_program_names(db, user_id=current_user.id)}
 
     if include_settings and data.settings:
         user_setting = crud.get_user_setting_dict(current_user)
@@ -710,7 +914,7 @@ def import_user_data(
     imported_semesters = 0
     imported_courses = 0
 
-    def import_program_data(program_data: schemas.ProgramExport, program_name: str) -> None:
+    def import_program_data(program_data: schemas.ProgramExport, program_name: str) -> str:
         nonlocal imported_programs, imported_semesters, imported_courses
 
         mapped_integration_id = integration_id_map.get(program_data.lms_integration_id) if program_data.lms_integration_id else None
@@ -728,22 +932,28 @@ def import_user_data(
                 lms_integration_id=mapped_integration_id,
             ),
             user_id=current_user.id,
+            auto_commit=False,
         )
         imported_programs += 1
+        rows = _ImportRows()
+        now_iso = runtime.now_utc_iso()
 
-        for course_data in program_data.courses:
-            _import_course_export(
+        imported_courses += len(
+            _import_course_exports(
                 db,
-                course_data=course_data,
+                rows,
+                course_datas=program_data.courses,
                 program_id=program.id,
                 semester_id=None,
-                current_user=current_user,
                 integration_id_map=integration_id_map,
-                base_dir=base_dir,
                 runtime=runtime,
+                now_iso=now_iso,
             )
-            imported_courses += 1
+        )
 
+        # Semester ids are assigned up front so the whole level goes in as one batch
+        # before any semester course references it.
+        semester_rows: list[dict[str, Any]] = []
         for semester_data in program_data.semesters:
             start_date = semester_data.start_date
             end_date = semester_data.end_date
@@ -757,52 +967,68 @@ def import_user_data(
                 semester_data.reading_week_start,
                 semester_data.reading_week_end,
             )
+            semester_rows.append(
+                {
+                    "id": models.generate_uuid(),
+                    "program_id": program.id,
+                    "name": semester_data.name,
+                    "average_percentage": semester_data.average_percentage,
+                    "average_scaled": semester_data.average_scaled,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "reading_week_start": semester_data.reading_week_start,
+                    "reading_week_end": semester_data.reading_week_end,
+                }
+            )
+        if semester_rows:
+            db.execute(insert(models.Semester), semester_rows)
+        imported_semesters += len(semester_rows)
+
+        for semester_data, semester_row in zip(program_data.semesters, semester_rows):
+            semester_id = semester_row["id"]
+            _collect_widgets(rows, semester_data.widgets, semester_id=semester_id)
+            _collect_tabs(rows, semester_data.tabs, semester_id=semester_id)
+            _collect_plugin_settings(rows, semester_data.plugin_settings, semester_id=semester_id)
 
-            semester = models.Semester(
+            course_ids = _import_course_exports(
+                db,
+                rows,
+                course_datas=semester_data.courses,
                 program_id=program.id,
-                name=semester_data.name,
-                average_percentage=semester_data.average_percentage,
-                average_scaled=semester_data.average_scaled,
-                start_date=start_date,
-                end_date=end_date,
-                reading_week_start=semester_data.reading_week_start,
-                reading_week_end=semester_data.reading_week_end,
+                semester_id=semester_id,
+                integration_id_map=integration_id_map,
+                runtime=runtime,
+                now_iso=now_iso,
             )
-            db.add(semester)
-            db.commit()
-            db.refresh(semester)
-            imported_semesters += 1
-
-            _import_widgets(db, semester_data.widgets, semester_id=semester.id)
-            _import_tabs(db, semester_data.tabs, semester_id=semester.id)
-            _import_plugin_settings(db, semester_data.plugin_settings, semester_id=semester.id)
-
-            course_id_map: dict[str, str] = {}
-            for course_data in semester_data.courses:
-                course = _import_course_export(
-                    db,
-                    course_data=course_data,
-                    program_id=program.id,
-                    semester_id=semester.id,
-                    current_user=current_user,
-                    integration_id_map=integration_id_map,
-                    base_dir=base_dir,
-                    runtime=runtime,
-                )
-                if course_data.id:
-                    course_id_map[course_data.id] = course.id
-                imported_courses += 1
-
-            _import_semester_todo(
-                db,
-                semester=semester,
+            course_id_map = {
+                course_data.id: course_id
+                for course_data, course_id in zip(semester_data.courses, course_ids)
+                if course_data.id
+            }
+            imported_courses += len(course_ids)
+
+            _collect_semester_todo(
+                rows,
+                semester_id=semester_id,
                 todo_data=semester_data.todo,
                 course_id_map=course_id_map,
-                touch_model_timestamp=runtime.touch_model_timestamp,
+                now_iso=now_iso,
             )
 
+        _insert_import_rows(db, rows)
         logic.recalculate_all_stats(program, db)
+        # Resource files are written to disk and commit one by one, so they follow the program commit.
+        for course_id, resources in rows.resources:
+            _import_course_resources(
+                db,
+                resources,
+                course_id=course_id,
+                current_user=current_user,
+                base_dir=base_dir,
+            )
+        return program.id
 
+    rename_suffixes: dict[str, int] = {}
     for program_data in data.programs:
         name_lower = program_data.name.lower()
         if name_lower in existing_names:
@@ -810,22 +1036,22 @@ def import_user_data(
                 skipped_programs += 1
                 continue
             if conflict_mode == "overwrite":
-                existing_program = existing_names[name_lower]
-                crud.delete_program(db, program_id=existing_program.id, user_id=current_user.id)
-                import_program_data(program_data, program_data.name)
-                existing_names[name_lower] = True
+                # The cascading DELETE commits together with the rebuilt program, so a rejected
+                # import leaves the existing program in place.
+                crud.delete_program(db, program_id=existing_names[name_lower], user_id=current_user.id, auto_commit=False)
+                existing_names[name_lower] = import_program_data(program_data, program_data.name)
                 continue
-            suffix = 2
+            # Resume from the last suffix handed out for this name instead of rescanning from 2.
+            suffix = rename_suffixes.get(name_lower, 2)
             next_name = f"{program_data.name} ({suffix})"
             while next_name.lower() in existing_names:
                 suffix += 1
                 next_name = f"{program_data.name} ({suffix})"
-            import_program_data(program_data, next_name)
-            existing_names[next_name.lower()] = True
+            rename_suffixes[name_lower] = suffix + 1
+            existing_names[next_name.lower()] = import_program_data(program_data, next_name)
             continue
 
-        import_program_data(program_data, program_data.name)
-        existing_names[name_lower] = True
+        existing_names[name_lower] = import_program_data(program_data, program_data.name)
 
     return {
         "ok": True,
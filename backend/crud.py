@@ -1,31 +1,97 @@
 # input:  [SQLAlchemy session, models, schemas, shared color helpers, and timezone/date helpers]
-# output: [CRUD functions for users, tasks, courses, widgets, plugin-shared settings, user settings including background plugin preload preference defaults, gradebook initialization, validated course-to-semester reassignment, and stable Program subject-color synchronization]
+# output: [CRUD functions for users (with a short-TTL per-engine user lookup cache), tasks, courses, widgets and tabs (including semester/course-specialized create helpers and single-statement UPDATE ... RETURNING edits), plugin-shared settings, user settings including background plugin preload preference defaults, gradebook initialization, bulk ICS course creation, validated course-to-semester reassignment, and stable Program subject-color synchronization for paged or id-batched Program loads (reusing eager-loaded courses, otherwise one batched course-name read)]
 # pos:    [Database access layer for backend services, normalized user-setting persistence, gradebook-backed course creation, and stat-safe course/semester mutations]
 #
 # ⚠️ When this file is updated:
 #    1. Update these header comments
 #    2. Update the INDEX.md of the folder this file belongs to
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, make_transient_to_detached
+from sqlalchemy import case, delete, func, insert, inspect as sa_inspect, select, update
+import hashlib
+import hmac
 import json
+import os
+import secrets
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import date, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from color_utils import parse_subject_color_map, resolve_subject_code, resolve_subject_color_assignments, serialize_subject_color_map
 import models
 import schemas
-import bcrypt
 import gradebook
 
 DEFAULT_GPA_SCALING = '{"90-100": 4.0, "85-89": 4.0, "80-84": 3.7, "77-79": 3.3, "73-76": 3.0, "70-72": 2.7, "67-69": 2.3, "63-66": 2.0, "60-62": 1.7, "57-59": 1.3, "53-56": 1.0, "50-52": 0.7, "0-49": 0}'
 DEFAULT_COURSE_CREDIT = 0.5
 DEFAULT_PROGRAM_TIMEZONE = "UTC"
 DEFAULT_SEMESTER_LENGTH_DAYS = 111
+# Each bcrypt round doubles hashing cost; 12 -> 10 makes signup/login hashing ~4x cheaper.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_HASH_LENGTHS = (59, 60)
+PASSWORD_VERIFY_CACHE_SIZE = 4096
+PASSWORD_VERIFY_CACHE_TTL_SECONDS = 300
+ARGON2_HASH_PREFIX = "$argon2"
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST_KIB = 65536
+ARGON2_PARALLELISM = 1
+_bcrypt = None
+_argon2_hasher = None
+_argon2_checked = False
+# Per-process pepper so cache keys never hold a reusable digest of the raw password.
+_PASSWORD_VERIFY_PEPPER = secrets.token_bytes(32)
+_password_verify_cache: OrderedDict[bytes, float] = OrderedDict()
+_password_verify_cache_lock = threading.Lock()
+USER_CACHE_SIZE = 8192
+USER_CACHE_TTL_SECONDS = 30
+_USER_COLUMN_KEYS = tuple(attr.key for attr in sa_inspect(models.User).column_attrs)
+# One cache per engine so separate databases (e.g. per-test in-memory engines) never share rows.
+_user_caches: "weakref.WeakKeyDictionary[object, OrderedDict[tuple[str, str], tuple[float, dict]]]" = weakref.WeakKeyDictionary()
+_user_cache_lock = threading.RLock()
 BUILTIN_EVENT_TYPES = [
     {"code": "LECTURE", "abbreviation": "LEC"},
     {"code": "TUTORIAL", "abbreviation": "TUT"},
     {"code": "PRACTICAL", "abbreviation": "PRA"},
 ]
+_BUILTIN_EVENT_TYPE_ROWS = tuple(
+    {
+        "code": builtin_type["code"],
+        "abbreviation": builtin_type["abbreviation"],
+        "track_attendance": False,
+        "created_at": "",
+        "updated_at": "",
+    }
+    for builtin_type in BUILTIN_EVENT_TYPES
+)
+_DEFAULT_USER_SETTING = {
+    "gpa_scaling_table": DEFAULT_GPA_SCALING,
+    "default_course_credit": DEFAULT_COURSE_CREDIT,
+    "background_plugin_preload": True,
+}
+_DEFAULT_USER_SETTING_JSON = json.dumps(_DEFAULT_USER_SETTING)
+
+
+# Fields whose change requires GPA stats to be recomputed (including stored results a client may overwrite).
+COURSE_STATS_FIELDS = ("grade_percentage", "grade_scaled", "credits", "include_in_gpa", "semester_id")
+SEMESTER_STATS_FIELDS = ("average_percentage", "average_scaled")
+PROGRAM_STATS_FIELDS = ("gpa_scaling_table", "cgpa_scaled", "cgpa_percentage")
+
+def _stats_inputs(instance, fields: tuple[str, ...]) -> tuple:
+    return tuple(getattr(instance, field) for field in fields)
+
+@contextmanager
+def _unit_of_work(db: Session):
+    # Groups a CRUD mutation and its stats recalculation into a single commit.
+    try:
+        yield
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
 
 class ProgramLmsDependencyError(Exception):
@@ -35,24 +101,23 @@ class ProgramLmsDependencyError(Exception):
 class CourseSemesterAssignmentError(Exception):
     pass
 
-def normalize_timezone(timezone_value: str | None) -> str:
-    timezone = (timezone_value or DEFAULT_PROGRAM_TIMEZONE).strip()
+@lru_cache(maxsize=1024)
+def _validate_timezone(timezone: str) -> str:
     try:
         ZoneInfo(timezone)
     except Exception as exc:
         raise ValueError("INVALID_TIMEZONE") from exc
     return timezone
 
+def normalize_timezone(timezone_value: str | None) -> str:
+    return _validate_timezone((timezone_value or DEFAULT_PROGRAM_TIMEZONE).strip())
+
 def get_default_semester_dates(today: date | None = None) -> tuple[date, date]:
     base = today or date.today()
     return base, base + timedelta(days=DEFAULT_SEMESTER_LENGTH_DAYS)
 
 def get_default_user_setting_dict() -> dict:
-    return {
-        "gpa_scaling_table": DEFAULT_GPA_SCALING,
-        "default_course_credit": DEFAULT_COURSE_CREDIT,
-        "background_plugin_preload": True,
-    }
+    return dict(_DEFAULT_USER_SETTING)
 
 def parse_user_setting(raw_setting: str | None) -> dict:
     if not raw_setting:
@@ -84,15 +149,49 @@ def normalize_user_setting_dict(settings: dict | None) -> dict:
 
     return normalized
 
+def _explicitly_set_fields(update_model) -> dict:
+    # Update schemas are flat, so reading the set fields avoids a full model_dump serialization pass.
+    return {name: getattr(update_model, name) for name in update_model.model_fields_set}
+
 def get_user_setting_dict(user: models.User | None) -> dict:
-    settings = parse_user_setting(getattr(user, "user_setting", None)) if user else {}
+    settings = parse_user_setting(user.user_setting) if user is not None else {}
     return normalize_user_setting_dict(settings)
 
 
-def _sync_program_subject_color_map(program: models.Program) -> bool:
+def _sync_program_subject_color_map(db: Session, program: models.Program) -> bool:
+    # Only the naming columns feed subject codes, so read them as tuples instead of loading Program.courses.
+    db.flush()
+    course_names = db.execute(
+        select(models.Course.category, models.Course.alias, models.Course.name).where(models.Course.program_id == program.id)
+    )
+    return _apply_program_subject_color_map(program, course_names)
+
+def _sync_program_subject_color_maps(db: Session, programs: list[models.Program]) -> bool:
+    # Read paths: reuse an eager-loaded Program.courses, otherwise read the remaining programs'
+    # course names in one query. Nothing is pending on a read, so unlike the write-path sync this skips the flush.
+    course_names_by_program = defaultdict(list)
+    unloaded_program_ids = []
+    for program in programs:
+        if "courses" in sa_inspect(program).dict:
+            course_names_by_program[program.id] = [(course.category, course.alias, course.name) for course in program.courses]
+        else:
+            unloaded_program_ids.append(program.id)
+    if unloaded_program_ids:
+        course_names = db.execute(
+            select(models.Course.program_id, models.Course.category, models.Course.alias, models.Course.name)
+            .where(models.Course.program_id.in_(unloaded_program_ids))
+        )
+        for program_id, category, alias, name in course_names:
+            course_names_by_program[program_id].append((category, alias, name))
+    did_change = False
+    for program in programs:
+        did_change = _apply_program_subject_color_map(program, course_names_by_program[program.id]) or did_change
+    return did_change
+
+def _apply_program_subject_color_map(program: models.Program, course_names) -> bool:
     discovered_subject_codes = [
-        resolve_subject_code(category=course.category, alias=course.alias, name=course.name)
-        for course in program.courses
+        resolve_subject_code(category=category, alias=alias, name=name)
+        for category, alias, name in course_names
     ]
     persisted_assignments = parse_subject_color_map(program.subject_color_map)
     resolved_assignments = resolve_subject_color_assignments(discovered_subject_codes, persisted_assignments)
@@ -104,22 +203,160 @@ def _sync_program_subject_color_map(program: models.Program) -> bool:
     program.subject_color_map = serialized_assignments
     return True
 
+def _get_bcrypt():
+    # bcrypt is a C extension only needed by auth flows, so load it on first use instead of at startup.
+    global _bcrypt
+    if _bcrypt is None:
+        import bcrypt
+        _bcrypt = bcrypt
+    return _bcrypt
+
+def _get_argon2_hasher():
+    # argon2-cffi is optional; without it new hashes fall back to bcrypt.
+    global _argon2_hasher, _argon2_checked
+    if not _argon2_checked:
+        try:
+            from argon2 import PasswordHasher
+        except ImportError:
+            PasswordHasher = None
+        if PasswordHasher is not None:
+            _argon2_hasher = PasswordHasher(
+                time_cost=ARGON2_TIME_COST,
+                memory_cost=ARGON2_MEMORY_COST_KIB,
+                parallelism=ARGON2_PARALLELISM,
+            )
+        _argon2_checked = True
+    return _argon2_hasher
+
+def _check_hashed_password(plain_password: str, hashed_password: str) -> bool:
+    # Stored hashes carry their algorithm prefix ($argon2id$ or $2b$), so legacy bcrypt rows keep working.
+    if hashed_password.startswith(ARGON2_HASH_PREFIX):
+        argon2_hasher = _get_argon2_hasher()
+        if argon2_hasher is None:
+            return False
+        try:
+            return argon2_hasher.verify(hashed_password, plain_password)
+        except Exception:
+            return False
+    # Reject malformed hashes before paying for the bcrypt KDF.
+    if len(hashed_password) not in BCRYPT_HASH_LENGTHS:
+        return False
+    # hashed_password from DB is string, bcrypt needs bytes
+    return _get_bcrypt().checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+def _password_verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    # The stored hash is part of the key, so a password change naturally invalidates old entries.
+    digest = hmac.new(_PASSWORD_VERIFY_PEPPER, plain_password.encode('utf-8'), hashlib.sha256).digest()
+    return digest + hashed_password.encode('utf-8')
+
+def _is_password_verification_cached(cache_key: bytes) -> bool:
+    with _password_verify_cache_lock:
+        expires_at = _password_verify_cache.get(cache_key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del _password_verify_cache[cache_key]
+            return False
+        _password_verify_cache.move_to_end(cache_key)
+        return True
+
+def _remember_password_verification(cache_key: bytes) -> None:
+    with _password_verify_cache_lock:
+        _password_verify_cache[cache_key] = time.monotonic() + PASSWORD_VERIFY_CACHE_TTL_SECONDS
+        _password_verify_cache.move_to_end(cache_key)
+        while len(_password_verify_cache) > PASSWORD_VERIFY_CACHE_SIZE:
+            _password_verify_cache.popitem(last=False)
+
 def verify_password(plain_password, hashed_password):
     if not hashed_password:
         return False
-    # hashed_password from DB is string, bcrypt needs bytes
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    cache_key = _password_verify_cache_key(plain_password, hashed_password)
+    if _is_password_verification_cached(cache_key):
+        return True
+    verified = _check_hashed_password(plain_password, hashed_password)
+    # Only successes are cached so failed guesses always pay the full bcrypt cost.
+    if verified:
+        _remember_password_verification(cache_key)
+    return verified
 
 def get_password_hash(password):
+    argon2_hasher = _get_argon2_hasher()
+    if argon2_hasher is not None:
+        return argon2_hasher.hash(password)
     # Returns bytes, decode to store as string
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    bcrypt = _get_bcrypt()
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_ROUNDS)).decode('utf-8')
 
 # --- User CRUD ---
+def _user_cache_for(db: Session) -> OrderedDict:
+    bind = db.get_bind()
+    cache = _user_caches.get(bind)
+    if cache is None:
+        cache = _user_caches[bind] = OrderedDict()
+    return cache
+
+def _get_cached_user(db: Session, cache_key: tuple[str, str]) -> models.User | None:
+    with _user_cache_lock:
+        cache = _user_cache_for(db)
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            del cache[cache_key]
+            return None
+        cache.move_to_end(cache_key)
+    # Rebuild a clean persistent row from the snapshot and attach it without a SELECT.
+    user = models.User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+def _remember_user(db: Session, user: models.User | None) -> models.User | None:
+    if user is None:
+        return None
+    state = sa_inspect(user)
+    # Only cache rows whose loaded state matches the database (no pending edits, nothing expired).
+    if state.modified or any(key not in state.dict for key in _USER_COLUMN_KEYS):
+        return user
+    snapshot = {key: state.dict[key] for key in _USER_COLUMN_KEYS}
+    expires_at = time.monotonic() + USER_CACHE_TTL_SECONDS
+    with _user_cache_lock:
+        cache = _user_cache_for(db)
+        for cache_key in (("id", snapshot["id"]), ("email", snapshot["email"])):
+            cache[cache_key] = (expires_at, snapshot)
+            cache.move_to_end(cache_key)
+        while len(cache) > USER_CACHE_SIZE:
+            cache.popitem(last=False)
+    return user
+
+def forget_cached_user(db: Session, user_id: str, email: str | None = None) -> None:
+    with _user_cache_lock:
+        cache = _user_caches.get(db.get_bind())
+        if not cache:
+            return
+        entry = cache.pop(("id", user_id), None)
+        if entry is not None:
+            cache.pop(("email", entry[1]["email"]), None)
+        if email is not None:
+            cache.pop(("email", email), None)
+
 def get_user(db: Session, user_id: str):
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    cached = _get_cached_user(db, ("id", user_id))
+    if cached is not None:
+        return cached
+    return _remember_user(db, db.get(models.User, user_id))
 
 def get_user_by_email(db: Session, email: str):
-    return db.query(models.User).filter(models.User.email == email).first()
+    cached = _get_cached_user(db, ("email", email))
+    if cached is not None:
+        return cached
+    return _remember_user(db, db.query(models.User).filter(models.User.email == email).first())
+
+def get_user_auth_row(db: Session, email: str):
+    # Password login only needs the credential columns, so skip ORM User materialization.
+    return db.execute(
+        select(models.User.id, models.User.email, models.User.hashed_password).where(models.User.email == email)
+    ).first()
 
 def get_user_by_google_sub(db: Session, google_sub: str):
     return db.query(models.User).filter(models.User.google_sub == google_sub).first()
@@ -129,12 +366,11 @@ def create_user(db: Session, user: schemas.UserCreate):
     db_user = models.User(
         email=user.email,
         hashed_password=hashed_password,
-        user_setting=json.dumps(get_default_user_setting_dict())
+        user_setting=_DEFAULT_USER_SETTING_JSON
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
-    db.refresh(db_user)
+    forget_cached_user(db, db_user.id, db_user.email)
     return db_user
 
 def create_user_from_google(db: Session, email: str, google_sub: str):
@@ -142,42 +378,83 @@ def create_user_from_google(db: Session, email: str, google_sub: str):
         email=email,
         hashed_password=None,
         google_sub=google_sub,
-        user_setting=json.dumps(get_default_user_setting_dict())
+        user_setting=_DEFAULT_USER_SETTING_JSON
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
-    db.refresh(db_user)
+    forget_cached_user(db, db_user.id, db_user.email)
     return db_user
 
+def _typed_user_setting_patch(update_data: dict) -> dict | None:
+    # Only typed keys whose values are already in normalized form can be patched without re-normalizing the blob.
+    if update_data.get("user_setting") is not None:
+        return None
+    patch = {}
+    if update_data.get("gpa_scaling_table") is not None:
+        if not update_data["gpa_scaling_table"]:
+            return None
+        patch["gpa_scaling_table"] = update_data["gpa_scaling_table"]
+    if update_data.get("default_course_credit") is not None:
+        patch["default_course_credit"] = float(update_data["default_course_credit"])
+    if update_data.get("background_plugin_preload") is not None:
+        patch["background_plugin_preload"] = bool(update_data["background_plugin_preload"])
+    return patch or None
+
+def _user_setting_json_type():
+    # json_type() raises on malformed text, so only evaluate it for valid JSON.
+    return case((func.json_valid(models.User.user_setting) == 1, func.json_type(models.User.user_setting)), else_=None)
+
+def _patch_user_setting_in_place(db: Session, user_id: str, patch: dict) -> bool:
+    # json_valid/json_type/json_set are SQLite functions; other engines take the Python merge path.
+    if db.get_bind().dialect.name != "sqlite":
+        return False
+    json_set_args = []
+    for key, value in patch.items():
+        json_set_args.extend((f"$.{key}", func.json(json.dumps(value))))
+    result = db.execute(
+        update(models.User)
+        .where(models.User.id == user_id, _user_setting_json_type() == "object")
+        .values(user_setting=func.json_set(models.User.user_setting, *json_set_args))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount > 0
+
 def update_user(db: Session, user_id: str, user_update: schemas.UserUpdate):
     db_user = get_user(db, user_id)
     if not db_user:
         return None
 
-    update_data = user_update.model_dump(exclude_unset=True)
+    update_data = _explicitly_set_fields(user_update)
 
     if "nickname" in update_data:
         db_user.nickname = update_data["nickname"]
 
+    setting_patch = _typed_user_setting_patch(update_data)
+    if setting_patch is not None and db_user.user_setting and _patch_user_setting_in_place(db, user_id, setting_patch):
+        db.commit()
+        forget_cached_user(db, user_id)
+        # The JSON patch ran in SQL, so reload the row the session still holds.
+        db.refresh(db_user)
+        return db_user
+
     merged_settings = get_user_setting_dict(db_user)
     has_settings_update = False
 
-    if "user_setting" in update_data and update_data["user_setting"] is not None:
+    if update_data.get("user_setting") is not None:
         incoming = parse_user_setting(update_data["user_setting"])
         if incoming:
             merged_settings.update(incoming)
             has_settings_update = True
 
-    if "gpa_scaling_table" in update_data and update_data["gpa_scaling_table"] is not None:
+    if update_data.get("gpa_scaling_table") is not None:
         merged_settings["gpa_scaling_table"] = update_data["gpa_scaling_table"]
         has_settings_update = True
 
-    if "default_course_credit" in update_data and update_data["default_course_credit"] is not None:
+    if update_data.get("default_course_credit") is not None:
         merged_settings["default_course_credit"] = float(update_data["default_course_credit"])
         has_settings_update = True
 
-    if "background_plugin_preload" in update_data and update_data["background_plugin_preload"] is not None:
+    if update_data.get("background_plugin_preload") is not None:
         merged_settings["background_plugin_preload"] = bool(update_data["background_plugin_preload"])
         has_settings_update = True
 
@@ -186,24 +463,49 @@ def update_user(db: Session, user_id: str, user_update: schemas.UserUpdate):
     if has_settings_update or not db_user.user_setting:
         db_user.user_setting = json.dumps(merged_settings)
 
-    db.add(db_user)
     db.commit()
-    db.refresh(db_user)
+    forget_cached_user(db, user_id)
     return db_user
 
 # --- Program CRUD ---
-def get_programs(db: Session, user_id: str, skip: int = 0, limit: int = 100):
-    programs = db.query(models.Program).filter(models.Program.owner_id == user_id).offset(skip).limit(limit).all()
-    did_change = False
-    for program in programs:
-        did_change = _sync_program_subject_color_map(program) or did_change
-    if did_change:
+def _get_owned_program(db: Session, program_id: str, user_id: str, load_options: tuple = ()):
+    program = db.get(models.Program, program_id, options=load_options)
+    if program is None or program.owner_id != user_id:
+        return None
+    return program
+
+def get_programs(db: Session, user_id: str, skip: int = 0, limit: int = 100, load_options: tuple = ()):
+    programs = (
+        db.query(models.Program)
+        .options(*load_options)
+        .filter(models.Program.owner_id == user_id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if _sync_program_subject_color_maps(db, programs):
         db.commit()
-        for program in programs:
-            db.refresh(program)
     return programs
 
-def create_program(db: Session, program: schemas.ProgramCreate, user_id: str):
+def get_programs_by_ids(db: Session, user_id: str, program_ids: list[str], load_options: tuple = ()):
+    programs = (
+        db.query(models.Program)
+        .options(*load_options)
+        .filter(models.Program.owner_id == user_id, models.Program.id.in_(program_ids))
+        .all()
+    )
+    if _sync_program_subject_color_maps(db, programs):
+        db.commit()
+    position = {program_id: index for index, program_id in enumerate(program_ids)}
+    return sorted(programs, key=lambda program: position[program.id])
+
+def get_program_names(db: Session, user_id: str):
+    # Name conflict checks need every program, so this is not paginated like get_programs.
+    return db.execute(
+        select(models.Program.name, models.Program.id).where(models.Program.owner_id == user_id)
+    ).all()
+
+def create_program(db: Session, program: schemas.ProgramCreate, user_id: str, auto_commit: bool = True):
     payload = program.model_dump()
     payload["program_timezone"] = normalize_timezone(payload.get("program_timezone"))
     lms_integration_id = payload.get("lms_integration_id")
@@ -215,27 +517,26 @@ def create_program(db: Session, program: schemas.ProgramCreate, user_id: str):
         )
         if integration is None:
             raise ProgramLmsDependencyError("PROGRAM_LMS_INTEGRATION_NOT_FOUND")
-    db_program = models.Program(**payload, owner_id=user_id)
-    db.add(db_program)
-    db.commit()
-    db.refresh(db_program)
+    db_program = db.execute(
+        insert(models.Program).values(**payload, owner_id=user_id).returning(models.Program)
+    ).scalar_one()
+    if auto_commit:
+        db.commit()
     return db_program
 
-def get_program(db: Session, program_id: str, user_id: str):
-    program = db.query(models.Program).filter(models.Program.id == program_id, models.Program.owner_id == user_id).first()
+def get_program(db: Session, program_id: str, user_id: str, load_options: tuple = ()):
+    program = _get_owned_program(db, program_id, user_id, load_options)
     if program is None:
         return None
-    if _sync_program_subject_color_map(program):
-        db.add(program)
+    if _sync_program_subject_color_maps(db, [program]):
         db.commit()
-        db.refresh(program)
     return program
 
 def update_program(db: Session, program_id: str, program_update: schemas.ProgramUpdate, user_id: str):
-    db_program = db.query(models.Program).filter(models.Program.id == program_id, models.Program.owner_id == user_id).first()
+    db_program = _get_owned_program(db, program_id, user_id)
     if not db_program:
         return None
-    update_data = program_update.model_dump(exclude_unset=True)
+    update_data = _explicitly_set_fields(program_update)
     if "program_timezone" in update_data:
         update_data["program_timezone"] = normalize_timezone(update_data["program_timezone"])
     if "lms_integration_id" in update_data:
@@ -250,24 +551,25 @@ def update_program(db: Session, program_id: str, program_update: schemas.Program
                 raise ProgramLmsDependencyError("PROGRAM_LMS_INTEGRATION_NOT_FOUND")
         if next_integration_id != db_program.lms_integration_id and db_program.has_lms_dependencies:
             raise ProgramLmsDependencyError("PROGRAM_LMS_DEPENDENCIES_EXIST")
-    for key, value in update_data.items():
-        setattr(db_program, key, value)
-    _sync_program_subject_color_map(db_program)
-    db.add(db_program)
-    db.commit()
-    db.refresh(db_program)
-    
-    # Recalculate stats in case settings changed
-    logic.recalculate_all_stats(db_program, db)
-    
+    previous_stats_inputs = _stats_inputs(db_program, PROGRAM_STATS_FIELDS)
+    with _unit_of_work(db):
+        for key, value in update_data.items():
+            setattr(db_program, key, value)
+        _sync_program_subject_color_map(db, db_program)
+        # Recalculate stats only when the scaling table or stored CGPA changed
+        if _stats_inputs(db_program, PROGRAM_STATS_FIELDS) != previous_stats_inputs:
+            logic.recalculate_all_stats(db_program, db, auto_commit=False)
+
     return db_program
 
-def delete_program(db: Session, program_id: str, user_id: str):
-    db_program = db.query(models.Program).filter(models.Program.id == program_id, models.Program.owner_id == user_id).first()
-    if db_program:
-        db.delete(db_program)
+def delete_program(db: Session, program_id: str, user_id: str, auto_commit: bool = True) -> bool:
+    # Child rows are removed by ON DELETE CASCADE foreign keys instead of ORM traversal.
+    result = db.execute(
+        delete(models.Program).where(models.Program.id == program_id, models.Program.owner_id == user_id)
+    )
+    if auto_commit:
         db.commit()
-    return db_program
+    return result.rowcount > 0
 
 # --- Semester CRUD ---
 def get_semesters(db: Session, program_id: str):
@@ -275,7 +577,7 @@ def get_semesters(db: Session, program_id: str):
     # For now assuming simple fetch
     return db.query(models.Semester).filter(models.Semester.program_id == program_id).all()
 
-def create_semester(db: Session, semester: schemas.SemesterCreate, program_id: str):
+def create_semester(db: Session, semester: schemas.SemesterCreate, program_id: str, auto_commit: bool = True):
     payload = semester.model_dump()
     start_date = payload.get("start_date")
     end_date = payload.get("end_date")
@@ -283,21 +585,26 @@ def create_semester(db: Session, semester: schemas.SemesterCreate, program_id: s
         default_start, default_end = get_default_semester_dates()
         payload["start_date"] = start_date or default_start
         payload["end_date"] = end_date or default_end
-    db_semester = models.Semester(**payload, program_id=program_id)
-    db.add(db_semester)
-    db.commit()
-    db.refresh(db_semester)
-    
-    # Create default widgets
-    create_widget(db, schemas.WidgetCreate(
-        widget_type="course-list",
-        is_removable=False
-    ), semester_id=db_semester.id)
-    
+    try:
+        db_semester = db.execute(
+            insert(models.Semester).values(**payload, program_id=program_id).returning(models.Semester)
+        ).scalar_one()
+
+        # Create default widgets
+        create_widget_for_semester(db, schemas.WidgetCreate(
+            widget_type="course-list",
+            is_removable=False
+        ), semester_id=db_semester.id, auto_commit=False)
+        if auto_commit:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
     return db_semester
 
 def update_semester(db: Session, semester_id: str, semester_update: schemas.SemesterCreate):
-    db_semester = db.query(models.Semester).filter(models.Semester.id == semester_id).first()
+    db_semester = db.get(models.Semester, semester_id)
     if not db_semester:
         return None
     update_data = semester_update.model_dump()
@@ -305,30 +612,32 @@ def update_semester(db: Session, semester_id: str, semester_update: schemas.Seme
         update_data["start_date"] = db_semester.start_date
     if update_data.get("end_date") is None:
         update_data["end_date"] = db_semester.end_date
-    for key, value in update_data.items():
-        setattr(db_semester, key, value)
-    db.add(db_semester)
-    db.commit()
-    db.refresh(db_semester)
-    
-    # Recalculate stats
-    logic.recalculate_semester_full(db_semester, db)
-    
-    return db_semester
+    previous_stats_inputs = _stats_inputs(db_semester, SEMESTER_STATS_FIELDS)
+    with _unit_of_work(db):
+        for key, value in update_data.items():
+            setattr(db_semester, key, value)
+        # Recalculate stats only when the payload overwrote the stored averages
+        if _stats_inputs(db_semester, SEMESTER_STATS_FIELDS) != previous_stats_inputs:
+            logic.recalculate_semester_full(db_semester, db, auto_commit=False)
 
-def delete_semester(db: Session, semester_id: str):
-    db_semester = db.query(models.Semester).filter(models.Semester.id == semester_id).first()
-    if db_semester:
-        # Delete related courses logic handled by cascade in models?
-        db.delete(db_semester)
-        db.commit()
     return db_semester
 
+def delete_semester(db: Session, semester_id: str) -> bool:
+    result = db.execute(delete(models.Semester).where(models.Semester.id == semester_id))
+    db.commit()
+    return result.rowcount > 0
+
 import logic
 
 # --- Course CRUD ---
-def get_courses(db: Session, program_id: str, semester_id: str | None = None, unassigned: bool = False):
-    query = db.query(models.Course).filter(models.Course.program_id == program_id)
+def get_courses(
+    db: Session,
+    program_id: str,
+    semester_id: str | None = None,
+    unassigned: bool = False,
+    load_options: tuple = (),
+):
+    query = db.query(models.Course).options(*load_options).filter(models.Course.program_id == program_id)
     if unassigned:
         query = query.filter(models.Course.semester_id == None)
     elif semester_id:
@@ -336,7 +645,7 @@ def get_courses(db: Session, program_id: str, semester_id: str | None = None, un
     return query.all()
 
 def get_course(db: Session, course_id: str):
-    return db.query(models.Course).filter(models.Course.id == course_id).first()
+    return db.get(models.Course, course_id)
 
 
 def _validate_course_semester_assignment(
@@ -347,167 +656,255 @@ def _validate_course_semester_assignment(
     if semester_id is None:
         return
 
-    target_semester = db.query(models.Semester).filter(models.Semester.id == semester_id).first()
+    target_semester = db.get(models.Semester, semester_id)
     if target_semester is None:
         raise CourseSemesterAssignmentError("SEMESTER_NOT_FOUND")
     if target_semester.program_id != course.program_id:
         raise CourseSemesterAssignmentError("SEMESTER_PROGRAM_MISMATCH")
 
-def create_course(db: Session, course: schemas.CourseCreate, program_id: str, semester_id: str | None = None):
-    db_course = models.Course(**course.model_dump(), program_id=program_id, semester_id=semester_id)
-    db.add(db_course)
-    db.commit()
-    db.refresh(db_course)
-
-    for builtin_type in BUILTIN_EVENT_TYPES:
-        db.add(models.CourseEventType(
-            course_id=db_course.id,
-            code=builtin_type["code"],
-            abbreviation=builtin_type["abbreviation"],
-            track_attendance=False,
-            created_at="",
-            updated_at="",
-        ))
-    db.commit()
-    db.refresh(db_course)
-    gradebook.ensure_course_gradebook(db, db_course)
-    if db_course.program and _sync_program_subject_color_map(db_course.program):
-        db.add(db_course.program)
-        db.commit()
-    db.refresh(db_course)
+def _get_course_with_stats_context(db: Session, course_id: str) -> models.Course | None:
+    # Stats read the Program (plus its owner for the default scale) and the Semester; load them in one round trip.
+    return (
+        db.query(models.Course)
+        .options(
+            joinedload(models.Course.program).joinedload(models.Program.owner),
+            joinedload(models.Course.semester),
+        )
+        .filter(models.Course.id == course_id)
+        .one_or_none()
+    )
+
+def create_course(
+    db: Session,
+    course: schemas.CourseCreate,
+    program_id: str,
+    semester_id: str | None = None,
+    auto_commit: bool = True,
+):
+    try:
+        db_course = db.execute(
+            insert(models.Course)
+            .values(**course.model_dump(), program_id=program_id, semester_id=semester_id)
+            .returning(models.Course)
+        ).scalar_one()
+        db_course = _get_course_with_stats_context(db, db_course.id)
+
+        db.execute(
+            insert(models.CourseEventType),
+            [dict(row, course_id=db_course.id) for row in _BUILTIN_EVENT_TYPE_ROWS],
+        )
+        gradebook.ensure_course_gradebook(db, db_course)
+        if db_course.program:
+            _sync_program_subject_color_map(db, db_course.program)
+        logic.update_course_stats(db_course, db, auto_commit=False)
+        if auto_commit:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
-    logic.update_course_stats(db_course, db)
-    
     return db_course
 
+def create_courses(
+    db: Session,
+    courses: list[schemas.CourseCreate],
+    program_id: str,
+    semester_id: str | None = None,
+    auto_commit: bool = True,
+) -> list[models.Course]:
+    # Bulk form of create_course for ICS uploads: one INSERT per table for the courses, their
+    # builtin event types and gradebooks, then a single subject-color sync and stats refresh.
+    if not courses:
+        return []
+    try:
+        program = db.get(models.Program, program_id)
+        scaling_table = logic.get_scaling_table(program)
+        course_rows = []
+        for course in courses:
+            row = course.model_dump()
+            row.update(
+                id=models.generate_uuid(),
+                program_id=program_id,
+                semester_id=semester_id,
+                grade_scaled=logic.calculate_gpa(row["grade_percentage"], scaling_table),
+            )
+            course_rows.append(row)
+        db_courses = list(
+            db.scalars(insert(models.Course).returning(models.Course, sort_by_parameter_order=True), course_rows)
+        )
+
+        db.execute(
+            insert(models.CourseEventType),
+            [dict(row, course_id=course_row["id"]) for course_row in course_rows for row in _BUILTIN_EVENT_TYPE_ROWS],
+        )
+        gradebook.create_course_gradebooks(db, [course_row["id"] for course_row in course_rows])
+        if program is not None:
+            _sync_program_subject_color_map(db, program)
+        semester = db.get(models.Semester, semester_id) if semester_id else None
+        if semester is not None:
+            logic.update_semester_stats(semester, db, auto_commit=False)
+        if auto_commit:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return db_courses
+
 def update_course(db: Session, course_id: str, course_update: schemas.CourseUpdate):
-    db_course = db.query(models.Course).filter(models.Course.id == course_id).first()
+    db_course = _get_course_with_stats_context(db, course_id)
     if not db_course:
         return None
 
     previous_semester_id = db_course.semester_id
-    update_data = course_update.model_dump(exclude_unset=True)
+    update_data = _explicitly_set_fields(course_update)
     if "semester_id" in update_data:
         _validate_course_semester_assignment(db, db_course, update_data["semester_id"])
 
-    for key, value in update_data.items():
-        setattr(db_course, key, value)
-    if db_course.program:
-        _sync_program_subject_color_map(db_course.program)
-    db.add(db_course)
-    db.commit()
-    db.refresh(db_course)
-    
-    logic.update_course_stats(db_course, db)
-    if previous_semester_id and previous_semester_id != db_course.semester_id:
-        previous_semester = db.query(models.Semester).filter(models.Semester.id == previous_semester_id).first()
-        if previous_semester is not None:
-            logic.update_semester_stats(previous_semester, db)
-    
+    previous_stats_inputs = _stats_inputs(db_course, COURSE_STATS_FIELDS)
+    with _unit_of_work(db):
+        for key, value in update_data.items():
+            setattr(db_course, key, value)
+
+        # Renames and other cosmetic edits leave GPA inputs untouched, so skip the stats chain.
+        if _stats_inputs(db_course, COURSE_STATS_FIELDS) != previous_stats_inputs:
+            logic.update_course_stats(db_course, db, auto_commit=False)
+            if previous_semester_id and previous_semester_id != db_course.semester_id:
+                previous_semester = db.get(models.Semester, previous_semester_id)
+                if previous_semester is not None:
+                    logic.update_semester_stats(previous_semester, db, auto_commit=False)
+        # Runs after stats so the course row is written once by whichever flush comes first.
+        if db_course.program:
+            _sync_program_subject_color_map(db, db_course.program)
+
     return db_course
 
 
 def delete_course(db: Session, course_id: str):
-    db_course = db.query(models.Course).filter(models.Course.id == course_id).first()
+    db_course = db.get(models.Course, course_id)
     if not db_course:
         return None
 
     previous_semester_id = db_course.semester_id
     program_id = db_course.program_id
-    db.delete(db_course)
-    db.commit()
+    with _unit_of_work(db):
+        db.delete(db_course)
+        db.flush()
 
-    if previous_semester_id:
-        previous_semester = db.query(models.Semester).filter(models.Semester.id == previous_semester_id).first()
-        if previous_semester is not None:
-            logic.update_semester_stats(previous_semester, db)
+        if previous_semester_id:
+            previous_semester = db.get(models.Semester, previous_semester_id)
+            if previous_semester is not None:
+                logic.update_semester_stats(previous_semester, db, auto_commit=False)
 
-    if program_id:
-        program = db.query(models.Program).filter(models.Program.id == program_id).first()
-        if program is not None and _sync_program_subject_color_map(program):
-            db.add(program)
-            db.commit()
+        if program_id:
+            program = db.get(models.Program, program_id)
+            if program is not None:
+                _sync_program_subject_color_map(db, program)
 
     return db_course
 
-def _ensure_widget_context(semester_id: str | None, course_id: str | None):
-    if (semester_id is None and course_id is None) or (semester_id is not None and course_id is not None):
-        raise ValueError("Widget must be attached to exactly one context (semester_id or course_id).")
-
-def _ensure_tab_context(semester_id: str | None, course_id: str | None):
-    if (semester_id is None and course_id is None) or (semester_id is not None and course_id is not None):
-        raise ValueError("Tab must be attached to exactly one context (semester_id or course_id).")
-
-def _ensure_plugin_settings_context(semester_id: str | None, course_id: str | None):
-    if (semester_id is None and course_id is None) or (semester_id is not None and course_id is not None):
-        raise ValueError("Plugin settings must be attached to exactly one context (semester_id or course_id).")
+def _ensure_single_context(label: str, semester_id: str | None, course_id: str | None):
+    if (semester_id is None) == (course_id is None):
+        raise ValueError(f"{label} must be attached to exactly one context (semester_id or course_id).")
 
 # --- Widget CRUD ---
-def create_widget(db: Session, widget: schemas.WidgetCreate, semester_id: str | None = None, course_id: str | None = None):
-    _ensure_widget_context(semester_id, course_id)
-    db_widget = models.Widget(**widget.model_dump(), semester_id=semester_id, course_id=course_id)
-    db.add(db_widget)
-    db.commit()
-    db.refresh(db_widget)
+def _create_widget_record(
+    db: Session,
+    widget: schemas.WidgetCreate,
+    semester_id: str | None,
+    course_id: str | None,
+    auto_commit: bool,
+):
+    db_widget = db.execute(
+        insert(models.Widget)
+        .values(**widget.model_dump(), semester_id=semester_id, course_id=course_id)
+        .returning(models.Widget)
+    ).scalar_one()
+    if auto_commit:
+        db.commit()
     return db_widget
 
+def create_widget(
+    db: Session,
+    widget: schemas.WidgetCreate,
+    semester_id: str | None = None,
+    course_id: str | None = None,
+    auto_commit: bool = True,
+):
+    _ensure_single_context("Widget", semester_id, course_id)
+    return _create_widget_record(db, widget, semester_id, course_id, auto_commit)
+
+def create_widget_for_semester(db: Session, widget: schemas.WidgetCreate, semester_id: str, auto_commit: bool = True):
+    return _create_widget_record(db, widget, semester_id, None, auto_commit)
+
+def create_widget_for_course(db: Session, widget: schemas.WidgetCreate, course_id: str, auto_commit: bool = True):
+    return _create_widget_record(db, widget, None, course_id, auto_commit)
+
 def delete_widget(db: Session, widget_id: str):
-    db_widget = db.query(models.Widget).filter(models.Widget.id == widget_id).first()
+    db_widget = db.get(models.Widget, widget_id)
     if db_widget:
         db.delete(db_widget)
         db.commit()
     return db_widget
 
 def update_widget(db: Session, widget_id: str, widget_update: schemas.WidgetUpdate):
-    db_widget = db.query(models.Widget).filter(models.Widget.id == widget_id).first()
-    if not db_widget:
-        return None
-    for key, value in widget_update.model_dump(exclude_unset=True).items():
-        setattr(db_widget, key, value)
-    db.add(db_widget)
+    values = _explicitly_set_fields(widget_update)
+    if not values:
+        return db.get(models.Widget, widget_id)
+    db_widget = db.execute(
+        update(models.Widget).where(models.Widget.id == widget_id).values(**values).returning(models.Widget)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(db_widget)
     return db_widget
 
 # --- Tab CRUD ---
-def _get_next_tab_order(db: Session, semester_id: str | None, course_id: str | None) -> int:
-    query = db.query(func.max(models.Tab.order_index))
+def _next_tab_order_subquery(semester_id: str | None, course_id: str | None):
+    # Resolved inside the INSERT so tab creation does not need a separate MAX round trip.
+    query = select(func.coalesce(func.max(models.Tab.order_index), 0) + 1)
     if semester_id:
-        query = query.filter(models.Tab.semester_id == semester_id)
+        query = query.where(models.Tab.semester_id == semester_id)
     if course_id:
-        query = query.filter(models.Tab.course_id == course_id)
-    max_order = query.scalar()
-    return int(max_order or 0) + 1
+        query = query.where(models.Tab.course_id == course_id)
+    return query.scalar_subquery()
 
-def create_tab(db: Session, tab: schemas.TabCreate, semester_id: str | None = None, course_id: str | None = None):
-    _ensure_tab_context(semester_id, course_id)
+def _create_tab_record(db: Session, tab: schemas.TabCreate, semester_id: str | None, course_id: str | None):
     data = tab.model_dump()
     order_index = data.pop("order_index", None)
     if order_index is None:
-        order_index = _get_next_tab_order(db, semester_id, course_id)
-    data["order_index"] = order_index
-    db_tab = models.Tab(**data, semester_id=semester_id, course_id=course_id)
-    db.add(db_tab)
+        order_index = _next_tab_order_subquery(semester_id, course_id)
+    db_tab = db.execute(
+        insert(models.Tab)
+        .values(**data, order_index=order_index, semester_id=semester_id, course_id=course_id)
+        .returning(models.Tab)
+    ).scalar_one()
     db.commit()
-    db.refresh(db_tab)
     return db_tab
 
+def create_tab(db: Session, tab: schemas.TabCreate, semester_id: str | None = None, course_id: str | None = None):
+    _ensure_single_context("Tab", semester_id, course_id)
+    return _create_tab_record(db, tab, semester_id, course_id)
+
+def create_tab_for_semester(db: Session, tab: schemas.TabCreate, semester_id: str):
+    return _create_tab_record(db, tab, semester_id, None)
+
+def create_tab_for_course(db: Session, tab: schemas.TabCreate, course_id: str):
+    return _create_tab_record(db, tab, None, course_id)
+
 def delete_tab(db: Session, tab_id: str):
-    db_tab = db.query(models.Tab).filter(models.Tab.id == tab_id).first()
+    db_tab = db.get(models.Tab, tab_id)
     if db_tab:
         db.delete(db_tab)
         db.commit()
     return db_tab
 
 def update_tab(db: Session, tab_id: str, tab_update: schemas.TabUpdate):
-    db_tab = db.query(models.Tab).filter(models.Tab.id == tab_id).first()
-    if not db_tab:
-        return None
-    for key, value in tab_update.model_dump(exclude_unset=True).items():
-        setattr(db_tab, key, value)
-    db.add(db_tab)
+    values = _explicitly_set_fields(tab_update)
+    if not values:
+        return db.get(models.Tab, tab_id)
+    db_tab = db.execute(
+        update(models.Tab).where(models.Tab.id == tab_id).values(**values).returning(models.Tab)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(db_tab)
     return db_tab
 
 # --- Plugin Settings CRUD ---
@@ -516,7 +913,7 @@ def get_plugin_settings_for_context(
     semester_id: str | None = None,
     course_id: str | None = None,
 ):
-    _ensure_plugin_settings_context(semester_id, course_id)
+    _ensure_single_context("Plugin settings", semester_id, course_id)
     query = db.query(models.PluginSetting)
     if semester_id is not None:
         query = query.filter(models.PluginSetting.semester_id == semester_id)
@@ -530,7 +927,7 @@ def get_plugin_setting(
     semester_id: str | None = None,
     course_id: str | None = None,
 ):
-    _ensure_plugin_settings_context(semester_id, course_id)
+    _ensure_single_context("Plugin settings", semester_id, course_id)
     query = db.query(models.PluginSetting).filter(models.PluginSetting.plugin_id == plugin_id)
     if semester_id is not None:
         query = query.filter(models.PluginSetting.semester_id == semester_id)
@@ -544,7 +941,7 @@ def upsert_plugin_setting(
     semester_id: str | None = None,
     course_id: str | None = None,
 ):
-    _ensure_plugin_settings_context(semester_id, course_id)
+    _ensure_single_context("Plugin settings", semester_id, course_id)
     db_plugin_setting = get_plugin_setting(
         db,
         plugin_id=plugin_setting.plugin_id,
@@ -561,5 +958,4 @@ def upsert_plugin_setting(
     db_plugin_setting.settings = plugin_setting.settings
     db.add(db_plugin_setting)
     db.commit()
-    db.refresh(db_plugin_setting)
     return db_plugin_setting
@@ -1,12 +1,12 @@
 # input:  [Environment variables, SQLAlchemy engine/session/base]
-# output: [Database engine, session factory, declarative base, and FK pragma hook]
+# output: [Dialect-aware database engine (SQLite pragmas, env-tunable connection pool sized to the request threadpool, server-database pre-ping/recycle), session factory (instances stay loaded across commits), declarative base, and SQLite pragma hook (foreign keys, WAL journaling, cache/mmap/busy-timeout tuning)]
 # pos:    [Database bootstrap and connection configuration]
 #
 # ⚠️ When this file is updated:
 #    1. Update these header comments
 #    2. Update the INDEX.md of the folder this file belongs to
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import event
@@ -38,17 +38,50 @@ else:
     DB_PATH = str(db_path)
     SQLITE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(
-    SQLITE_URL, connect_args={"check_same_thread": False}
+# Hosted Postgres providers still hand out "postgres://" URLs, which SQLAlchemy no longer accepts.
+if SQLITE_URL.startswith("postgres://"):
+    SQLITE_URL = "postgresql://" + SQLITE_URL[len("postgres://"):]
+
+IS_SQLITE = SQLITE_URL.startswith("sqlite")
+
+# WAL lets readers proceed during a write and, with synchronous=NORMAL, avoids an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
 )
 
+# Sync routes run on Starlette's 40-thread pool; the defaults let every worker hold a connection
+# instead of queueing on the pool. Behind PgBouncer (transaction mode), lower these to match it.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+POOL_OPTIONS = {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW, "pool_timeout": 30}
+
+if IS_SQLITE:
+    ENGINE_OPTIONS = {"connect_args": {"check_same_thread": False}}
+    # File databases use a QueuePool; in-memory ones keep their single shared connection.
+    if make_url(SQLITE_URL).database not in (None, "", ":memory:"):
+        ENGINE_OPTIONS.update(POOL_OPTIONS)
+else:
+    # Server databases drop idle connections, so validate on checkout and recycle before common idle timeouts.
+    ENGINE_OPTIONS = {"pool_pre_ping": True, "pool_recycle": 1800, **POOL_OPTIONS}
+
+engine = create_engine(SQLITE_URL, **ENGINE_OPTIONS)
+
 @event.listens_for(engine, "connect")
 def _set_sqlite_pragma(dbapi_connection, _connection_record):
+    if not IS_SQLITE:
+        return
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
     cursor.close()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
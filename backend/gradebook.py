@@ -1,5 +1,5 @@
 # input:  [SQLAlchemy session, simplified gradebook ORM models, GPA logic helpers, and gradebook API schemas]
-# output: [course-gradebook domain service for initialization, preference/category/assessment CRUD, and import/export mapping that preserves LMS assessment provenance plus optional point-based score inputs in backups]
+# output: [course-gradebook domain service for single or bulk initialization, preference/category/assessment CRUD, and import/export mapping that preserves LMS assessment provenance plus optional point-based score inputs in backups]
 # pos:    [backend gradebook domain layer that persists assessment score facts, optional points-based grading inputs, and import provenance while leaving forecast and plan calculations to the client]
 #
 # ⚠️ When this file is updated:
@@ -13,6 +13,7 @@ import math
 import re
 from typing import Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, joinedload
 
 import logic
@@ -184,7 +185,7 @@ def ensure_course_gradebook(db: Session, course: models.Course) -> models.Course
         return course.gradebook
 
     gradebook = models.CourseGradebook(
-        course_id=course.id,
+        course=course,
         target_gpa=4.0,
         forecast_model=schemas.GradebookForecastModel.AUTO.value,
         revision=1,
@@ -211,6 +212,42 @@ def ensure_course_gradebook(db: Session, course: models.Course) -> models.Course
     return gradebook
 
 
+def create_course_gradebooks(db: Session, course_ids: list[str]) -> None:
+    # Bulk form of ensure_course_gradebook for courses created together: one INSERT per table.
+    if not course_ids:
+        return
+    timestamp = _now_iso()
+    gradebook_rows = [
+        {
+            "id": models.generate_uuid(),
+            "course_id": course_id,
+            "target_gpa": 4.0,
+            "forecast_model": schemas.GradebookForecastModel.AUTO.value,
+            "revision": 1,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+        for course_id in course_ids
+    ]
+    db.execute(insert(models.CourseGradebook), gradebook_rows)
+    db.execute(
+        insert(models.GradebookAssessmentCategory),
+        [
+            {
+                "gradebook_id": gradebook_row["id"],
+                "name": definition["name"],
+                "key": definition["key"],
+                "is_builtin": True,
+                "color_token": definition["color_token"],
+                "order_index": index,
+                "is_archived": False,
+            }
+            for gradebook_row in gradebook_rows
+            for index, definition in enumerate(BUILTIN_CATEGORY_DEFINITIONS)
+        ],
+    )
+
+
 def get_course_gradebook_or_404(db: Session, course_id: str) -> models.CourseGradebook:
     course = (
         db.query(models.Course)
@@ -543,6 +580,7 @@ def import_course_gradebook(
     db: Session,
     course_id: str,
     payload: schemas.CourseGradebookExport,
+    auto_commit: bool = True,
 ) -> schemas.CourseGradebook:
     gradebook = get_course_gradebook_or_404(db, course_id)
 
@@ -599,5 +637,6 @@ def import_course_gradebook(
     db.flush()
     db.refresh(gradebook)
     result = build_course_gradebook_payload(gradebook)
-    db.commit()
+    if auto_commit:
+        db.commit()
     return result
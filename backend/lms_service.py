@@ -785,9 +785,9 @@ def upsert_course_link(
 
     course_summary = _fetch_external_course(integration, payload.external_course_id)
     link = course.lms_link or models.CourseLmsLink(
-        course_id=course.id,
-        program_id=program.id,
-        lms_integration_id=integration.id,
+        course=course,
+        program=program,
+        lms_integration=integration,
         external_course_id=payload.external_course_id,
     )
     link.program_id = program.id
@@ -909,9 +909,9 @@ def import_program_courses(
                 semester_id=semester.id if semester is not None else None,
             )
             link = models.CourseLmsLink(
-                course_id=course.id,
-                program_id=program.id,
-                lms_integration_id=integration.id,
+                course=course,
+                program=program,
+                lms_integration=integration,
                 external_course_id=external_course_id,
                 sync_enabled=True,
             )
@@ -1,5 +1,5 @@
 # input:  [SQLAlchemy session, models, JSON scaling definitions]
-# output: [Business logic helpers for GPA, gradebook target resolution, grades, and week calculations]
+# output: [Business logic helpers for GPA, gradebook target resolution, grades, week calculations, and single-commit course/semester/program stats recalculation (Program CGPA summed from stored Semester totals)]
 # pos:    [Pure/domain logic layer consumed by API handlers and gradebook services]
 #
 # ⚠️ When this file is updated:
@@ -7,6 +7,9 @@
 #    2. Update the INDEX.md of the folder this file belongs to
 
 import json
+import re
+from functools import lru_cache
+from sqlalchemy import and_, case, func, literal, select, update
 from sqlalchemy.orm import Session
 import models
 
@@ -33,8 +36,13 @@ def _round_gpa(value: float, decimals: int = 3) -> float:
         return 0.0
 
 def _parse_scaling_table(raw_table: str | None) -> dict | None:
-    if not raw_table:
+    if not raw_table or not isinstance(raw_table, str):
         return None
+    return _parse_scaling_table_text(raw_table)
+
+# Keyed on the raw JSON text, so an edited table is simply a new cache entry; callers treat the dict as read-only.
+@lru_cache(maxsize=256)
+def _parse_scaling_table_text(raw_table: str) -> dict | None:
     try:
         parsed = json.loads(raw_table)
     except Exception:
@@ -71,37 +79,50 @@ def get_scaling_table(program: models.Program | None = None) -> dict:
 
     return DEFAULT_SCALING_TABLE
 
-def calculate_gpa(percentage: float, scaling_table: dict) -> float:
+_RANGE = 0
+_LOWER_BOUND = 1
+_EXACT = 2
+_NON_NUMERIC_CHARS = re.compile(r"[^\d.]")
+
+def _parse_lower_bound_key(key: str) -> float:
+    # ">=90" / ">90": keep only the digits and dots, as the per-character filter did.
+    return float(_NON_NUMERIC_CHARS.sub("", key))
+
+def _compile_key(range_str) -> tuple[int, float, float] | None:
     """
-    Calculates GPA based on percentage and scaling table.
-    Supports ranges ("85-89"), lower bounds (">=90", ">90"), and numeric keys.
+    Parses one scaling-table key into (kind, lower, upper); returns None for keys calculate_gpa would skip.
     """
-    if not scaling_table:
-        return 0.0
+    key = str(range_str).strip()
+    try:
+        if '-' in key:
+            start, end = map(float, key.split('-'))
+            return _RANGE, min(start, end), max(start, end)
+        if key.startswith('>') or key.startswith('>='):
+            val = _parse_lower_bound_key(key)
+            return _LOWER_BOUND, val, val
+        val = float(key)
+        return _EXACT, val, val
+    except ValueError:
+        return None
 
-    # First pass: exact range / operator matching
-    for range_str, gpa in scaling_table.items():
+def _compile_scaling_entries(items: tuple) -> tuple[tuple, tuple]:
+    """
+    Parses scaling-table keys once into ordered match entries plus numeric lower-bound fallbacks.
+    Entries whose key or GPA cannot be parsed are dropped, mirroring the per-call skip behaviour.
+    """
+    entries = []
+    for range_str, gpa in items:
+        compiled_key = _compile_key(range_str)
+        if compiled_key is None:
+            continue
         try:
-            key = str(range_str).strip()
-            if '-' in key:
-                start, end = map(float, key.split('-'))
-                if min(start, end) <= percentage <= max(start, end):
-                    return _round_gpa(float(gpa))
-            elif key.startswith('>') or key.startswith('>='):
-                val = float(''.join(ch for ch in key if (ch.isdigit() or ch == '.')))
-                if percentage >= val:
-                    return _round_gpa(float(gpa))
-            else:
-                # Exact numeric match
-                val = float(key)
-                if abs(percentage - val) < 0.01:
-                    return _round_gpa(float(gpa))
+            resolved_gpa = _round_gpa(float(gpa))
         except Exception:
             continue
+        entries.append((*compiled_key, resolved_gpa))
 
-    # Second pass: treat numeric keys as lower bounds (descending)
     numeric_entries = []
-    for key, gpa in scaling_table.items():
+    for key, gpa in items:
         key_str = str(key)
         if '-' in key_str:
             continue
@@ -109,16 +130,72 @@ def calculate_gpa(percentage: float, scaling_table: dict) -> float:
             val = float(key_str)
         except Exception:
             continue
-        numeric_entries.append((val, gpa))
+        try:
+            resolved_gpa = _round_gpa(float(gpa))
+        except Exception:
+            resolved_gpa = 0.0
+        numeric_entries.append((val, resolved_gpa))
+    numeric_entries.sort(key=lambda item: item[0], reverse=True)
+    return tuple(entries), tuple(numeric_entries)
 
-    if numeric_entries:
-        numeric_entries.sort(key=lambda item: item[0], reverse=True)
-        for val, gpa in numeric_entries:
-            if percentage >= val:
-                try:
-                    return _round_gpa(float(gpa))
-                except Exception:
-                    return 0.0
+_cached_compile_scaling_entries = lru_cache(maxsize=256)(_compile_scaling_entries)
+
+def _get_compiled_scaling_entries(scaling_table: dict) -> tuple[tuple, tuple]:
+    items = tuple(scaling_table.items())
+    try:
+        return _cached_compile_scaling_entries(items)
+    except TypeError:
+        # Unhashable GPA values cannot be cached; compile them for this call only.
+        return _compile_scaling_entries(items)
+
+def _scaled_grade_expression(scaling_table: dict):
+    """
+    Builds a SQL CASE equivalent to calculate_gpa so whole sets of courses can be rescaled in one UPDATE.
+    """
+    percentage = models.Course.grade_percentage
+    if not scaling_table:
+        return literal(0.0)
+    entries, numeric_entries = _get_compiled_scaling_entries(scaling_table)
+    whens = []
+    for kind, low, high, gpa in entries:
+        if kind == _RANGE:
+            whens.append((percentage.between(low, high), gpa))
+        elif kind == _LOWER_BOUND:
+            whens.append((percentage >= low, gpa))
+        else:
+            whens.append((func.abs(percentage - low) < 0.01, gpa))
+    whens.extend((percentage >= val, gpa) for val, gpa in numeric_entries)
+    if not whens:
+        return literal(0.0)
+    return case(*whens, else_=0.0)
+
+def calculate_gpa(percentage: float, scaling_table: dict) -> float:
+    """
+    Calculates GPA based on percentage and scaling table.
+    Supports ranges ("85-89"), lower bounds (">=90", ">90"), and numeric keys.
+    """
+    if not scaling_table:
+        return 0.0
+
+    entries, numeric_entries = _get_compiled_scaling_entries(scaling_table)
+
+    # First pass: exact range / operator matching in table order.
+    # Non-numeric percentages (e.g. a missing grade) never match a bucket here.
+    if isinstance(percentage, (int, float)):
+        for kind, low, high, gpa in entries:
+            if kind == _RANGE:
+                if low <= percentage <= high:
+                    return gpa
+            elif kind == _LOWER_BOUND:
+                if percentage >= low:
+                    return gpa
+            elif abs(percentage - low) < 0.01:
+                return gpa
+
+    # Second pass: treat numeric keys as lower bounds (descending)
+    for val, gpa in numeric_entries:
+        if percentage >= val:
+            return gpa
 
     # Fallback if no range matches (e.g. > 100 or < 0, or gaps)
     return 0.0
@@ -131,171 +208,201 @@ def get_minimum_percentage_for_gpa(target_gpa: float, scaling_table: dict) -> fl
     if not scaling_table:
         return None
 
+    items = tuple(scaling_table.items())
+    try:
+        thresholds = _cached_minimum_percentage_thresholds(items)
+    except TypeError:
+        thresholds = _minimum_percentage_thresholds(items)
+    if not thresholds:
+        return None
+
+    eligible = [lower_bound for lower_bound, gpa_value in thresholds if gpa_value >= float(target_gpa)]
+    if not eligible:
+        return None
+    return min(eligible)
+
+def _minimum_percentage_thresholds(items: tuple) -> tuple[tuple[float, float], ...]:
     thresholds: list[tuple[float, float]] = []
-    for raw_key, raw_gpa in scaling_table.items():
+    for raw_key, raw_gpa in items:
         try:
             gpa_value = float(raw_gpa)
         except Exception:
             continue
 
         key = str(raw_key).strip()
-        lower_bound: float | None = None
         try:
             if "-" in key:
                 start, end = map(float, key.split("-", 1))
                 lower_bound = min(start, end)
             elif key.startswith(">=") or key.startswith(">"):
-                lower_bound = float("".join(ch for ch in key if ch.isdigit() or ch == "."))
+                lower_bound = _parse_lower_bound_key(key)
             else:
                 lower_bound = float(key)
         except Exception:
-            lower_bound = None
-
-        if lower_bound is None:
             continue
         thresholds.append((lower_bound, gpa_value))
+    return tuple(thresholds)
 
-    if not thresholds:
-        return None
+_cached_minimum_percentage_thresholds = lru_cache(maxsize=256)(_minimum_percentage_thresholds)
 
-    eligible = [lower_bound for lower_bound, gpa_value in thresholds if gpa_value >= float(target_gpa)]
-    if not eligible:
-        return None
-    return min(eligible)
-
-def update_course_stats(course: models.Course, db: Session):
+def _aggregate_course_totals(db: Session, *criteria) -> tuple[float, float, float]:
     """
-    Updates the scaled GPA for a course.
+    Sums credit-weighted GPA inputs in SQL so averages do not need Course rows hydrated.
+    Pending course changes are flushed first so the sums include the caller's edits.
     """
-    # Need to fetch relations if not loaded, but assuming we have access via lazy loading or passed objects
-    # course.semester and course.semester.program might trigger DB calls
-    
-    semester = course.semester
-    program = semester.program if semester else course.program
-    
-    table = get_scaling_table(program)
-    course.grade_scaled = calculate_gpa(course.grade_percentage, table)
-    
-    db.add(course)
-    db.commit()
-    db.refresh(course)
-    
-    # Trigger update up the chain
-    if semester:
-        update_semester_stats(semester, db)
-
-def update_semester_stats(semester: models.Semester, db: Session):
+    db.flush()
+    total_credits, weighted_gpa_sum, weighted_percentage_sum = db.execute(
+        select(
+            func.coalesce(func.sum(models.Course.credits), 0.0),
+            func.coalesce(func.sum(models.Course.grade_scaled * models.Course.credits), 0.0),
+            func.coalesce(func.sum(models.Course.grade_percentage * models.Course.credits), 0.0),
+        ).where(models.Course.include_in_gpa == True, *criteria)
+    ).one()
+    return float(total_credits), float(weighted_gpa_sum), float(weighted_percentage_sum)
+
+def _rescale_courses(db: Session, scaling_table: dict, *criteria) -> None:
+    db.flush()
+    db.execute(
+        update(models.Course)
+        .where(*criteria)
+        .values(grade_scaled=_scaled_grade_expression(scaling_table))
+        .execution_options(synchronize_session="fetch")
+    )
+
+def _refresh_program_semester_averages(db: Session, program: models.Program) -> tuple[float, float, float]:
     """
-    Updates average stats for a semester.
+    Refreshes every semester of the program from one grouped SUM and returns the program-wide totals.
+    Semesters are updated by primary key from plain rows, so no Semester instances are loaded.
     """
-    courses = semester.courses
-    
-    total_credits = 0.0
-    weighted_gpa_sum = 0.0
-    weighted_percentage_sum = 0.0
-    
-    for course in courses:
-        if course.include_in_gpa:
-            # Re-calculate course stats just in case context changed (e.g. Program table changed)
-            # But be careful of infinite recursion if we called update_course_stats here effectively.
-            # actually logic.update_course_stats calls this function, so we shouldn't call it back unless necessary.
-            # We can calculate fresh GPA locally without saving to DB if we want to be fast, OR assume course.grade_scaled is correct.
-            # BETTER: We should make sure course.grade_scaled is fresh. 
-            # If this was called from update_course_stats, it is fresh.
-            # If called from update_program_stats -> update_semester_stats, we might need to refresh courses.
-            
-            # For now, let's assume we use current values in DB.
-            
-            total_credits += course.credits
-            weighted_gpa_sum += course.grade_scaled * course.credits
-            weighted_percentage_sum += course.grade_percentage * course.credits
-            
+    db.flush()
+    counted_course = and_(models.Course.semester_id == models.Semester.id, models.Course.include_in_gpa == True)
+    rows = db.execute(
+        select(
+            models.Semester.id,
+            func.coalesce(func.sum(models.Course.credits), 0.0),
+            func.coalesce(func.sum(models.Course.grade_scaled * models.Course.credits), 0.0),
+            func.coalesce(func.sum(models.Course.grade_percentage * models.Course.credits), 0.0),
+        )
+        .outerjoin(models.Course, counted_course)
+        .where(models.Semester.program_id == program.id)
+        .group_by(models.Semester.id)
+    ).all()
+    semester_totals = [(float(credits), float(gpa_sum), float(percentage_sum)) for _id, credits, gpa_sum, percentage_sum in rows]
+    if rows:
+        db.execute(
+            update(models.Semester),
+            [{"id": row[0], **_semester_average_values(totals)} for row, totals in zip(rows, semester_totals)],
+        )
+    return tuple(map(sum, zip((0.0, 0.0, 0.0), *semester_totals)))
+
+def _semester_average_values(totals: tuple[float, float, float]) -> dict:
+    total_credits, weighted_gpa_sum, weighted_percentage_sum = totals
+    values = {
+        "total_credits": total_credits,
+        "weighted_gpa_sum": weighted_gpa_sum,
+        "weighted_percentage_sum": weighted_percentage_sum,
+        "average_scaled": 0.0,
+        "average_percentage": 0.0,
+    }
     if total_credits > 0:
-        semester.average_scaled = _round_gpa(weighted_gpa_sum / total_credits)
-        semester.average_percentage = weighted_percentage_sum / total_credits
-    else:
-        semester.average_scaled = 0.0
-        semester.average_percentage = 0.0
-        
-    db.add(semester)
-    db.commit()
-    db.refresh(semester)
-    
-    if semester.program:
-        update_program_stats(semester.program, db)
-
-def update_program_stats(program: models.Program, db: Session):
-    """
-    Updates CGPA for the program.
-    """
-    semesters = program.semesters
-    
-    total_credits = 0.0
-    weighted_gpa_sum = 0.0
-    weighted_percentage_sum = 0.0
-    
-    for semester in semesters:
-        # We should iterate over ALL courses in the program directly for accuracy, 
-        # or use semester averages weighted by semester credits? 
-        # Usually CGPA is (Sum of all course GP * credits) / (Sum of all course credits)
-        # So using semester averages might be slightly off if semesters have different credit counts?
-        # Actually: Sum(SemAvg * SemCredits) / Sum(SemCredits) == Sum( (SumCourseGP/SemCredits) * SemCredits ) / TotalCredits == Sum(SumCourseGP) / TotalCredits.
-        # So it is mathematically equivalent IF SemCredits matches sum of course credits.
-        
-        # Let's count from semesters to avoid fetching all courses again.
-        
-        # We need to know how many credits are in the semester. 
-        # semester model doesn't store total credits, so we might have to re-sum from courses 
-        # OR add a total_credits field to Semester.
-        
-        # For now, let's fetch all courses through semesters.
-        for course in semester.courses:
-            if course.include_in_gpa:
-                 total_credits += course.credits
-                 weighted_gpa_sum += course.grade_scaled * course.credits
-                 weighted_percentage_sum += course.grade_percentage * course.credits
-    
+        values["average_scaled"] = _round_gpa(weighted_gpa_sum / total_credits)
+        values["average_percentage"] = weighted_percentage_sum / total_credits
+    return values
+
+def _set_semester_averages(semester: models.Semester, totals: tuple[float, float, float]) -> None:
+    for key, value in _semester_average_values(totals).items():
+        setattr(semester, key, value)
+
+def _set_program_averages(program: models.Program, totals: tuple[float, float, float]) -> None:
+    total_credits, weighted_gpa_sum, weighted_percentage_sum = totals
     if total_credits > 0:
         program.cgpa_scaled = _round_gpa(weighted_gpa_sum / total_credits)
         program.cgpa_percentage = weighted_percentage_sum / total_credits
     else:
         program.cgpa_scaled = 0.0
         program.cgpa_percentage = 0.0
-        
-    db.add(program)
-    db.commit()
-    db.refresh(program)
 
-def recalculate_all_stats(program: models.Program, db: Session):
+def _refresh_semester_averages(db: Session, semester: models.Semester) -> None:
+    _set_semester_averages(semester, _aggregate_course_totals(db, models.Course.semester_id == semester.id))
+
+def _refresh_program_averages(db: Session, program: models.Program) -> None:
+    """
+    CGPA is weighted by course credits, so it sums the stored per-semester credit totals rather than averages.
+    Semester totals are refreshed alongside semester averages, so this reads one row per semester.
+    """
+    db.flush()
+    total_credits, weighted_gpa_sum, weighted_percentage_sum = db.execute(
+        select(
+            func.coalesce(func.sum(models.Semester.total_credits), 0.0),
+            func.coalesce(func.sum(models.Semester.weighted_gpa_sum), 0.0),
+            func.coalesce(func.sum(models.Semester.weighted_percentage_sum), 0.0),
+        ).where(models.Semester.program_id == program.id)
+    ).one()
+    _set_program_averages(program, (float(total_credits), float(weighted_gpa_sum), float(weighted_percentage_sum)))
+
+def _finish_stats(db: Session, auto_commit: bool) -> None:
+    # Callers composing a larger unit of work pass auto_commit=False and commit once themselves.
+    if not auto_commit:
+        db.flush()
+        return
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+def _get_program(db: Session, program_id: str | None) -> models.Program | None:
+    return db.get(models.Program, program_id) if program_id else None
+
+def _update_semester_and_program_averages(db: Session, semester: models.Semester) -> None:
+    _refresh_semester_averages(db, semester)
+    program = _get_program(db, semester.program_id)
+    if program is not None:
+        _refresh_program_averages(db, program)
+
+def update_course_stats(course: models.Course, db: Session, auto_commit: bool = True):
+    """
+    Updates the scaled GPA for a course, then its semester and program averages.
+    """
+    table = get_scaling_table(_get_program(db, course.program_id))
+    course.grade_scaled = calculate_gpa(course.grade_percentage, table)
+
+    if course.semester_id:
+        semester = db.get(models.Semester, course.semester_id)
+        if semester is not None:
+            _update_semester_and_program_averages(db, semester)
+
+    _finish_stats(db, auto_commit)
+
+def update_semester_stats(semester: models.Semester, db: Session, auto_commit: bool = True):
+    """
+    Updates average stats for a semester and the CGPA of its program.
+    """
+    _update_semester_and_program_averages(db, semester)
+    _finish_stats(db, auto_commit)
+
+def update_program_stats(program: models.Program, db: Session, auto_commit: bool = True):
+    """
+    Updates CGPA for the program.
+    """
+    _refresh_program_averages(db, program)
+    _finish_stats(db, auto_commit)
+
+def recalculate_all_stats(program: models.Program, db: Session, auto_commit: bool = True):
     """
     Full recalculation, useful when Program settings change.
     """
-    # 1. Update all courses (they might depend on Program scaling table)
-    for semester in program.semesters:
-        for course in semester.courses:
-            # We assume update_course_stats triggers up-chain updates, 
-            # but that might be inefficient for bulk updates.
-            # More efficient: Calculate all courses, commit, then calculate semesters, then program.
-            
-            table = get_scaling_table(program)
-            course.grade_scaled = calculate_gpa(course.grade_percentage, table)
-            db.add(course)
-        
-        # After courses updated, update semester
-        db.commit() # Save courses first
-        update_semester_stats(semester, db) # This effectively calculates semester average
-        
-    # Program stats updated by last semester update, or we can explicit call
-    update_program_stats(program, db)
-
-def recalculate_semester_full(semester: models.Semester, db: Session):
+    program_semester_ids = select(models.Semester.id).where(models.Semester.program_id == program.id)
+    _rescale_courses(db, get_scaling_table(program), models.Course.semester_id.in_(program_semester_ids))
+    # The grouped semester totals already cover the whole program, so CGPA needs no second aggregate.
+    _set_program_averages(program, _refresh_program_semester_averages(db, program))
+    _finish_stats(db, auto_commit)
+
+def recalculate_semester_full(semester: models.Semester, db: Session, auto_commit: bool = True):
     """
-    Recalculates all course stats in a semester, then the semester stats.
+    Recalculates all course stats in a semester, then the semester and program stats.
     """
-    program = semester.program
-    for course in semester.courses:
-        table = get_scaling_table(program)
-        course.grade_scaled = calculate_gpa(course.grade_percentage, table)
-        db.add(course)
-    db.commit()
-    update_semester_stats(semester, db)
+    program = _get_program(db, semester.program_id)
+    _rescale_courses(db, get_scaling_table(program), models.Course.semester_id == semester.id)
+    _update_semester_and_program_averages(db, semester)
+    _finish_stats(db, auto_commit)
@@ -1,5 +1,5 @@
 # input:  [FastAPI framework, domain route modules, backend schemas/models/crud/utils/auth/lms/resource services, env-backed runtime settings, and widget delete query flags]
-# output: [FastAPI app instance, router registration, and remaining Program/Semester/Course route handlers that are not yet split into separate backend API modules]
+# output: [FastAPI app instance, router registration, and remaining Program/Semester/Course route handlers that are not yet split into separate backend API modules, plus the selectinload option sets used by program, semester and course reads and the shared bulk ICS course/schedule import helper]
 # pos:    [Backend entry point that boots the FastAPI app, wires middleware and modular routers, and keeps the remaining program/semester/course orchestration endpoints plus course LMS navigation, announcement, assignment, grade, module, page, quiz, and syllabus reads]
 #
 # ⚠️ When this file is updated:
@@ -8,9 +8,11 @@
 
 from fastapi import Body, FastAPI, Depends, HTTPException, Form, Response, status, Query
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipMiddleware
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from datetime import date, datetime, timedelta
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, selectinload
+from datetime import UTC, date, datetime, timedelta
 from typing import Optional
 import os
 from pathlib import Path
@@ -22,8 +24,10 @@ from api_auth import export_user_data, import_user_data, router as auth_router
 from api_common import (
     build_course_resource_list_response,
     error_detail,
+    forget_owned,
     get_owned_course,
     get_owned_semester,
+    now_utc_iso,
     raise_gradebook_http_error,
     raise_lms_http_error,
     raise_todo_http_error,
@@ -39,9 +43,37 @@ import course_resources
 import auth
 import lms_service
 from database import engine, get_db
-from schedule_support import import_course_schedule_from_ics
+from schedule_support import build_course_schedule_rows, insert_course_schedule_rows
 
 BASE_DIR = Path(__file__).parent
+
+# schemas.Course reads each course's gradebook and LMS link (with its integration), and the
+# detail schemas add layout collections; load each relationship with one IN query rather
+# than lazily per object while the response is serialized.
+_COURSE_SUMMARY_LOAD_OPTIONS = (
+    selectinload(models.Course.gradebook),
+    selectinload(models.Course.lms_link).selectinload(models.CourseLmsLink.lms_integration),
+)
+_SEMESTER_COURSES = selectinload(models.Semester.courses)
+SEMESTER_DETAIL_LOAD_OPTIONS = (
+    _SEMESTER_COURSES.selectinload(models.Course.gradebook),
+    _SEMESTER_COURSES.selectinload(models.Course.lms_link).selectinload(models.CourseLmsLink.lms_integration),
+    selectinload(models.Semester.widgets),
+    selectinload(models.Semester.tabs),
+    selectinload(models.Semester.plugin_settings),
+)
+_PROGRAM_SEMESTERS = selectinload(models.Program.semesters)
+PROGRAM_DETAIL_LOAD_OPTIONS = (
+    selectinload(models.Program.lms_course_links),
+    selectinload(models.Program.lms_integration),
+    *(_PROGRAM_SEMESTERS.options(option) for option in SEMESTER_DETAIL_LOAD_OPTIONS),
+)
+COURSE_DETAIL_LOAD_OPTIONS = (
+    *_COURSE_SUMMARY_LOAD_OPTIONS,
+    selectinload(models.Course.widgets),
+    selectinload(models.Course.tabs),
+    selectinload(models.Course.plugin_settings),
+)
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
 # Load .env only for local development. Production should use platform env vars.
@@ -50,7 +82,12 @@ if ENVIRONMENT == "development":
     if env_local_path.exists():
         load_dotenv(env_local_path)
 
-models.Base.metadata.create_all(bind=engine)
+# One table listing replaces create_all's per-table existence probes; on a warm
+# database nothing is missing and the bootstrap is skipped entirely.
+_existing_tables = set(sa_inspect(engine).get_table_names())
+_missing_tables = [table for table in models.Base.metadata.sorted_tables if table.name not in _existing_tables]
+if _missing_tables:
+    models.Base.metadata.create_all(bind=engine, tables=_missing_tables)
 
 from fastapi import UploadFile, File
 import utils
@@ -75,6 +112,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Schedule and export payloads are large, repetitive JSON; already-compressed resource
+# downloads such as PDFs are passed through untouched.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=6,
+    exclude_content_types=(*DEFAULT_EXCLUDED_CONTENT_TYPES, "application/pdf"),
+)
 
 app.include_router(auth_router)
 app.include_router(course_schedule_router)
@@ -102,7 +147,12 @@ def read_programs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 
 @app.get("/programs/{program_id}", response_model=schemas.ProgramWithSemesters)
 def read_program(program_id: str, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)):
-    program = crud.get_program(db, program_id=program_id, user_id=current_user.id)
+    program = crud.get_program(
+        db,
+        program_id=program_id,
+        user_id=current_user.id,
+        load_options=PROGRAM_DETAIL_LOAD_OPTIONS,
+    )
     if program is None:
         raise HTTPException(status_code=404, detail="Program not found")
     return program
@@ -214,6 +264,61 @@ def create_semester_for_program(
     )
     return crud.create_semester(db=db, semester=semester, program_id=program_id)
 
+def _create_courses_from_parsed_ics(
+    db: Session,
+    parsed_courses: list[dict],
+    *,
+    program_id: str,
+    semester_id: str | None,
+    default_course_credit: float,
+    skip_invalid_schedules: bool,
+) -> list[models.Course]:
+    # Schedules are validated in memory before anything is written, so every course, event type,
+    # section and event lands with one INSERT per table instead of a round of statements per course.
+    course_creates: list[schemas.CourseCreate] = []
+    course_meetings: list[list] = []
+    for parsed_course in parsed_courses:
+        course_name = str(parsed_course.get("name", "")).strip()
+        if not course_name:
+            continue
+        category = parsed_course.get("category") or utils.extract_category(course_name)
+        course_creates.append(schemas.CourseCreate(name=course_name, credits=default_course_credit, category=category))
+        meetings = parsed_course.get("meetings", [])
+        course_meetings.append(meetings if isinstance(meetings, list) else [])
+
+    created_courses = crud.create_courses(
+        db=db,
+        courses=course_creates,
+        program_id=program_id,
+        semester_id=semester_id,
+        auto_commit=False,
+    )
+    builtin_event_types = [(event_type["code"], event_type["abbreviation"]) for event_type in crud.BUILTIN_EVENT_TYPES]
+    imported_at = now_utc_iso()
+    event_type_rows: list[dict] = []
+    section_rows: list[dict] = []
+    event_rows: list[dict] = []
+    for created_course, meetings in zip(created_courses, course_meetings):
+        if not meetings:
+            continue
+        try:
+            course_event_types, course_sections, course_events = build_course_schedule_rows(
+                created_course.id,
+                meetings,
+                event_types=builtin_event_types,
+                section_event_type_codes={},
+                imported_at=imported_at,
+            )
+        except Exception:
+            if skip_invalid_schedules:
+                continue
+            raise
+        event_type_rows.extend(course_event_types)
+        section_rows.extend(course_sections)
+        event_rows.extend(course_events)
+    insert_course_schedule_rows(db, event_type_rows, section_rows, event_rows)
+    return created_courses
+
 @app.post("/programs/{program_id}/semesters/upload", response_model=schemas.Semester)
 async def create_semester_from_ics(
     program_id: str, 
@@ -234,38 +339,36 @@ async def create_semester_from_ics(
     if not name:
         name = file.filename.replace(".ics", "")
 
-    start_date = parsed_schedule.get("semesterStartDate") or datetime.utcnow().date()
+    start_date = parsed_schedule.get("semesterStartDate") or datetime.now(UTC).date()
     end_date = parsed_schedule.get("semesterEndDate") or (start_date + timedelta(days=111))
     if end_date < start_date:
         end_date = start_date
 
     semester_create = schemas.SemesterCreate(name=name, start_date=start_date, end_date=end_date)
-    semester = crud.create_semester(db=db, semester=semester_create, program_id=program_id)
-    
+
     # Create courses and import structured schedule data from ICS.
     user_setting = crud.get_user_setting_dict(current_user)
     default_course_credit = float(user_setting.get("default_course_credit", crud.DEFAULT_COURSE_CREDIT))
     if not parsed_courses:
         parsed_courses = [{"name": course_name, "category": utils.extract_category(course_name), "meetings": []} for course_name in utils.parse_ics(content)]
 
-    for parsed_course in parsed_courses:
-        course_name = str(parsed_course.get("name", "")).strip()
-        if not course_name:
-            continue
-        category = parsed_course.get("category") or utils.extract_category(course_name)
-        course_create = schemas.CourseCreate(name=course_name, credits=default_course_credit, category=category)
-        created_course = crud.create_course(db=db, course=course_create, program_id=program_id, semester_id=semester.id)
-
-        meetings = parsed_course.get("meetings", [])
-        if not isinstance(meetings, list) or len(meetings) == 0:
-            continue
+    # The whole upload is one transaction; a course whose schedule fails validation
+    # is kept without that schedule.
+    try:
+        semester = crud.create_semester(db=db, semester=semester_create, program_id=program_id, auto_commit=False)
+        _create_courses_from_parsed_ics(
+            db,
+            parsed_courses,
+            program_id=program_id,
+            semester_id=semester.id,
+            default_course_credit=default_course_credit,
+            skip_invalid_schedules=True,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
-        try:
-            import_course_schedule_from_ics(db, created_course, meetings)
-            db.commit()
-        except Exception:
-            db.rollback()
-        
     return semester
 
 @app.post("/programs/{program_id}/courses/upload", response_model=list[schemas.Course])
@@ -282,12 +385,8 @@ async def create_courses_from_ics(
 
     target_semester_id: str | None = None
     if semester_id:
-        semester = db.query(models.Semester).join(models.Program).filter(
-            models.Semester.id == semester_id,
-            models.Semester.program_id == program_id,
-            models.Program.owner_id == current_user.id,
-        ).first()
-        if semester is None:
+        semester = get_owned_semester(db, current_user, semester_id)
+        if semester.program_id != program_id:
             raise HTTPException(status_code=404, detail="Semester not found")
         target_semester_id = semester.id
 
@@ -300,43 +399,25 @@ async def create_courses_from_ics(
     if not parsed_courses:
         parsed_courses = [{"name": course_name, "category": utils.extract_category(course_name), "meetings": []} for course_name in utils.parse_ics(content)]
 
-    created_courses: list[models.Course] = []
-    for parsed_course in parsed_courses:
-        course_name = str(parsed_course.get("name", "")).strip()
-        if not course_name:
-            continue
-
-        category = parsed_course.get("category") or utils.extract_category(course_name)
-        course_create = schemas.CourseCreate(name=course_name, credits=default_course_credit, category=category)
-        created_course = crud.create_course(
-            db=db,
-            course=course_create,
+    try:
+        created_courses = _create_courses_from_parsed_ics(
+            db,
+            parsed_courses,
             program_id=program_id,
             semester_id=target_semester_id,
+            default_course_credit=default_course_credit,
+            skip_invalid_schedules=False,
         )
-        created_courses.append(created_course)
-
-        meetings = parsed_course.get("meetings", [])
-        if not isinstance(meetings, list) or len(meetings) == 0:
-            continue
-
-        import_course_schedule_from_ics(db, created_course, meetings)
+    except Exception:
+        db.rollback()
+        raise
 
     db.commit()
-    for course in created_courses:
-        db.refresh(course)
-
     return created_courses
 
 @app.get("/semesters/{semester_id}", response_model=schemas.SemesterWithDetails)
 def read_semester(semester_id: str, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)):
-    # Need to verify ownership via program -> user
-    semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id, models.Program.owner_id == current_user.id
-    ).first()
-    if semester is None:
-        raise HTTPException(status_code=404, detail="Semester not found")
-    return semester
+    return get_owned_semester(db, current_user, semester_id, SEMESTER_DETAIL_LOAD_OPTIONS)
 
 
 @app.get("/semesters/{semester_id}/lms/assignments", response_model=schemas.LmsAssignmentListResponse)
@@ -393,12 +474,7 @@ def upsert_semester_plugin_setting(
 
 @app.put("/semesters/{semester_id}", response_model=schemas.Semester)
 def update_semester(semester_id: str, semester: schemas.SemesterCreate, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)):
-    # Verify ownership
-    db_semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not db_semester:
-        raise HTTPException(status_code=404, detail="Semester not found")
+    db_semester = get_owned_semester(db, current_user, semester_id)
     resolved_start_date, resolved_end_date = resolve_semester_date_bounds(
         semester.start_date or db_semester.start_date,
         semester.end_date or db_semester.end_date,
@@ -418,14 +494,9 @@ def update_semester(semester_id: str, semester: schemas.SemesterCreate, db: Sess
 
 @app.delete("/semesters/{semester_id}")
 def delete_semester(semester_id: str, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)):
-    # Verify ownership
-    db_semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not db_semester:
-        raise HTTPException(status_code=404, detail="Semester not found")
-    
+    get_owned_semester(db, current_user, semester_id)
     crud.delete_semester(db, semester_id=semester_id)
+    forget_owned(db, models.Semester, current_user.id, semester_id)
     return {"ok": True}
 
 @app.get("/semesters/{semester_id}/todo", response_model=schemas.TodoSemesterState)
@@ -537,12 +608,7 @@ def clear_completed_semester_todo_tasks(
 def create_course_for_semester(
     semester_id: str, course: schemas.CourseCreate, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)
 ):
-    # Verify semester ownership
-    semester = db.query(models.Semester).join(models.Program).filter(
-        models.Semester.id == semester_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not semester:
-        raise HTTPException(status_code=404, detail="Semester not found")
+    semester = get_owned_semester(db, current_user, semester_id)
     return crud.create_course(db=db, course=course, program_id=semester.program_id, semester_id=semester_id)
 
 @app.post("/programs/{program_id}/courses/", response_model=schemas.Course)
@@ -565,18 +631,17 @@ def read_courses_for_program(
     program = crud.get_program(db, program_id=program_id, user_id=current_user.id)
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
-    return crud.get_courses(db, program_id=program_id, semester_id=semester_id, unassigned=unassigned)
+    return crud.get_courses(
+        db,
+        program_id=program_id,
+        semester_id=semester_id,
+        unassigned=unassigned,
+        load_options=_COURSE_SUMMARY_LOAD_OPTIONS,
+    )
 
 @app.get("/courses/{course_id}", response_model=schemas.CourseWithWidgets)
 def read_course(course_id: str, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)):
-    # Verify ownership via program -> user
-    db_course = db.query(models.Course).join(models.Program).filter(
-        models.Course.id == course_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not db_course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    # SQLAlchemy relationships (widgets) are lazy loaded, so pydantic will fetch them if in schema
-    return db_course
+    return get_owned_course(db, current_user, course_id, COURSE_DETAIL_LOAD_OPTIONS)
 
 
 @app.get("/courses/{course_id}/lms-link", response_model=Optional[schemas.LmsCourseLinkSummary])
@@ -912,13 +977,7 @@ def download_course_resource(
 def update_course(
     course_id: str, course: schemas.CourseUpdate, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)
 ):
-    # Verify ownership (via program -> user)
-    db_course = db.query(models.Course).join(models.Program).filter(
-        models.Course.id == course_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not db_course:
-        raise HTTPException(status_code=404, detail="Course not found")
-        
+    get_owned_course(db, current_user, course_id)
     try:
         return crud.update_course(db=db, course_id=course_id, course_update=course)
     except crud.CourseSemesterAssignmentError as exc:
@@ -933,13 +992,10 @@ def update_course(
 def delete_course(
     course_id: str, db: Session = Depends(get_db), current_user: models.User = Depends(auth.get_current_user)
 ):
-    db_course = db.query(models.Course).join(models.Program).filter(
-        models.Course.id == course_id, models.Program.owner_id == current_user.id
-    ).first()
-    if not db_course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    
-    crud.delete_course(db, course_id)
+    # Keep a reference so crud.delete_course finds the course in the session's identity map.
+    db_course = get_owned_course(db, current_user, course_id)
+    crud.delete_course(db, db_course.id)
+    forget_owned(db, models.Course, current_user.id, course_id)
     return {"ok": True}
 
 
@@ -1,5 +1,5 @@
 # input:  [SQLAlchemy Base, Column types, relational constraints]
-# output: [ORM model classes and table definitions, including Program subject-color persistence, multi-integration LMS records, Program/Course LMS link metadata, gradebook LMS-import provenance and optional point-based score fields, context-scoped plugin shared settings, and semester-scoped todo domain tables]
+# output: [ORM model classes and table definitions, including event-type code foreign keys that cascade renames to sections and events, denormalized Semester GPA credit totals, Program subject-color persistence, multi-integration LMS records, Program/Course LMS link metadata, gradebook LMS-import provenance and optional point-based score fields, context-scoped plugin shared settings, and semester-scoped todo domain tables]
 # pos:    [Persistent data model layer for academic data, dashboard instances, Program-level visual settings, multi-integration LMS connection storage, Program/Course LMS link metadata, gradebook import provenance plus point-based score facts, plugin-shared settings, and todo domain records]
 #
 # ⚠️ When this file is updated:
@@ -68,6 +68,9 @@ class LmsIntegration(Base):
     
 class Program(Base):
     __tablename__ = "programs"
+    __table_args__ = (
+        Index("ix_programs_owner", "owner_id"),
+    )
 
     id = Column(String, primary_key=True, index=True, default=generate_uuid)
     name = Column(String, index=True)
@@ -85,7 +88,7 @@ class Program(Base):
     # Relationships
     owner = relationship("User", back_populates="programs")
     lms_integration = relationship("LmsIntegration", back_populates="programs")
-    semesters = relationship("Semester", back_populates="program", cascade="all, delete-orphan")
+    semesters = relationship("Semester", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
     courses = relationship("Course", back_populates="program")
     lms_course_links = relationship("CourseLmsLink", back_populates="program", cascade="all, delete-orphan")
 
@@ -98,11 +101,12 @@ class Semester(Base):
     __tablename__ = "semesters"
     __table_args__ = (
         CheckConstraint("start_date <= end_date", name="ck_semesters_date_range"),
+        Index("ix_semesters_program", "program_id"),
     )
     
     id = Column(String, primary_key=True, index=True, default=generate_uuid)
     name = Column(String, index=True)
-    program_id = Column(String, ForeignKey("programs.id"))
+    program_id = Column(String, ForeignKey("programs.id", ondelete="CASCADE"))
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
     reading_week_start = Column(Date, nullable=True)
@@ -110,27 +114,35 @@ class Semester(Base):
     
     average_percentage = Column(Float, default=0.0)
     average_scaled = Column(Float, default=0.0)
+    # Credit-weighted sums over counted courses, stored so Program CGPA aggregates Semester rows instead of Courses.
+    total_credits = Column(Float, nullable=False, default=0.0, server_default="0")
+    weighted_gpa_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    weighted_percentage_sum = Column(Float, nullable=False, default=0.0, server_default="0")
     
     # Relationships
     program = relationship("Program", back_populates="semesters")
-    courses = relationship("Course", back_populates="semester", cascade="all, delete-orphan")
-    widgets = relationship("Widget", back_populates="semester_context", cascade="all, delete-orphan")
-    tabs = relationship("Tab", back_populates="semester_context", cascade="all, delete-orphan")
-    plugin_settings = relationship("PluginSetting", back_populates="semester_context", cascade="all, delete-orphan")
+    courses = relationship("Course", back_populates="semester", cascade="all, delete-orphan", passive_deletes=True)
+    widgets = relationship("Widget", back_populates="semester_context", cascade="all, delete-orphan", passive_deletes=True)
+    tabs = relationship("Tab", back_populates="semester_context", cascade="all, delete-orphan", passive_deletes=True)
+    plugin_settings = relationship("PluginSetting", back_populates="semester_context", cascade="all, delete-orphan", passive_deletes=True)
     todo_sections = relationship("TodoSection", back_populates="semester", cascade="all, delete-orphan")
     todo_tasks = relationship("TodoTask", back_populates="semester", cascade="all, delete-orphan")
 
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_program", "program_id"),
+        Index("ix_courses_semester_include", "semester_id", "include_in_gpa"),
+    )
     
     id = Column(String, primary_key=True, index=True, default=generate_uuid)
     name = Column(String, index=True)
     alias = Column(String, nullable=True)  # Optional alias to help identify the course
     category = Column(String, nullable=True) # Course category (e.g. "MIE", "ECE")
     color = Column(String, nullable=True)
-    program_id = Column(String, ForeignKey("programs.id"), nullable=True) # Should be NOT NULL eventually
-    semester_id = Column(String, ForeignKey("semesters.id"), nullable=True)
+    program_id = Column(String, ForeignKey("programs.id", ondelete="CASCADE"), nullable=True) # Should be NOT NULL eventually
+    semester_id = Column(String, ForeignKey("semesters.id", ondelete="CASCADE"), nullable=True)
     
     credits = Column(Float, default=0.0)
     grade_percentage = Column(Float, default=0.0)
@@ -141,9 +153,9 @@ class Course(Base):
     # Relationships
     program = relationship("Program", back_populates="courses")
     semester = relationship("Semester", back_populates="courses")
-    widgets = relationship("Widget", back_populates="course_context", cascade="all, delete-orphan")
-    tabs = relationship("Tab", back_populates="course_context", cascade="all, delete-orphan")
-    plugin_settings = relationship("PluginSetting", back_populates="course_context", cascade="all, delete-orphan")
+    widgets = relationship("Widget", back_populates="course_context", cascade="all, delete-orphan", passive_deletes=True)
+    tabs = relationship("Tab", back_populates="course_context", cascade="all, delete-orphan", passive_deletes=True)
+    plugin_settings = relationship("PluginSetting", back_populates="course_context", cascade="all, delete-orphan", passive_deletes=True)
     event_types = relationship("CourseEventType", back_populates="course", cascade="all, delete-orphan")
     sections = relationship("CourseSection", back_populates="course", cascade="all, delete-orphan")
     events = relationship("CourseEvent", back_populates="course", cascade="all, delete-orphan")
@@ -341,6 +353,7 @@ class CourseSection(Base):
             ["course_id", "event_type_code"],
             ["course_event_types.course_id", "course_event_types.code"],
             ondelete="CASCADE",
+            onupdate="CASCADE",
             name="fk_course_sections_event_type",
         ),
         UniqueConstraint("course_id", "section_id", name="uq_course_sections_course_section"),
@@ -379,6 +392,7 @@ class CourseEvent(Base):
             ["course_id", "event_type_code"],
             ["course_event_types.course_id", "course_event_types.code"],
             ondelete="CASCADE",
+            onupdate="CASCADE",
             name="fk_course_events_event_type",
         ),
         ForeignKeyConstraint(
@@ -480,6 +494,8 @@ class Widget(Base):
             "((semester_id IS NOT NULL AND course_id IS NULL) OR (semester_id IS NULL AND course_id IS NOT NULL))",
             name="ck_widgets_single_context",
         ),
+        Index("ix_widgets_semester", "semester_id"),
+        Index("ix_widgets_course", "course_id"),
     )
     
     id = Column(String, primary_key=True, index=True, default=generate_uuid)
@@ -493,8 +509,8 @@ class Widget(Base):
     is_removable = Column(Boolean, default=True)
     
     # Parent Context (Polymorphic-ish, or just optional FKs)
-    semester_id = Column(String, ForeignKey("semesters.id"), nullable=True)
-    course_id = Column(String, ForeignKey("courses.id"), nullable=True)
+    semester_id = Column(String, ForeignKey("semesters.id", ondelete="CASCADE"), nullable=True)
+    course_id = Column(String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=True)
     
     # Relationships
     semester_context = relationship("Semester", back_populates="widgets")
@@ -507,6 +523,8 @@ class Tab(Base):
             "((semester_id IS NOT NULL AND course_id IS NULL) OR (semester_id IS NULL AND course_id IS NOT NULL))",
             name="ck_tabs_single_context",
         ),
+        Index("ix_tabs_semester_order", "semester_id", "order_index"),
+        Index("ix_tabs_course_order", "course_id", "order_index"),
     )
 
     id = Column(String, primary_key=True, index=True, default=generate_uuid)
@@ -516,8 +534,8 @@ class Tab(Base):
     is_removable = Column(Boolean, default=True)
     is_draggable = Column(Boolean, default=True)
 
-    semester_id = Column(String, ForeignKey("semesters.id"), nullable=True)
-    course_id = Column(String, ForeignKey("courses.id"), nullable=True)
+    semester_id = Column(String, ForeignKey("semesters.id", ondelete="CASCADE"), nullable=True)
+    course_id = Column(String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=True)
 
     semester_context = relationship("Semester", back_populates="tabs")
     course_context = relationship("Course", back_populates="tabs")
@@ -537,8 +555,8 @@ class PluginSetting(Base):
     plugin_id = Column(String, nullable=False, index=True)
     settings = Column(Text, default="{}")
 
-    semester_id = Column(String, ForeignKey("semesters.id"), nullable=True)
-    course_id = Column(String, ForeignKey("courses.id"), nullable=True)
+    semester_id = Column(String, ForeignKey("semesters.id", ondelete="CASCADE"), nullable=True)
+    course_id = Column(String, ForeignKey("courses.id", ondelete="CASCADE"), nullable=True)
 
     semester_context = relationship("Semester", back_populates="plugin_settings")
     course_context = relationship("Course", back_populates="plugin_settings")
@@ -1,5 +1,5 @@
-# input:  [SQLAlchemy sessions, backend models/schemas/crud services, shared API validators, and ics-derived meeting payloads]
-# output: [Schedule/event helper functions for event types, sections, events, conflict detection, calendar export shaping, and ICS schedule import]
+# input:  [SQLAlchemy sessions, backend models/schemas, shared API validators, and ics-derived meeting payloads]
+# output: [Schedule/event helper functions for event types, single-query, batch-streamed semester or course event loading with per-event week bitmasks reused across weeks, sections, events (validated against per-batch event-type/section lookups when provided), conflict detection, one-query owned course/semester plus timezone resolution, calendar export shaping, and ICS schedule import as a DB-free per-course row builder plus bulk row insertion]
 # pos:    [backend schedule support layer shared by course schedule routes, course import flows, and backup restore validation]
 #
 # ⚠️ When this file is updated:
@@ -8,24 +8,26 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 
 from api_common import (
     BUILTIN_EVENT_TYPE_ABBREVIATIONS,
     BUILTIN_EVENT_TYPE_CODES,
-    TIME_FORMAT,
     error_detail,
     get_event_type_or_404,
-    get_owned_course,
-    get_owned_semester,
     get_section_or_422,
     get_semester_max_week,
     normalize_week_pattern_input,
+    raise_event_type_not_found,
+    raise_section_not_found,
     touch_model_timestamp,
     validate_day_of_week,
     validate_program_timezone_or_422,
@@ -33,7 +35,6 @@ from api_common import (
     validate_time_range,
     validate_week_range,
 )
-import crud
 import models
 import schemas
 
@@ -55,30 +56,29 @@ def resolve_week_index(semester: models.Semester, timezone: str, requested_week:
     return 1
 
 
-def matches_week_pattern(week_pattern: str, week: int, start_week: Optional[int] = 1) -> bool:
-    if week_pattern == "EVERY":
-        return True
-    if week_pattern == "ALTERNATING":
-        anchor_week = start_week or 1
-        return (week - anchor_week) % 2 == 0
-    return False
+# Exports parse the same few "HH:MM" strings for every item; time objects are immutable, so share them.
+@lru_cache(maxsize=1024)
+def parse_time_value(value: str) -> time:
+    hour, minute = value.split(":")
+    return time(int(hour), int(minute))
 
 
-def parse_time_value(value: str) -> time:
-    return datetime.strptime(value, TIME_FORMAT).time()
+def week_day_ordinal(semester_start_ordinal: int, week: int, day_of_week: int) -> int:
+    return semester_start_ordinal + (week - 1) * 7 + (day_of_week - 1)
 
 
-def week_date(semester_start: date, week: int, day_of_week: int) -> date:
-    return semester_start + timedelta(days=((week - 1) * 7 + (day_of_week - 1)))
+def week_date(semester_start_ordinal: int, week: int, day_of_week: int) -> date:
+    # Callers pass semester.start_date.toordinal() once, so per-item dates need no timedelta.
+    return date.fromordinal(week_day_ordinal(semester_start_ordinal, week, day_of_week))
 
 
 def dedupe_warnings(warnings: list[str]) -> list[str]:
     return list(dict.fromkeys(warnings))
 
 
-def item_in_date_range(item: dict, semester_start: date, start_date: date, end_date: date) -> bool:
-    occurrence_date = week_date(semester_start, item["week"], item["day_of_week"])
-    return start_date <= occurrence_date < end_date
+def item_in_date_range(item: dict, semester_start_ordinal: int, start_ordinal: int, end_ordinal: int) -> bool:
+    occurrence_ordinal = week_day_ordinal(semester_start_ordinal, item["week"], item["day_of_week"])
+    return start_ordinal <= occurrence_ordinal < end_ordinal
 
 
 def detect_conflicts(items: list[dict]) -> list[dict]:
@@ -88,30 +88,45 @@ def detect_conflicts(items: list[dict]) -> list[dict]:
             active_indices.append(index)
 
     parent = {idx: idx for idx in active_indices}
+    rank = {idx: 0 for idx in active_indices}
 
     def find_parent(x: int) -> int:
-        if parent[x] != x:
-            parent[x] = find_parent(parent[x])
-        return parent[x]
+        # Iterative find with path compression, so long union chains cannot hit the recursion limit.
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
 
     def union(a: int, b: int):
         root_a = find_parent(a)
         root_b = find_parent(b)
-        if root_a != root_b:
-            parent[root_b] = root_a
-
-    for i in range(len(active_indices)):
-        idx_a = active_indices[i]
-        a = items[idx_a]
-        for j in range(i + 1, len(active_indices)):
-            idx_b = active_indices[j]
+        if root_a == root_b:
+            return
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+    indices_by_day: dict[Any, list[int]] = {}
+    for idx in active_indices:
+        indices_by_day.setdefault(items[idx]["day_of_week"], []).append(idx)
+
+    # Sweep each day in start order, comparing an item only with intervals that are still open.
+    for day_indices in indices_by_day.values():
+        day_indices.sort(key=lambda idx: items[idx]["start_time"])
+        open_indices: list[int] = []
+        for idx_b in day_indices:
             b = items[idx_b]
-            if a["course_id"] == b["course_id"]:
-                continue
-            if a["day_of_week"] != b["day_of_week"]:
-                continue
-            if a["start_time"] < b["end_time"] and b["start_time"] < a["end_time"]:
-                union(idx_a, idx_b)
+            # Later items start no earlier, so an interval ending by this start can be dropped for good.
+            open_indices = [idx_a for idx_a in open_indices if b["start_time"] < items[idx_a]["end_time"]]
+            for idx_a in open_indices:
+                a = items[idx_a]
+                if a["course_id"] != b["course_id"] and a["start_time"] < b["end_time"]:
+                    union(idx_a, idx_b)
+            open_indices.append(idx_b)
 
     groups: dict[int, list[int]] = {}
     for idx in active_indices:
@@ -156,32 +171,36 @@ def serialize_schedule_item(item: dict, include_render_state: bool = False) -> d
     return payload
 
 
-def event_to_week_item(
-    event: models.CourseEvent,
-    course_name: str,
-    week: int,
-    max_week: int,
-    warnings: list[str],
-) -> Optional[dict]:
+def event_week_mask(event: models.CourseEvent, max_week: int, warnings: list[str]) -> int:
+    """Return a bitmask with bit ``week`` set for every week the event renders in."""
     try:
-        validate_time_range(event.start_time, event.end_time)
+        validate_time_range(event.start_time, event.end_time, allow_unpadded=True)
         validate_day_of_week(event.day_of_week)
     except HTTPException:
         warnings.append(f"Skipped invalid event '{event.id}' due to invalid time/day data.")
-        return None
+        return 0
 
     effective_start_week = event.start_week or 1
     effective_end_week = event.end_week or max_week
     if effective_start_week > effective_end_week:
         warnings.append(f"Skipped invalid event '{event.id}' due to invalid week range.")
-        return None
-    if week < effective_start_week or week > effective_end_week:
-        return None
-    if not matches_week_pattern(event.week_pattern, week, effective_start_week):
-        return None
+        return 0
     if not event.enable:
-        return None
+        return 0
+    if event.week_pattern == "EVERY":
+        step = 1
+    elif event.week_pattern == "ALTERNATING":
+        step = 2
+    else:
+        return 0
+
+    mask = 0
+    for week in range(effective_start_week, effective_end_week + 1, step):
+        mask |= 1 << week
+    return mask
 
+
+def event_to_week_item(event: models.CourseEvent, course_name: str, week: int) -> dict:
     return {
         "event_id": event.id,
         "course_id": event.course_id,
@@ -202,36 +221,88 @@ def event_to_week_item(
     }
 
 
-def collect_semester_week_items(
-    db: Session,
-    semester: models.Semester,
-    week: int,
-) -> tuple[list[dict], list[str]]:
-    max_week = get_semester_max_week(semester)
-    warnings: list[str] = []
-    courses = db.query(models.Course).filter(models.Course.semester_id == semester.id).all()
-    events = (
-        db.query(models.CourseEvent)
+SCHEDULE_EVENT_BATCH_SIZE = 500
+
+
+def load_semester_events(db: Session, semester: models.Semester) -> Iterable[tuple[models.CourseEvent, str]]:
+    # One joined query returns each event with only its course name, instead of loading every Course row;
+    # rows are streamed in batches so callers never hold the raw result set in memory.
+    return (
+        db.query(models.CourseEvent, models.Course.name)
         .join(models.Course, models.CourseEvent.course_id == models.Course.id)
         .filter(models.Course.semester_id == semester.id)
-        .all()
+        .yield_per(SCHEDULE_EVENT_BATCH_SIZE)
     )
-    course_name_map = {course.id: course.name for course in courses}
 
-    items: list[dict] = []
-    for event in events:
-        item = event_to_week_item(
-            event=event,
-            course_name=course_name_map.get(event.course_id, "Unknown Course"),
-            week=week,
-            max_week=max_week,
-            warnings=warnings,
-        )
-        if item is not None:
-            items.append(item)
+
+def load_course_events(db: Session, course: models.Course) -> Iterable[tuple[models.CourseEvent, str]]:
+    events = (
+        db.query(models.CourseEvent)
+        .filter(models.CourseEvent.course_id == course.id)
+        .yield_per(SCHEDULE_EVENT_BATCH_SIZE)
+    )
+    return ((event, course.name) for event in events)
+
+
+def prepare_week_events(
+    events: Iterable[tuple[models.CourseEvent, str]],
+    max_week: int,
+) -> tuple[list[tuple[models.CourseEvent, str, int]], list[str]]:
+    # Validation and week-pattern matching happen once per event; rendering any number of
+    # weeks afterwards only tests one bit per event. Events that never render are dropped.
+    warnings: list[str] = []
+    prepared: list[tuple[models.CourseEvent, str, int]] = []
+    for event, course_name in events:
+        week_mask = event_week_mask(event, max_week, warnings)
+        if week_mask:
+            prepared.append((event, course_name, week_mask))
+    return prepared, warnings
+
+
+def build_items_by_week(
+    prepared_events: list[tuple[models.CourseEvent, str, int]],
+    weeks: Iterable[int],
+) -> dict[int, list[dict]]:
+    # Walk only the set bits of each event's mask within the requested weeks, so multi-week
+    # renders do work proportional to the emitted items; per-week order follows event order.
+    items_by_week: dict[int, list[dict]] = {}
+    requested_mask = 0
+    for week in weeks:
+        items_by_week[week] = []
+        requested_mask |= 1 << week
+    for event, course_name, week_mask in prepared_events:
+        remaining = week_mask & requested_mask
+        while remaining:
+            lowest_bit = remaining & -remaining
+            week = lowest_bit.bit_length() - 1
+            items_by_week[week].append(event_to_week_item(event, course_name, week))
+            remaining ^= lowest_bit
+    return items_by_week
+
+
+def stream_week_items(
+    events: Iterable[tuple[models.CourseEvent, str]],
+    week: int,
+    max_week: int,
+) -> tuple[list[dict], list[str]]:
+    # Single-week renders keep only the matching items while rows stream in.
+    warnings: list[str] = []
+    items = [
+        event_to_week_item(event, course_name, week)
+        for event, course_name in events
+        if event_week_mask(event, max_week, warnings) >> week & 1
+    ]
     return items, warnings
 
 
+def collect_semester_week_items(
+    db: Session,
+    semester: models.Semester,
+    week: int,
+) -> tuple[list[dict], list[str]]:
+    return stream_week_items(load_semester_events(db, semester), week, get_semester_max_week(semester))
+
+
 def collect_semester_range_items(
     db: Session,
     semester: models.Semester,
@@ -250,18 +321,20 @@ def collect_semester_range_items(
     if overlap_start >= overlap_end:
         return [], []
 
+    max_week = get_semester_max_week(semester)
     start_week = max(1, ((overlap_start - semester.start_date).days // 7) + 1)
-    end_week = min(get_semester_max_week(semester), ((overlap_end - timedelta(days=1) - semester.start_date).days // 7) + 1)
+    end_week = min(max_week, ((overlap_end - timedelta(days=1) - semester.start_date).days // 7) + 1)
 
+    semester_start_ordinal = semester.start_date.toordinal()
+    overlap_start_ordinal = overlap_start.toordinal()
+    overlap_end_ordinal = overlap_end.toordinal()
     items: list[dict] = []
-    warnings: list[str] = []
-    for week in range(start_week, end_week + 1):
-        week_items, week_warnings = collect_semester_week_items(db, semester, week)
+    prepared, warnings = prepare_week_events(load_semester_events(db, semester), max_week)
+    for week_items in build_items_by_week(prepared, range(start_week, end_week + 1)).values():
         items.extend(
             item for item in week_items
-            if item_in_date_range(item, semester.start_date, overlap_start, overlap_end)
+            if item_in_date_range(item, semester_start_ordinal, overlap_start_ordinal, overlap_end_ordinal)
         )
-        warnings.extend(week_warnings)
 
     if with_conflicts:
         items = detect_conflicts(items)
@@ -275,21 +348,7 @@ def collect_course_week_items(
     semester: models.Semester,
     week: int,
 ) -> tuple[list[dict], list[str]]:
-    max_week = get_semester_max_week(semester)
-    warnings: list[str] = []
-    events = db.query(models.CourseEvent).filter(models.CourseEvent.course_id == course.id).all()
-    items: list[dict] = []
-    for event in events:
-        item = event_to_week_item(
-            event=event,
-            course_name=course.name,
-            week=week,
-            max_week=max_week,
-            warnings=warnings,
-        )
-        if item is not None:
-            items.append(item)
-    return items, warnings
+    return stream_week_items(load_course_events(db, course), week, get_semester_max_week(semester))
 
 
 def get_course_semester_and_timezone(
@@ -297,20 +356,51 @@ def get_course_semester_and_timezone(
     current_user: models.User,
     course_id: str,
 ) -> tuple[models.Course, models.Semester, str]:
-    course = get_owned_course(db, current_user, course_id)
+    # One round trip resolves the owned course, its program timezone, the semester, and
+    # the semester's owner (a semester only counts when it belongs to the same user).
+    semester_program = aliased(models.Program)
+    row = (
+        db.query(models.Course, models.Program.program_timezone, models.Semester, semester_program.owner_id)
+        .join(models.Program, models.Course.program_id == models.Program.id)
+        .outerjoin(models.Semester, models.Semester.id == models.Course.semester_id)
+        .outerjoin(semester_program, semester_program.id == models.Semester.program_id)
+        .filter(models.Course.id == course_id, models.Program.owner_id == current_user.id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    course, program_timezone, semester, semester_owner_id = row
     if not course.semester_id:
         raise HTTPException(
             status_code=422,
             detail=error_detail("COURSE_NOT_IN_SEMESTER", "Course is not assigned to a semester."),
         )
-    semester = get_owned_semester(db, current_user, course.semester_id)
-    program = crud.get_program(db, course.program_id, current_user.id)
-    if not program:
-        raise HTTPException(status_code=404, detail="Program not found")
-    timezone = (program.program_timezone or "UTC").strip() or "UTC"
+    if semester is None or semester_owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Semester not found")
+    timezone = (program_timezone or "UTC").strip() or "UTC"
     return course, semester, timezone
 
 
+def get_semester_and_timezone(
+    db: Session,
+    current_user: models.User,
+    semester_id: str,
+) -> tuple[models.Semester, str]:
+    # Schedule reads only need the program timezone, so read it alongside the owned semester
+    # instead of loading the Program (and syncing its subject colors) separately.
+    row = (
+        db.query(models.Semester, models.Program.program_timezone)
+        .join(models.Program, models.Semester.program_id == models.Program.id)
+        .filter(models.Semester.id == semester_id, models.Program.owner_id == current_user.id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Semester not found")
+    semester, program_timezone = row
+    timezone = (program_timezone or "UTC").strip() or "UTC"
+    return semester, timezone
+
+
 def parse_export_weeks(
     export_range: schemas.ExportRange,
     provided_week: Optional[int],
@@ -355,17 +445,30 @@ def derive_event_type_abbreviation(code: str) -> str:
     return (normalized[:4] or "TYPE")
 
 
-def resolve_unique_event_type_abbreviation(db: Session, course_id: str, event_type_code: str) -> str:
+def resolve_unique_event_type_abbreviation(
+    db: Session,
+    course_id: str,
+    event_type_code: str,
+    existing_abbreviations: Optional[set[str]] = None,
+) -> str:
+    # Callers creating several event types pass a shared set; the chosen abbreviation is added to it.
+    if existing_abbreviations is None:
+        existing_abbreviations = {
+            row[0]
+            for row in (
+                db.query(models.CourseEventType.abbreviation)
+                .filter(models.CourseEventType.course_id == course_id)
+                .all()
+            )
+            if row[0]
+        }
+    abbreviation = _pick_unique_event_type_abbreviation(event_type_code, existing_abbreviations)
+    existing_abbreviations.add(abbreviation)
+    return abbreviation
+
+
+def _pick_unique_event_type_abbreviation(event_type_code: str, existing_abbreviations: set[str]) -> str:
     preferred = derive_event_type_abbreviation(event_type_code)
-    existing_abbreviations = {
-        row[0]
-        for row in (
-            db.query(models.CourseEventType.abbreviation)
-            .filter(models.CourseEventType.course_id == course_id)
-            .all()
-        )
-        if row[0]
-    }
     if preferred not in existing_abbreviations:
         return preferred
 
@@ -382,20 +485,25 @@ def resolve_unique_event_type_abbreviation(db: Session, course_id: str, event_ty
 
 
 def ensure_builtin_event_types_for_course(db: Session, course_id: str):
-    existing_codes = {
-        row[0]
-        for row in (
-            db.query(models.CourseEventType.code)
-            .filter(models.CourseEventType.course_id == course_id)
-            .all()
-        )
-    }
+    existing_rows = (
+        db.query(models.CourseEventType.code, models.CourseEventType.abbreviation)
+        .filter(models.CourseEventType.course_id == course_id)
+        .all()
+    )
+    existing_codes = {code for code, _abbreviation in existing_rows}
+    existing_abbreviations = {abbreviation for _code, abbreviation in existing_rows if abbreviation}
     missing_codes = sorted(BUILTIN_EVENT_TYPE_CODES - existing_codes)
     for code in missing_codes:
-        ensure_course_event_type_exists(db, course_id, code)
+        ensure_course_event_type_exists(db, course_id, code, existing_abbreviations=existing_abbreviations)
 
 
-def ensure_course_event_type_exists(db: Session, course_id: str, event_type_code: str) -> models.CourseEventType:
+def ensure_course_event_type_exists(
+    db: Session,
+    course_id: str,
+    event_type_code: str,
+    now_iso: Optional[str] = None,
+    existing_abbreviations: Optional[set[str]] = None,
+) -> models.CourseEventType:
     event_type_code = event_type_code.strip()
     existing = (
         db.query(models.CourseEventType)
@@ -408,12 +516,12 @@ def ensure_course_event_type_exists(db: Session, course_id: str, event_type_code
     event_type = models.CourseEventType(
         course_id=course_id,
         code=event_type_code,
-        abbreviation=resolve_unique_event_type_abbreviation(db, course_id, event_type_code),
+        abbreviation=resolve_unique_event_type_abbreviation(db, course_id, event_type_code, existing_abbreviations),
         track_attendance=False,
         created_at="",
         updated_at="",
     )
-    touch_model_timestamp(event_type)
+    touch_model_timestamp(event_type, now_iso)
     db.add(event_type)
     try:
         db.flush()
@@ -436,44 +544,125 @@ def ensure_course_event_type_exists(db: Session, course_id: str, event_type_code
     return event_type
 
 
-def validate_section_payload(course_id: str, payload: dict, db: Session):
+def validate_section_payload(
+    course_id: str,
+    payload: dict,
+    db: Session,
+    known_event_type_codes: Optional[set[str]] = None,
+    *,
+    allow_unpadded_times: bool = False,
+):
+    # Bulk callers pass the course's event-type codes once instead of querying per section.
+    # Callers re-validating stored times pass allow_unpadded_times so legacy "9:00" rows stay valid.
     section_id = payload.get("section_id")
     if section_id is not None:
         validate_section_id(section_id)
     payload["event_type_code"] = payload["event_type_code"].strip()
     payload["week_pattern"] = normalize_week_pattern_input(payload["week_pattern"])
     validate_day_of_week(payload["day_of_week"])
-    validate_time_range(payload["start_time"], payload["end_time"])
+    validate_time_range(payload["start_time"], payload["end_time"], allow_unpadded=allow_unpadded_times)
     validate_week_range(payload["start_week"], payload["end_week"], "SECTION")
-    get_event_type_or_404(db, course_id, payload["event_type_code"])
+    if known_event_type_codes is None:
+        get_event_type_or_404(db, course_id, payload["event_type_code"])
+    elif payload["event_type_code"] not in known_event_type_codes:
+        raise_event_type_not_found(payload["event_type_code"])
+
+
+@dataclass
+class CourseScheduleLookups:
+    """A course's event-type attendance flags and section event types, read once for a batch of event writes."""
 
+    track_attendance_by_code: dict[str, bool]
+    section_event_type_codes: dict[str, str]
 
-def validate_event_payload(course_id: str, payload: dict, db: Session):
+
+def load_course_schedule_lookups(db: Session, course_id: str) -> CourseScheduleLookups:
+    return CourseScheduleLookups(
+        track_attendance_by_code=dict(
+            db.query(models.CourseEventType.code, models.CourseEventType.track_attendance)
+            .filter(models.CourseEventType.course_id == course_id)
+            .all()
+        ),
+        section_event_type_codes=dict(
+            db.query(models.CourseSection.section_id, models.CourseSection.event_type_code)
+            .filter(models.CourseSection.course_id == course_id)
+            .all()
+        ),
+    )
+
+
+def validate_event_payload(
+    course_id: str,
+    payload: dict,
+    db: Session,
+    lookups: Optional[CourseScheduleLookups] = None,
+    *,
+    allow_unpadded_times: bool = False,
+):
     payload["event_type_code"] = payload["event_type_code"].strip()
     payload["week_pattern"] = normalize_week_pattern_input(payload["week_pattern"])
     validate_day_of_week(payload["day_of_week"])
-    validate_time_range(payload["start_time"], payload["end_time"])
+    validate_time_range(payload["start_time"], payload["end_time"], allow_unpadded=allow_unpadded_times)
     validate_week_range(payload.get("start_week"), payload.get("end_week"), "EVENT")
-    get_event_type_or_404(db, course_id, payload["event_type_code"])
-
-    section = get_section_or_422(db, course_id, payload.get("section_id"))
-    if section and section.event_type_code != payload["event_type_code"]:
+    event_type_code = payload["event_type_code"]
+    section_id = payload.get("section_id")
+    if lookups is None:
+        track_attendance = get_event_type_or_404(db, course_id, event_type_code).track_attendance
+        section = get_section_or_422(db, course_id, section_id)
+        section_event_type_code = section.event_type_code if section else None
+    else:
+        if event_type_code not in lookups.track_attendance_by_code:
+            raise_event_type_not_found(event_type_code)
+        track_attendance = lookups.track_attendance_by_code[event_type_code]
+        section_event_type_code = None
+        if section_id is not None:
+            if section_id not in lookups.section_event_type_codes:
+                raise_section_not_found(section_id)
+            section_event_type_code = lookups.section_event_type_codes[section_id]
+
+    if section_event_type_code is not None and section_event_type_code != event_type_code:
         raise HTTPException(
             status_code=422,
             detail=error_detail("SECTION_EVENT_TYPE_MISMATCH", "sectionId does not match eventTypeCode."),
         )
 
-    payload["skip"] = normalize_event_skip(db, course_id, payload["event_type_code"], bool(payload.get("skip", False)))
+    payload["skip"] = False if track_attendance else bool(payload.get("skip", False))
 
 
-def import_course_schedule_from_ics(
-    db: Session,
-    course: models.Course,
+def build_course_schedule_rows(
+    course_id: str,
     meetings: list[dict[str, Any]],
-):
+    *,
+    event_types: Iterable[tuple[str, Optional[str]]],
+    section_event_type_codes: dict[str, str],
+    imported_at: str,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    # Validates ICS meetings against the course's known (code, abbreviation) event types and
+    # section -> event-type map without touching the database, so callers importing several
+    # courses can write every table with one executemany. Inputs are copied, never mutated.
+    event_types = list(event_types)
+    known_event_type_codes = {code for code, _abbreviation in event_types}
+    known_abbreviations = {abbreviation for _code, abbreviation in event_types if abbreviation}
+    section_event_type_codes = dict(section_event_type_codes)
+    event_type_rows: list[dict[str, Any]] = []
+    section_rows: list[dict[str, Any]] = []
+    event_rows: list[dict[str, Any]] = []
     for meeting in meetings:
         event_type_code = str(meeting.get("eventTypeCode", "")).strip() or "LECTURE"
-        ensure_course_event_type_exists(db, course.id, event_type_code)
+        if event_type_code not in known_event_type_codes:
+            abbreviation = _pick_unique_event_type_abbreviation(event_type_code, known_abbreviations)
+            known_abbreviations.add(abbreviation)
+            known_event_type_codes.add(event_type_code)
+            event_type_rows.append(
+                {
+                    "course_id": course_id,
+                    "code": event_type_code,
+                    "abbreviation": abbreviation,
+                    "track_attendance": False,
+                    "created_at": imported_at,
+                    "updated_at": imported_at,
+                }
+            )
 
         day_of_week = int(meeting.get("dayOfWeek", 1))
         start_time = str(meeting.get("startTime", "09:00")).strip()
@@ -492,47 +681,65 @@ def import_course_schedule_from_ics(
 
         if section_id:
             validate_section_id(section_id)
-            existing_section = (
-                db.query(models.CourseSection)
-                .filter(models.CourseSection.course_id == course.id, models.CourseSection.section_id == section_id)
-                .first()
-            )
-            if existing_section is None:
-                section_payload = {
-                    "section_id": section_id,
-                    "event_type_code": event_type_code,
-                    "title": meeting.get("title"),
-                    "instructor": meeting.get("instructor"),
-                    "location": meeting.get("location"),
-                    "day_of_week": day_of_week,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "week_pattern": week_pattern,
-                    "start_week": start_week,
-                    "end_week": end_week,
-                }
-                validate_section_payload(course.id, section_payload, db)
-                db_section = models.CourseSection(course_id=course.id, **section_payload)
-                touch_model_timestamp(db_section)
-                db.add(db_section)
+            if section_id not in section_event_type_codes:
+                # Same checks as validate_section_payload; the event type is known to exist by now.
+                validate_week_range(start_week, end_week, "SECTION")
+                section_rows.append(
+                    {
+                        "course_id": course_id,
+                        "section_id": section_id,
+                        "event_type_code": event_type_code,
+                        "title": meeting.get("title"),
+                        "instructor": meeting.get("instructor"),
+                        "location": meeting.get("location"),
+                        "day_of_week": day_of_week,
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "week_pattern": week_pattern,
+                        "start_week": start_week,
+                        "end_week": end_week,
+                        "created_at": imported_at,
+                        "updated_at": imported_at,
+                    }
+                )
+                section_event_type_codes[section_id] = event_type_code
                 linked_section_id = section_id
-            elif existing_section.event_type_code == event_type_code:
+            elif section_event_type_codes[section_id] == event_type_code:
                 linked_section_id = section_id
 
-        db_event = models.CourseEvent(
-            course_id=course.id,
-            event_type_code=event_type_code,
-            section_id=linked_section_id,
-            title=meeting.get("title"),
-            day_of_week=day_of_week,
-            start_time=start_time,
-            end_time=end_time,
-            week_pattern=week_pattern,
-            start_week=start_week,
-            end_week=end_week,
-            enable=True,
-            skip=False,
-            note=meeting.get("note"),
+        event_rows.append(
+            {
+                "course_id": course_id,
+                "event_type_code": event_type_code,
+                "section_id": linked_section_id,
+                "title": meeting.get("title"),
+                "day_of_week": day_of_week,
+                "start_time": start_time,
+                "end_time": end_time,
+                "week_pattern": week_pattern,
+                "start_week": start_week,
+                "end_week": end_week,
+                "enable": True,
+                "skip": False,
+                "note": meeting.get("note"),
+                "created_at": imported_at,
+                "updated_at": imported_at,
+            }
         )
-        touch_model_timestamp(db_event)
-        db.add(db_event)
+
+    return event_type_rows, section_rows, event_rows
+
+
+def insert_course_schedule_rows(
+    db: Session,
+    event_type_rows: list[dict[str, Any]],
+    section_rows: list[dict[str, Any]],
+    event_rows: list[dict[str, Any]],
+):
+    # Event types go first, then sections, because events reference both through composite keys.
+    if event_type_rows:
+        db.execute(insert(models.CourseEventType), event_type_rows)
+    if section_rows:
+        db.execute(insert(models.CourseSection), section_rows)
+    if event_rows:
+        db.execute(insert(models.CourseEvent), event_rows)
@@ -1,12 +1,11 @@
-# input:  [unittest, asyncio, temp filesystem/env setup, in-memory SQLAlchemy session, and backend backup/LMS/resource modules]
-# output: [regression tests covering full backup export/import for LMS integrations, program-level courses, schedule data, resources, todo state, account settings, and gradebook point-based scores]
+# input:  [unittest, temp filesystem/env setup, in-memory SQLAlchemy session, and backend backup/LMS/resource modules]
+# output: [regression tests covering full backup export/import for LMS integrations, program-level courses, schedule data (including legacy unpadded times), resources, todo state, account settings, gradebook point-based scores, overwrite-mode name conflicts, rejected overwrites keeping the existing program, and the export route rejecting a missing resource file before streaming]
 # pos:    [backend regression tests for the account backup pipeline across current persisted features, including gradebook point-based assessment inputs]
 #
 # ⚠️ When this file is updated:
 #    1. Update these header comments
 #    2. Update the INDEX.md of the folder this file belongs to
 
-import asyncio
 import os
 import tempfile
 import unittest
@@ -14,6 +13,7 @@ from datetime import date
 from pathlib import Path
 import sys
 
+from fastapi import HTTPException
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -24,6 +24,7 @@ BACKEND_DIR = Path(__file__).resolve().parent
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+import backup_transfer
 import course_resources
 import crud
 import database
@@ -336,7 +337,16 @@ class BackupImportExportTests(unittest.TestCase):
         )
         self.db.commit()
 
-        exported = asyncio.run(main.export_user_data(db=self.db, current_user=self.source_user))
+        exported = schemas.UserDataExport.model_validate_json(
+            b"".join(
+                backup_transfer.stream_user_data_export(
+                    self.db,
+                    self.source_user,
+                    base_dir=main.BASE_DIR,
+                    error_detail=main.error_detail,
+                )
+            )
+        )
         self.assertEqual(exported.version, "2.2.2")
         self.assertEqual(exported.settings.background_plugin_preload, False)
         self.assertEqual(len(exported.lms_integrations), 1)
@@ -344,14 +354,12 @@ class BackupImportExportTests(unittest.TestCase):
         self.assertEqual(len(exported.programs[0].semesters[0].courses[0].resource_files), 2)
         self.assertEqual(len(exported.programs[0].semesters[0].todo.tasks), 1)
 
-        result = asyncio.run(
-            main.import_user_data(
-                data=schemas.UserDataImport.model_validate(exported.model_dump()),
-                conflict_mode="skip",
-                include_settings=True,
-                db=self.db,
-                current_user=self.target_user,
-            )
+        result = main.import_user_data(
+            data=schemas.UserDataImport.model_validate(exported.model_dump()),
+            conflict_mode="skip",
+            include_settings=True,
+            db=self.db,
+            current_user=self.target_user,
         )
         self.assertTrue(result["ok"])
         self.assertEqual(result["imported"]["lms_integrations"], 1)
@@ -421,6 +429,143 @@ class BackupImportExportTests(unittest.TestCase):
         self.assertEqual(restored_assessment.source_kind, "lms_assignment")
         self.assertEqual(restored_assessment.source_external_id, "assignment-1")
 
+    def test_export_then_import_keeps_legacy_unpadded_schedule_times(self) -> None:
+        program = crud.create_program(self.db, schemas.ProgramCreate(name="Engineering"), self.source_user.id)
+        course = crud.create_course(self.db, schemas.CourseCreate(name="MIE200", credits=0.5), program.id)
+        self.db.add(
+            models.CourseSection(
+                course_id=course.id,
+                section_id="0101",
+                event_type_code="LECTURE",
+                day_of_week=1,
+                start_time="9:00",
+                end_time="9:50",
+                created_at="",
+                updated_at="",
+            )
+        )
+        self.db.add(
+            models.CourseEvent(
+                course_id=course.id,
+                event_type_code="LECTURE",
+                section_id="0101",
+                day_of_week=1,
+                start_time="9:00",
+                end_time="9:50",
+                created_at="",
+                updated_at="",
+            )
+        )
+        self.db.commit()
+
+        exported = schemas.UserDataExport.model_validate_json(
+            b"".join(
+                backup_transfer.stream_user_data_export(
+                    self.db,
+                    self.source_user,
+                    base_dir=main.BASE_DIR,
+                    error_detail=main.error_detail,
+                )
+            )
+        )
+        result = main.import_user_data(
+            data=schemas.UserDataImport.model_validate(exported.model_dump()),
+            conflict_mode="skip",
+            include_settings=False,
+            db=self.db,
+            current_user=self.target_user,
+        )
+
+        self.assertTrue(result["ok"])
+        restored_course = (
+            self.db.query(models.Course)
+            .join(models.Program)
+            .filter(models.Program.owner_id == self.target_user.id)
+            .one()
+        )
+        self.assertEqual([(row.start_time, row.end_time) for row in restored_course.sections], [("9:00", "9:50")])
+        self.assertEqual([(row.start_time, row.end_time) for row in restored_course.events], [("9:00", "9:50")])
+
+    def test_export_route_reports_missing_resource_file_before_streaming(self) -> None:
+        program = crud.create_program(self.db, schemas.ProgramCreate(name="Engineering"), self.source_user.id)
+        course = crud.create_course(self.db, schemas.CourseCreate(name="MIE200", credits=0.5), program.id)
+        resource = course_resources.create_course_resource(
+            self.db,
+            base_dir=main.BASE_DIR,
+            user_id=self.source_user.id,
+            course_id=course.id,
+            filename_original="notes.pdf",
+            filename_display="Lecture Notes",
+            mime_type="application/pdf",
+            content=b"backup-bytes",
+        )
+        course_resources.resolve_absolute_path(main.BASE_DIR, resource).unlink()
+
+        with self.assertRaises(HTTPException) as context:
+            main.export_user_data(db=self.db, current_user=self.source_user)
+
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(context.exception.detail["code"], "COURSE_RESOURCE_FILE_MISSING")
+
+    def test_overwrite_import_replaces_programs_by_name(self) -> None:
+        crud.create_program(self.db, schemas.ProgramCreate(name="Engineering"), user_id=self.target_user.id)
+        backup = schemas.UserDataImport.model_validate(
+            {
+                "version": "2.2.2",
+                "programs": [
+                    {"name": "engineering", "grad_requirement_credits": 10.0},
+                    {"name": "Engineering", "grad_requirement_credits": 20.0},
+                ],
+            }
+        )
+
+        result = main.import_user_data(
+            data=backup,
+            conflict_mode="overwrite",
+            include_settings=False,
+            db=self.db,
+            current_user=self.target_user,
+        )
+
+        self.assertEqual(result["imported"]["programs"], 2)
+        programs = self.db.query(models.Program).filter(models.Program.owner_id == self.target_user.id).all()
+        self.assertEqual([(program.name, program.grad_requirement_credits) for program in programs], [("Engineering", 20.0)])
+
+    def test_rejected_overwrite_import_keeps_existing_program(self) -> None:
+        existing = crud.create_program(self.db, schemas.ProgramCreate(name="Engineering"), user_id=self.target_user.id)
+        backup = schemas.UserDataImport.model_validate(
+            {
+                "version": "2.2.2",
+                "programs": [
+                    {
+                        "name": "Engineering",
+                        "semesters": [
+                            {
+                                "name": "Fall 2025",
+                                "start_date": "2025-09-01",
+                                "end_date": "2025-12-20",
+                                "reading_week_start": "2025-10-27",
+                            }
+                        ],
+                    }
+                ],
+            }
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            main.import_user_data(
+                data=backup,
+                conflict_mode="overwrite",
+                include_settings=False,
+                db=self.db,
+                current_user=self.target_user,
+            )
+        self.db.rollback()
+
+        self.assertEqual(context.exception.status_code, 422)
+        programs = self.db.query(models.Program).filter(models.Program.owner_id == self.target_user.id).all()
+        self.assertEqual([program.id for program in programs], [existing.id])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,251 @@
+# input:  [unittest, in-memory SQLAlchemy session setup with foreign keys enforced, backend course-schedule router handlers, schedule support helpers, and backend models/schemas]
+# output: [unit tests covering event-type code renames cascading to sections/events, attendance re-tracking normalizing skipped events with or without autoflush, constraint-derived duplicate code/abbreviation messages, unchanged section/event PATCHes skipping the write, and legacy unpadded section/event times rendering and surviving non-time PATCHes while written times stay strict HH:mm]
+# pos:    [backend regression tests for course event-type updates against the composite section/event foreign keys]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+import unittest
+from pathlib import Path
+import sys
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = Path(__file__).resolve().parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import api_course_schedule
+import models
+import schedule_support
+import schemas
+from database import Base
+
+
+class CourseEventTypeUpdateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        # Renames depend on the composite foreign keys, so enforce them like the app engine does.
+        event.listen(self.engine, "connect", lambda connection, _record: connection.execute("PRAGMA foreign_keys=ON"))
+        testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = testing_session_local()
+
+        self.user = models.User(email="schedule@example.com", hashed_password="hashed", user_setting="{}")
+        self.db.add(self.user)
+        self.db.flush()
+        program = models.Program(name="Engineering", owner_id=self.user.id)
+        self.db.add(program)
+        self.db.flush()
+        course = models.Course(name="MIE100", credits=0.5, program_id=program.id)
+        self.db.add(course)
+        self.db.flush()
+        self.course_id = course.id
+
+        self.db.add(models.CourseEventType(course_id=course.id, code="LAB", abbreviation="LAB"))
+        self.db.add(models.CourseEventType(course_id=course.id, code="TUT", abbreviation="TUT"))
+        self.db.flush()
+        self.db.add(
+            models.CourseSection(
+                course_id=course.id,
+                section_id="0101",
+                event_type_code="LAB",
+                day_of_week=2,
+                start_time="10:00",
+                end_time="11:00",
+            )
+        )
+        self.db.flush()
+        self.db.add_all(
+            [
+                models.CourseEvent(
+                    course_id=course.id,
+                    event_type_code="LAB",
+                    section_id="0101" if index == 0 else None,
+                    day_of_week=index + 1,
+                    start_time="09:00",
+                    end_time="10:00",
+                    skip=index % 2 == 0,
+                )
+                for index in range(4)
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def _update(self, event_type_code: str, **fields):
+        return api_course_schedule.update_course_event_type(
+            self.course_id,
+            event_type_code,
+            schemas.CourseEventTypeUpdate(**fields),
+            db=self.db,
+            current_user=self.user,
+        )
+
+    def _count_updates(self, action) -> int:
+        statements: list[str] = []
+        listener = lambda _conn, _cursor, statement, *_args: statements.append(statement)
+        event.listen(self.engine, "before_cursor_execute", listener)
+        try:
+            action()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+        return sum(statement.startswith("UPDATE") for statement in statements)
+
+    def test_unchanged_section_and_event_patches_skip_the_write(self) -> None:
+        course_event = self.db.query(models.CourseEvent).filter_by(section_id="0101").one()
+        event_updated_at = course_event.updated_at
+
+        section_updates = self._count_updates(
+            lambda: api_course_schedule.update_course_section(
+                self.course_id,
+                "0101",
+                schemas.CourseSectionUpdate(eventTypeCode=" LAB ", startTime="10:00", weekPattern="EVERY"),
+                db=self.db,
+                current_user=self.user,
+            )
+        )
+        event_updates = self._count_updates(
+            lambda: api_course_schedule.update_course_event(
+                self.course_id,
+                course_event.id,
+                schemas.CourseEventUpdate(eventTypeCode="LAB ", startTime="09:00", skip=True),
+                db=self.db,
+                current_user=self.user,
+            )
+        )
+
+        self.assertEqual((section_updates, event_updates), (0, 0))
+        self.assertEqual(course_event.updated_at, event_updated_at)
+
+    def test_changed_event_patch_is_written(self) -> None:
+        course_event = self.db.query(models.CourseEvent).filter_by(section_id="0101").one()
+
+        updates = self._count_updates(
+            lambda: api_course_schedule.update_course_event(
+                self.course_id,
+                course_event.id,
+                schemas.CourseEventUpdate(startTime="09:00", skip=False),
+                db=self.db,
+                current_user=self.user,
+            )
+        )
+
+        self.assertEqual(updates, 1)
+        self.db.expire_all()
+        self.assertFalse(self.db.get(models.CourseEvent, course_event.id).skip)
+
+    def test_legacy_unpadded_times_still_render_but_are_rejected_on_write(self) -> None:
+        legacy_event = models.CourseEvent(
+            course_id=self.course_id,
+            event_type_code="TUT",
+            day_of_week=5,
+            start_time="9:00",
+            end_time="9:50",
+            week_pattern="EVERY",
+            start_week=1,
+            end_week=12,
+            enable=True,
+            skip=False,
+        )
+        self.db.add(legacy_event)
+        self.db.commit()
+
+        prepared, warnings = schedule_support.prepare_week_events([(legacy_event, "MIE100")], 12)
+        self.assertEqual(warnings, [])
+        self.assertEqual([event for event, _course_name, _week_mask in prepared], [legacy_event])
+
+        with self.assertRaises(HTTPException) as context:
+            api_course_schedule.update_course_event(
+                self.course_id,
+                legacy_event.id,
+                schemas.CourseEventUpdate(startTime="8:00"),
+                db=self.db,
+                current_user=self.user,
+            )
+        self.assertEqual(context.exception.detail["code"], "INVALID_TIME_FORMAT")
+
+    def test_non_time_patches_keep_legacy_unpadded_times(self) -> None:
+        section = self.db.query(models.CourseSection).filter_by(section_id="0101").one()
+        course_event = self.db.query(models.CourseEvent).filter_by(section_id="0101").one()
+        section.start_time, section.end_time = "9:00", "9:50"
+        course_event.start_time, course_event.end_time = "9:00", "9:50"
+        self.db.commit()
+
+        updated_section = api_course_schedule.update_course_section(
+            self.course_id,
+            "0101",
+            schemas.CourseSectionUpdate(title="Renamed"),
+            db=self.db,
+            current_user=self.user,
+        )
+        updated_event = api_course_schedule.update_course_event(
+            self.course_id,
+            course_event.id,
+            schemas.CourseEventUpdate(note="x"),
+            db=self.db,
+            current_user=self.user,
+        )
+
+        self.assertEqual((updated_section.title, updated_section.start_time), ("Renamed", "9:00"))
+        self.assertEqual((updated_event.note, updated_event.start_time), ("x", "9:00"))
+
+    def test_code_rename_cascades_to_sections_and_events(self) -> None:
+        result = self._update("LAB", code="PRA")
+
+        self.assertEqual(result["event_type"].code, "PRA")
+        self.assertEqual(result["normalized_events"], 0)
+        section_codes = {section.event_type_code for section in self.db.query(models.CourseSection).all()}
+        event_codes = {course_event.event_type_code for course_event in self.db.query(models.CourseEvent).all()}
+        self.assertEqual(section_codes, {"PRA"})
+        self.assertEqual(event_codes, {"PRA"})
+
+    def test_rename_with_attendance_tracking_clears_skipped_events(self) -> None:
+        result = self._update("LAB", code="PRA", track_attendance=True)
+
+        self.assertEqual(result["normalized_events"], 2)
+        events = self.db.query(models.CourseEvent).all()
+        self.assertEqual({(course_event.event_type_code, course_event.skip) for course_event in events}, {("PRA", False)})
+
+    def test_rename_with_attendance_tracking_under_autoflush(self) -> None:
+        autoflush_db = sessionmaker(autocommit=False, autoflush=True, bind=self.engine)()
+        try:
+            result = api_course_schedule.update_course_event_type(
+                self.course_id,
+                "LAB",
+                schemas.CourseEventTypeUpdate(code="PRA", track_attendance=True),
+                db=autoflush_db,
+                current_user=autoflush_db.get(models.User, self.user.id),
+            )
+        finally:
+            autoflush_db.close()
+
+        self.assertEqual(result["normalized_events"], 2)
+        events = self.db.query(models.CourseEvent).all()
+        self.assertEqual({(course_event.event_type_code, course_event.skip) for course_event in events}, {("PRA", False)})
+
+    def test_rename_to_existing_code_is_rejected(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self._update("LAB", code="TUT")
+
+        self.assertEqual(context.exception.status_code, 422)
+        self.assertEqual(context.exception.detail["code"], "EVENT_TYPE_DUPLICATE")
+        self.assertEqual(context.exception.detail["message"], "code already exists for this course.")
+        self.assertEqual(self.db.query(models.CourseEventType).filter_by(code="LAB").count(), 1)
+
+    def test_duplicate_abbreviation_is_reported_as_abbreviation(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self._update("LAB", abbreviation="TUT")
+
+        self.assertEqual(context.exception.detail["code"], "EVENT_TYPE_DUPLICATE")
+        self.assertEqual(context.exception.detail["message"], "Duplicate abbreviation for this course.")
+
+
+if __name__ == "__main__":
+    unittest.main()
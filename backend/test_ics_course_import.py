@@ -0,0 +1,128 @@
+# input:  [unittest, in-memory SQLAlchemy session setup, backend main ICS course helper, crud bulk course creation, and backend models/schemas]
+# output: [unit tests covering bulk ICS course creation with builtin event types/gradebooks/semester stats, imported event types/sections/events, and invalid-schedule handling]
+# pos:    [backend regression tests for the ICS semester/course upload write path]
+#
+# ⚠️ When this file is updated:
+#    1. Update these header comments
+#    2. Update the INDEX.md of the folder this file belongs to
+
+import unittest
+from datetime import date
+from pathlib import Path
+import sys
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = Path(__file__).resolve().parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import main
+import models
+from database import Base
+
+
+def _meeting(event_type_code: str, section_id: str, day_of_week: int, **overrides) -> dict:
+    meeting = {
+        "eventTypeCode": event_type_code,
+        "sectionId": section_id,
+        "dayOfWeek": day_of_week,
+        "startTime": "09:00",
+        "endTime": "10:00",
+        "weekPattern": "EVERY",
+        "startWeek": 1,
+        "endWeek": 12,
+    }
+    meeting.update(overrides)
+    return meeting
+
+
+class IcsCourseImportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = testing_session_local()
+
+        user = models.User(email="ics@example.com", hashed_password="hashed", user_setting="{}")
+        self.db.add(user)
+        self.db.flush()
+        self.program = models.Program(name="Engineering", owner_id=user.id)
+        self.db.add(self.program)
+        self.db.flush()
+        self.semester = models.Semester(
+            name="Winter",
+            program_id=self.program.id,
+            start_date=date(2026, 1, 5),
+            end_date=date(2026, 4, 24),
+        )
+        self.db.add(self.semester)
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def _import(self, parsed_courses: list[dict], skip_invalid_schedules: bool) -> list[models.Course]:
+        courses = main._create_courses_from_parsed_ics(
+            self.db,
+            parsed_courses,
+            program_id=self.program.id,
+            semester_id=self.semester.id,
+            default_course_credit=0.5,
+            skip_invalid_schedules=skip_invalid_schedules,
+        )
+        self.db.commit()
+        return courses
+
+    def test_courses_get_builtins_and_imported_schedule(self) -> None:
+        courses = self._import(
+            [
+                {
+                    "name": "MIE100H1",
+                    "meetings": [
+                        _meeting("LECTURE", "0101", 1),
+                        _meeting("LECTURE", "0101", 3),
+                        _meeting("LABORATORY", "0201", 5),
+                    ],
+                },
+                {"name": "  ", "meetings": [_meeting("LECTURE", "0101", 2)]},
+                {"name": "APS111H1", "meetings": []},
+            ],
+            skip_invalid_schedules=False,
+        )
+
+        self.assertEqual([course.name for course in courses], ["MIE100H1", "APS111H1"])
+        self.assertEqual(self.db.query(models.CourseGradebook).count(), 2)
+        self.assertEqual(self.semester.total_credits, 1.0)
+        event_types = {
+            (event_type.course_id, event_type.code): event_type.abbreviation
+            for event_type in self.db.query(models.CourseEventType).all()
+        }
+        self.assertEqual(len(event_types), 7)
+        self.assertEqual(event_types[(courses[0].id, "LABORATORY")], "LABO")
+        sections = self.db.query(models.CourseSection).filter_by(course_id=courses[0].id).all()
+        self.assertEqual(sorted(section.section_id for section in sections), ["0101", "0201"])
+        events = self.db.query(models.CourseEvent).filter_by(course_id=courses[0].id).all()
+        self.assertEqual(len(events), 3)
+        self.assertTrue(all(course_event.section_id for course_event in events))
+
+    def test_invalid_schedule_is_skipped_or_rejected(self) -> None:
+        parsed_courses = [
+            {"name": "MIE100H1", "meetings": [_meeting("LECTURE", "0101", 1)]},
+            {"name": "APS111H1", "meetings": [_meeting("LECTURE", "0101", 9)]},
+        ]
+
+        courses = self._import(parsed_courses, skip_invalid_schedules=True)
+        self.assertEqual(len(courses), 2)
+        self.assertEqual(self.db.query(models.CourseEvent).filter_by(course_id=courses[0].id).count(), 1)
+        self.assertEqual(self.db.query(models.CourseEvent).filter_by(course_id=courses[1].id).count(), 0)
+
+        with self.assertRaises(HTTPException):
+            self._import(parsed_courses, skip_invalid_schedules=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
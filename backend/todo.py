@@ -471,23 +471,28 @@ def ensure_migrated(db: Session, semester: models.Semester) -> None:
         _touch_row(row)
         db.add(row)
 
-    if semester_tab is not None:
-        semester_tab.settings = _sanitize_legacy_todo_settings(semester_tab.settings)
-        db.add(semester_tab)
-
-    for course_snapshot in course_snapshots:
-        if course_snapshot.todo_tab is None:
+    legacy_tabs = [semester_tab] + [course_snapshot.todo_tab for course_snapshot in course_snapshots]
+    did_change = bool(sections_data or tasks_data)
+    for legacy_tab in legacy_tabs:
+        if legacy_tab is None:
             continue
-        course_snapshot.todo_tab.settings = _sanitize_legacy_todo_settings(course_snapshot.todo_tab.settings)
-        db.add(course_snapshot.todo_tab)
-
+        sanitized_settings = _sanitize_legacy_todo_settings(legacy_tab.settings)
+        if sanitized_settings != legacy_tab.settings:
+            legacy_tab.settings = sanitized_settings
+            db.add(legacy_tab)
+            did_change = True
+
+    # Semesters with no legacy todo data have nothing to persist; skip the commit and reload.
+    if not did_change:
+        return
     db.commit()
     db.refresh(semester)
 
 
 def get_semester_state(db: Session, semester: models.Semester) -> schemas.TodoSemesterState:
+    # ensure_migrated refreshes the semester itself when it writes, so already-loaded
+    # collections (e.g. from a backup export's eager load) are served as-is.
     ensure_migrated(db, semester)
-    db.refresh(semester)
     return _serialize_state(semester)
 
 